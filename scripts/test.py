@@ -31,8 +31,9 @@ def needs_docker_build(targets: list[str]) -> bool:
     - test/ (all tests, which includes e2e)
     - test/e2e (end-to-end tests)
     - test/fr (functional regression tests)
+    - test/load (API load tests)
     """
-    build_prefixes = ("test/e2e", "test/fr")
+    build_prefixes = ("test/e2e", "test/fr", "test/load")
     return any(
         target == "test/" or target.startswith(build_prefixes) for target in targets
     )
@@ -41,14 +42,48 @@ def needs_docker_build(targets: list[str]) -> bool:
 def needs_docker_image_arg(targets: list[str]) -> bool:
     """Check if any target needs the --image_name pytest arg.
 
-    Required for e2e and fr tests that reference the built image.
+    Required for e2e, fr and load tests that reference the built image.
     """
-    image_prefixes = ("test/e2e", "test/fr")
+    image_prefixes = ("test/e2e", "test/fr", "test/load")
     return any(
         target == "test/" or target.startswith(image_prefixes) for target in targets
     )
 
 
+def is_bench_run(targets: list[str]) -> bool:
+    """Check if any target is the benchmark suite."""
+    return any(target.startswith("test/bench") for target in targets)
+
+
+def is_load_run(targets: list[str]) -> bool:
+    """Check if any target is the load test suite."""
+    return any(target.startswith("test/load") for target in targets)
+
+
+def bench_args(
+    *,
+    output: Path,
+    baseline: Path | None,
+    threshold: float,
+    max_scale: int,
+) -> list[str]:
+    """Build pytest args for a benchmark run.
+
+    Benchmarks run serially without the per-test timeout, since parallel
+    workers and timeouts would distort or abort the measurements.
+    """
+    args = [
+        "--bench",
+        "--timeout=0",
+        f"--bench-output={output}",
+        f"--bench-threshold={threshold}",
+        f"--bench-max-scale={max_scale}",
+    ]
+    if baseline is not None:
+        args.append(f"--bench-baseline={baseline}")
+    return args
+
+
 def build_docker_image(image_name: str) -> None:
     """Build Docker image by invoking the build script."""
     build_script = SCRIPTS_DIR / "build.py"
@@ -76,7 +111,9 @@ def normalize_target(arg: str) -> str:
 def main(
     targets: Annotated[
         list[str] | None,
-        typer.Argument(help="Test targets (e.g., unit, it/test_foo.py::test_bar)"),
+        typer.Argument(
+            help="Test targets (e.g., unit, bench, load, it/test_foo.py::test_bar)"
+        ),
     ] = None,
     strict: bool = typer.Option(
         False,
@@ -96,6 +133,26 @@ def main(
         "-n",
         help="Number of parallel workers (1 to disable)",
     ),
+    bench_output: Path = typer.Option(
+        Path("bench_results.json"),
+        "--bench-output",
+        help="Benchmark results JSON file (bench target only)",
+    ),
+    bench_baseline: Path | None = typer.Option(
+        None,
+        "--bench-baseline",
+        help="Fail if benchmarks regress versus this saved results file",
+    ),
+    bench_threshold: float = typer.Option(
+        0.2,
+        "--bench-threshold",
+        help="Allowed slowdown versus the baseline (0.2 = 20%)",
+    ),
+    bench_max_scale: int = typer.Option(
+        5,
+        "--bench-max-scale",
+        help="Largest benchmark problem size exponent (3-6 for 10^3-10^6)",
+    ),
 ) -> None:
     """Run pytest with various options."""
     # Normalize targets
@@ -119,8 +176,25 @@ def main(
     if strict:
         pytest_args.append("--runxfail")
 
+    # Benchmarks run serially and write a JSON report
+    bench = is_bench_run(normalized_targets)
+    if bench:
+        pytest_args.extend(
+            bench_args(
+                output=bench_output,
+                baseline=bench_baseline,
+                threshold=bench_threshold,
+                max_scale=bench_max_scale,
+            )
+        )
+
+    # Load tests drive the app container serially and write reports
+    load = is_load_run(normalized_targets)
+    if load:
+        pytest_args.append("--load")
+
     # Parallelism - disable in CI to avoid Spark gateway conflicts
-    if not is_ci and parallel > 0:
+    if not is_ci and not bench and not load and parallel > 0:
         pytest_args.extend(["-n", str(parallel)])
 
     # Clean pycache
@@ -0,0 +1 @@
+"""TaskFlow HTTP API."""
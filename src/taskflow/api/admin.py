@@ -0,0 +1,23 @@
+"""Administrative endpoints."""
+
+from fastapi import APIRouter, Request
+from fastapi.responses import PlainTextResponse
+
+from taskflow.profiling import Profiler
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get("/profile", response_class=PlainTextResponse)
+async def profile(request: Request, reset: bool = False) -> PlainTextResponse:
+    """Return aggregated profiling samples as collapsed stacks.
+
+    Args:
+        request: Incoming request; the profiler lives on ``app.state``.
+        reset: Discard the samples after returning them.
+    """
+    profiler: Profiler = request.app.state.profiler
+    body = profiler.collapsed()
+    if reset:
+        profiler.reset()
+    return PlainTextResponse(body)
@@ -0,0 +1,18 @@
+"""Exception handlers mapping domain errors to HTTP responses."""
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+
+from taskflow.services.admission import QueueFullError
+
+
+async def queue_full_handler(_request: Request, exc: QueueFullError) -> JSONResponse:
+    """Reject a submission to a saturated queue with 429 and ``Retry-After``.
+
+    Register with ``app.add_exception_handler(QueueFullError, ...)``.
+    """
+    return JSONResponse(
+        {"detail": str(exc)},
+        status_code=429,
+        headers={"Retry-After": str(exc.retry_after_seconds)},
+    )
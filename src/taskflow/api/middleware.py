@@ -0,0 +1,168 @@
+"""ASGI middleware for the TaskFlow API."""
+
+import time
+from collections import defaultdict
+from collections.abc import Collection
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from taskflow.metrics import ADMISSION_REJECTIONS, REQUEST_LATENCY
+from taskflow.profiling import Profiler
+
+UNMATCHED_ROUTE = "unmatched"
+INFLIGHT_REJECTION = "inflight"
+DEFAULT_EXEMPT_PATHS = ("/health", "/metrics")
+DEFAULT_LONG_LIVED_ROUTES = (("GET", "/wait"), ("GET", "/events"))
+
+
+class MetricsMiddleware:
+    """Records request latency per method, route template and status code.
+
+    Routes are labelled by their template (``/api/v1/jobs/{job_id}``), read
+    from ``scope["route"]`` after routing, so label cardinality stays
+    bounded by the number of routes rather than the number of job ids.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI application.
+
+        Args:
+            app: The application to instrument.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI call, timing HTTP requests."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            REQUEST_LATENCY.labels(
+                scope["method"],
+                getattr(route, "path", UNMATCHED_ROUTE),
+                str(status_code),
+            ).observe(time.perf_counter() - start)
+
+
+class ProfilingMiddleware:
+    """Profiles a sampled fraction of HTTP requests.
+
+    Samples are labelled ``METHOD route-template`` once routing has run
+    and only cover frames running on behalf of the request's own task:
+    other requests served while it is suspended are excluded, and so is
+    the body of a sync handler, which FastAPI runs in its threadpool. Wrap
+    such code in ``Profiler.profile`` directly to profile it. When
+    profiling is disabled requests pass straight through.
+    """
+
+    def __init__(self, app: ASGIApp, *, profiler: Profiler) -> None:
+        """Wrap an ASGI application.
+
+        Args:
+            app: The application to profile.
+            profiler: Profiler deciding which requests are sampled.
+        """
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI call, profiling sampled HTTP requests."""
+        if scope["type"] != "http" or not self.profiler.enabled:
+            await self.app(scope, receive, send)
+            return
+        with self.profiler.profile(label=scope["method"]) as session:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                if session is not None:
+                    route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+                    session.label = f"{scope['method']} {route}"
+
+
+class InFlightLimitMiddleware:
+    """Rejects HTTP requests with 429 once too many are in progress.
+
+    Past the limit, extra requests would only wait for pooled database
+    connections and slow down every admitted request; rejecting them
+    immediately keeps admitted latency stable and tells clients when to
+    retry. Health and metrics endpoints are exempt so an overloaded
+    process stays observable.
+
+    Long-lived requests are exempt too: long-poll and SSE waiters hold no
+    database connection while they wait and may number in the tens of
+    thousands, so counting them would lock out all other traffic. They are
+    recognised before routing by method and path suffix (``GET .../wait``,
+    ``GET .../events``); request headers are not trusted, since any client
+    could set them to bypass the limit.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        max_inflight: int,
+        retry_after_seconds: int,
+        exempt_paths: Collection[str] = DEFAULT_EXEMPT_PATHS,
+        long_lived_routes: Collection[tuple[str, str]] = DEFAULT_LONG_LIVED_ROUTES,
+    ) -> None:
+        """Wrap an ASGI application.
+
+        Args:
+            app: The application to protect.
+            max_inflight: Maximum concurrent requests.
+            retry_after_seconds: ``Retry-After`` sent with rejections.
+            exempt_paths: Paths never rejected or counted.
+            long_lived_routes: ``(method, path suffix)`` pairs of long-poll
+                and streaming routes, never rejected or counted.
+        """
+        self.app = app
+        self.max_inflight = max_inflight
+        self.inflight = 0
+        self._exempt_paths = frozenset(exempt_paths)
+        suffixes: defaultdict[str, list[str]] = defaultdict(list)
+        for method, suffix in long_lived_routes:
+            suffixes[method].append(suffix)
+        self._long_lived_suffixes = {
+            method: tuple(endings) for method, endings in suffixes.items()
+        }
+        self._rejection = JSONResponse(
+            {"detail": "server is at capacity, retry later"},
+            status_code=429,
+            headers={"Retry-After": str(retry_after_seconds)},
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI call, shedding HTTP requests over the limit."""
+        if scope["type"] != "http" or self._is_exempt(scope):
+            await self.app(scope, receive, send)
+            return
+        if self.inflight >= self.max_inflight:
+            ADMISSION_REJECTIONS.labels(INFLIGHT_REJECTION).inc()
+            await self._rejection(scope, receive, send)
+            return
+        self.inflight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.inflight -= 1
+
+    def _is_exempt(self, scope: Scope) -> bool:
+        path: str = scope["path"]
+        if path in self._exempt_paths:
+            return True
+        suffixes = self._long_lived_suffixes.get(scope["method"])
+        return suffixes is not None and path.endswith(suffixes)
@@ -0,0 +1,73 @@
+"""Application settings loaded from ``TASKFLOW_`` environment variables."""
+
+import typing as t
+
+from pydantic import Field, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from taskflow.models import SchedulingMode
+
+DEFAULT_SHARD = "default"
+
+
+class Settings(BaseSettings):
+    """Runtime configuration for the API and scheduler processes.
+
+    Attributes:
+        database_url: DSN of the jobs database when not sharded.
+        database_pool_min_size: Minimum connections per database pool.
+        database_pool_max_size: Maximum connections per database pool.
+        shard_urls: Databases jobs are sharded over by queue, as a JSON
+            object of shard name to DSN; when empty, ``database_url`` is
+            the only shard, named ``DEFAULT_SHARD``. Queues are placed by
+            shard name, so DSNs may change (credentials, hosts, failover)
+            without moving data, but the names must be identical in every
+            process.
+        queue_backlog_limit: Maximum pending and ready jobs per queue before
+            submissions are rejected with 429.
+        queue_backlog_limits: Per-queue overrides of ``queue_backlog_limit``.
+        max_inflight_requests: Maximum concurrent short API requests per
+            process; excess requests are rejected with 429 instead of
+            queueing. Long-poll and SSE requests are not counted.
+        retry_after_seconds: Minimum ``Retry-After`` advertised on 429s.
+        max_retry_after_seconds: Maximum ``Retry-After`` advertised on 429s.
+        scheduling_mode: Ordering of READY jobs within a priority level.
+        profiling_enabled: Whether sampled profiling is active.
+        profiling_sample_rate: Fraction of requests and scheduler iterations
+            profiled when enabled (0-1).
+        profiling_interval_seconds: Stack sampling interval.
+
+    Raises:
+        ValueError: If max_retry_after_seconds < retry_after_seconds.
+    """
+
+    model_config = SettingsConfigDict(env_prefix="TASKFLOW_")
+
+    database_url: str = "postgresql://localhost:5432/taskflow"
+    database_pool_min_size: int = Field(default=2, ge=0)
+    database_pool_max_size: int = Field(default=10, ge=1)
+    shard_urls: dict[str, str] = Field(default_factory=dict)
+    queue_backlog_limit: int = Field(default=10_000, ge=1)
+    queue_backlog_limits: dict[str, int] = Field(default_factory=dict)
+    max_inflight_requests: int = Field(default=256, ge=1)
+    retry_after_seconds: int = Field(default=1, ge=1)
+    max_retry_after_seconds: int = Field(default=60, ge=1)
+    scheduling_mode: SchedulingMode = SchedulingMode.PRIORITY
+    profiling_enabled: bool = False
+    profiling_sample_rate: float = Field(default=0.01, ge=0, le=1)
+    profiling_interval_seconds: float = Field(default=0.005, gt=0, le=1)
+
+    @model_validator(mode="after")
+    def _validate_retry_after_range(self) -> t.Self:
+        if self.max_retry_after_seconds < self.retry_after_seconds:
+            msg = (
+                f"max_retry_after_seconds ({self.max_retry_after_seconds}) must "
+                f"be >= retry_after_seconds ({self.retry_after_seconds})"
+            )
+            raise ValueError(msg)
+        return self
+
+    @property
+    def shard_dsns(self) -> dict[str, str]:
+        """Map of shard name to DSN for every jobs database."""
+        return self.shard_urls or {DEFAULT_SHARD: self.database_url}
@@ -0,0 +1 @@
+"""TaskFlow persistence layer."""
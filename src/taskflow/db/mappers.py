@@ -0,0 +1,77 @@
+"""Trusted mapping of database rows to domain models.
+
+Rows in the ``jobs`` table were fully validated when they were inserted,
+so re-running field constraints and the payload size check on every read
+only costs time: a 100k-job scheduler load would JSON encode every payload
+again. ``row_to_job`` builds jobs without validation and is meant only for
+data read back from our own database; anything arriving over the API goes
+through ``model_validate``. The nested retry policy is the exception: it
+is small enough that pydantic-core validates it faster than it can be
+built by hand.
+
+Columns follow the initial schema: ``payload`` and ``retry_policy`` are
+JSONB (decoded here unless a type codec already did), ``dependencies`` is
+``UUID[]`` and ``status`` holds the ``JobStatus`` value.
+"""
+
+import json
+import typing as t
+from collections.abc import Iterable, Mapping
+
+from taskflow.models import Job, JobStatus, RetryPolicy
+from taskflow.models.trusted import construct_trusted
+
+
+def row_to_retry_policy(value: Mapping[str, t.Any] | str) -> RetryPolicy:
+    """Build a retry policy from its stored JSONB value.
+
+    Args:
+        value: Decoded JSON object, or its text when no codec is set; text
+            is parsed and validated in one pass by ``model_validate_json``.
+
+    Returns:
+        The retry policy.
+    """
+    if isinstance(value, str):
+        return RetryPolicy.model_validate_json(value)
+    return RetryPolicy.model_validate(value)
+
+
+def row_to_job(row: Mapping[str, t.Any]) -> Job:
+    """Build a job from a ``jobs`` row without validation.
+
+    Args:
+        row: An ``asyncpg.Record`` or any mapping with the table's columns.
+
+    Returns:
+        The job.
+    """
+    payload = row["payload"]
+    return construct_trusted(
+        Job,
+        {
+            "id": row["id"],
+            "name": row["name"],
+            "queue": row["queue"],
+            "payload": json.loads(payload) if isinstance(payload, str) else payload,
+            "priority": row["priority"],
+            "status": JobStatus(row["status"]),
+            "dependencies": list(row["dependencies"]),
+            "retry_policy": row_to_retry_policy(row["retry_policy"]),
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+            "attempt_count": row["attempt_count"],
+        },
+    )
+
+
+def rows_to_jobs(rows: Iterable[Mapping[str, t.Any]]) -> list[Job]:
+    """Build jobs from ``jobs`` rows without validation.
+
+    Args:
+        rows: Rows as returned by ``fetch``.
+
+    Returns:
+        The jobs, in row order.
+    """
+    return [row_to_job(row) for row in rows]
@@ -0,0 +1,205 @@
+"""Sharding of jobs across Postgres databases by queue.
+
+Queues are placed on a consistent-hash ring so that adding or removing a
+shard moves only about ``1/n`` of the queues. Every job of a queue lives
+on the same shard. Per-queue scheduling, search filtered by queue and
+dependency cascades within a queue therefore touch a single database.
+Dependencies must stay on one shard: a job may only depend on jobs whose
+queues map to its own shard.
+
+The ring is keyed on shard names, never on DSNs, so rotating credentials
+or pointing a shard at a failover host leaves every queue where it is.
+"""
+
+import asyncio
+import hashlib
+from bisect import bisect_right
+from collections.abc import Collection, Mapping, Sequence
+from uuid import UUID
+
+import asyncpg
+
+from taskflow.config import Settings
+
+DEFAULT_VIRTUAL_NODES = 128
+
+
+class CrossShardDependencyError(ValueError):
+    """Raised when a job depends on jobs stored on another shard.
+
+    Attributes:
+        dependency_ids: The offending dependencies.
+    """
+
+    def __init__(self, *, queue: str, dependency_ids: list[UUID]) -> None:
+        """Create the error.
+
+        Args:
+            queue: Queue of the job being created.
+            dependency_ids: Dependencies whose queues live on other shards.
+        """
+        self.dependency_ids = dependency_ids
+        ids = ", ".join(str(dependency_id) for dependency_id in dependency_ids)
+        super().__init__(
+            f"jobs in queue {queue!r} cannot depend on jobs stored on other "
+            f"shards: {ids}"
+        )
+
+
+class ShardRing:
+    """Consistent-hash ring mapping queue names to shard names.
+
+    Each shard is placed at ``virtual_nodes`` points on a 64-bit ring and a
+    queue belongs to the first point at or after its own hash. Lookups are
+    cached per queue, since the number of queues is small and stable.
+    """
+
+    def __init__(
+        self,
+        *,
+        shards: Sequence[str],
+        virtual_nodes: int = DEFAULT_VIRTUAL_NODES,
+    ) -> None:
+        """Build the ring.
+
+        Args:
+            shards: Shard names; placement depends only on the set of
+                names.
+            virtual_nodes: Ring points per shard; more points spread queues
+                more evenly.
+
+        Raises:
+            ValueError: If no shards are given or a name is repeated.
+        """
+        if not shards:
+            msg = "at least one shard is required"
+            raise ValueError(msg)
+        if len(set(shards)) != len(shards):
+            msg = "shard names must be unique"
+            raise ValueError(msg)
+        points = sorted(
+            (_hash(f"{shard}#{replica}"), shard)
+            for shard in shards
+            for replica in range(virtual_nodes)
+        )
+        self._hashes = [point for point, _ in points]
+        self._owners = [shard for _, shard in points]
+        self._shards = tuple(sorted(shards))
+        self._cache: dict[str, str] = {}
+
+    @property
+    def shards(self) -> tuple[str, ...]:
+        """All shard names, sorted."""
+        return self._shards
+
+    def shard_for(self, *, queue: str) -> str:
+        """Return the name of the shard storing ``queue``.
+
+        Args:
+            queue: Queue name.
+
+        Returns:
+            The shard name.
+        """
+        shard = self._cache.get(queue)
+        if shard is None:
+            index = bisect_right(self._hashes, _hash(queue)) % len(self._hashes)
+            shard = self._cache[queue] = self._owners[index]
+        return shard
+
+    def check_dependencies_colocated(
+        self,
+        *,
+        queue: str,
+        dependency_queues: Mapping[UUID, str],
+    ) -> None:
+        """Reject dependencies stored on a different shard than ``queue``.
+
+        Args:
+            queue: Queue of the job being created.
+            dependency_queues: Map of dependency id → its queue.
+
+        Raises:
+            CrossShardDependencyError: If any dependency is on another shard.
+        """
+        home = self.shard_for(queue=queue)
+        foreign = [
+            dependency_id
+            for dependency_id, dependency_queue in dependency_queues.items()
+            if self.shard_for(queue=dependency_queue) != home
+        ]
+        if foreign:
+            raise CrossShardDependencyError(queue=queue, dependency_ids=foreign)
+
+
+class ShardedPools:
+    """One asyncpg pool per shard, routed by queue."""
+
+    def __init__(self, *, settings: Settings) -> None:
+        """Configure pools for every shard in settings.
+
+        Args:
+            settings: Application settings with the shard names and DSNs.
+        """
+        self._dsns = settings.shard_dsns
+        self.ring = ShardRing(shards=list(self._dsns))
+        self._min_size = settings.database_pool_min_size
+        self._max_size = settings.database_pool_max_size
+        self._pools: dict[str, asyncpg.Pool] = {}
+
+    async def connect(self) -> None:
+        """Open a pool to every shard."""
+        pools = await asyncio.gather(
+            *(
+                asyncpg.create_pool(
+                    dsn=self._dsns[shard],
+                    min_size=self._min_size,
+                    max_size=self._max_size,
+                )
+                for shard in self.ring.shards
+            )
+        )
+        self._pools = dict(zip(self.ring.shards, pools, strict=True))
+
+    async def disconnect(self) -> None:
+        """Close every pool."""
+        await asyncio.gather(*(pool.close() for pool in self._pools.values()))
+        self._pools = {}
+
+    def pool_for(self, *, queue: str) -> asyncpg.Pool:
+        """Return the pool of the shard storing ``queue``.
+
+        Raises:
+            RuntimeError: If ``connect`` has not been called.
+        """
+        return self._pool(self.ring.shard_for(queue=queue))
+
+    def pools_for(self, *, queues: Collection[str] | None = None) -> list[asyncpg.Pool]:
+        """Return the pools a query over ``queues`` must visit.
+
+        Args:
+            queues: Queues the query is restricted to, or None for all.
+
+        Returns:
+            One pool per shard holding any of the queues.
+
+        Raises:
+            RuntimeError: If ``connect`` has not been called.
+        """
+        if queues is None:
+            shards = self.ring.shards
+        else:
+            shards = tuple(sorted({self.ring.shard_for(queue=q) for q in queues}))
+        return [self._pool(shard) for shard in shards]
+
+    def _pool(self, shard: str) -> asyncpg.Pool:
+        pool = self._pools.get(shard)
+        if pool is None:
+            msg = "ShardedPools.connect() must be awaited before use"
+            raise RuntimeError(msg)
+        return pool
+
+
+def _hash(key: str) -> int:
+    digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+    return int.from_bytes(digest)
@@ -0,0 +1,325 @@
+"""Prometheus-style metrics with low-overhead in-process collectors.
+
+Collectors are updated with plain integer and float increments and no
+locks: the API and scheduler update them from a single event loop thread,
+so there is no contention to guard against. Label children are created
+once and cached, so the hot path is a dict lookup plus an increment.
+"""
+
+import abc
+import typing as t
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from contextlib import AbstractContextManager
+from time import perf_counter
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+
+class _HistogramChild:
+    __slots__ = ("buckets", "count", "counts", "sum")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def time(self) -> AbstractContextManager[None]:
+        return _Timer(self)
+
+
+class _Timer:
+    """Times a block into a histogram child.
+
+    A slotted class rather than ``@contextmanager``: it avoids creating a
+    generator per use, which is most of the cost on short hot paths.
+    """
+
+    __slots__ = ("_child", "_start")
+
+    def __init__(self, child: _HistogramChild) -> None:
+        self._child = child
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = perf_counter()
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self._child.observe(perf_counter() - self._start)
+
+
+class _Metric[ChildT](abc.ABC):
+    kind: t.ClassVar[str]
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        *,
+        labels: Sequence[str] = (),
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._children: dict[tuple[str, ...], ChildT] = {}
+        self._default: ChildT | None = None if self.label_names else self.labels()
+
+    def labels(self, *values: str) -> ChildT:
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.label_names):
+                msg = f"{self.name} expects labels {self.label_names}, got {values}"
+                raise ValueError(msg)
+            child = self._children[values] = self._new_child()
+        return child
+
+    def get(self, *values: str) -> ChildT | None:
+        """Return the child for a label combination without creating it.
+
+        Lets callers read values keyed by untrusted input without adding a
+        series for every value seen.
+        """
+        return self._children.get(values)
+
+    def clear(self) -> None:
+        """Remove every label combination, e.g. before republishing a snapshot.
+
+        Raises:
+            ValueError: If the metric has no labels.
+        """
+        if not self.label_names:
+            msg = f"{self.name} has no labels to clear"
+            raise ValueError(msg)
+        self._children.clear()
+
+    def _unlabelled(self) -> ChildT:
+        if self._default is None:
+            msg = f"{self.name} has labels {self.label_names}, use .labels() first"
+            raise ValueError(msg)
+        return self._default
+
+    @abc.abstractmethod
+    def _new_child(self) -> ChildT: ...
+
+    @abc.abstractmethod
+    def _samples(self) -> Iterator[str]: ...
+
+    @property
+    def _family_name(self) -> str:
+        return self.name
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self._family_name} {self.documentation}",
+            f"# TYPE {self._family_name} {self.kind}",
+            *self._samples(),
+        ]
+        return "\n".join(lines)
+
+    def _label_text(self, values: tuple[str, ...], **extra: str) -> str:
+        pairs = [*zip(self.label_names, values, strict=True), *extra.items()]
+        if not pairs:
+            return ""
+        inner = ",".join(f'{name}="{_escape(value)}"' for name, value in pairs)
+        return f"{{{inner}}}"
+
+
+class Counter(_Metric[_CounterChild]):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the unlabelled counter."""
+        self._unlabelled().inc(amount)
+
+    @property
+    def _family_name(self) -> str:
+        # Text format 0.0.4 names counter HELP/TYPE after the sample.
+        return f"{self.name}_total"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def _samples(self) -> Iterator[str]:
+        for values, child in self._children.items():
+            yield f"{self._family_name}{self._label_text(values)} {child.value}"
+
+
+class Gauge(_Metric[_GaugeChild]):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def set(self, value: float) -> None:
+        """Set the unlabelled gauge."""
+        self._unlabelled().set(value)
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def _samples(self) -> Iterator[str]:
+        for values, child in self._children.items():
+            yield f"{self.name}{self._label_text(values)} {child.value}"
+
+
+class Histogram(_Metric[_HistogramChild]):
+    """Distribution of observed values in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        *,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Create a histogram.
+
+        Args:
+            name: Metric name.
+            documentation: Help text.
+            labels: Label names.
+            buckets: Sorted upper bounds; ``+Inf`` is implicit.
+        """
+        self._buckets = tuple(buckets)
+        super().__init__(name, documentation, labels=labels)
+
+    def observe(self, value: float) -> None:
+        """Record a value in the unlabelled histogram."""
+        self._unlabelled().observe(value)
+
+    def time(self) -> AbstractContextManager[None]:
+        """Time a block with the unlabelled histogram."""
+        return self._unlabelled().time()
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self._buckets)
+
+    def _samples(self) -> Iterator[str]:
+        for values, child in self._children.items():
+            cumulative = 0
+            bounds = [*map(repr, self._buckets), "+Inf"]
+            for bound, count in zip(bounds, child.counts, strict=True):
+                cumulative += count
+                labels = self._label_text(values, le=bound)
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            yield f"{self.name}_sum{self._label_text(values)} {child.sum}"
+            yield f"{self.name}_count{self._label_text(values)} {child.count}"
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together for a ``/metrics`` scrape."""
+
+    def __init__(self) -> None:
+        """Create an empty registry."""
+        self._metrics: dict[str, _Metric[t.Any]] = {}
+
+    def register[MetricT: _Metric[t.Any]](self, metric: MetricT) -> MetricT:
+        """Add a metric to the registry.
+
+        Args:
+            metric: Metric to register.
+
+        Returns:
+            The registered metric, for assignment at module level.
+
+        Raises:
+            ValueError: If a metric with the same name is already registered.
+        """
+        if metric.name in self._metrics:
+            msg = f"metric {metric.name} is already registered"
+            raise ValueError(msg)
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        return "\n".join(m.render() for m in self._metrics.values()) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+REGISTRY = MetricsRegistry()
+
+REQUEST_LATENCY = REGISTRY.register(
+    Histogram(
+        "taskflow_request_duration_seconds",
+        "HTTP request latency by route.",
+        labels=("method", "route", "status"),
+    )
+)
+QUEUE_DEPTH = REGISTRY.register(
+    Gauge(
+        "taskflow_queue_depth",
+        "Pending plus ready jobs per queue, as counted for admission.",
+        labels=("queue",),
+    )
+)
+DISPATCH_LAG = REGISTRY.register(
+    Histogram(
+        "taskflow_dispatch_lag_seconds",
+        "Delay between a job becoming due and being dispatched.",
+        buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0),
+    )
+)
+ADMISSION_REJECTIONS = REGISTRY.register(
+    Counter(
+        "taskflow_admission_rejections",
+        "Requests rejected with 429 by admission control.",
+        labels=("reason",),
+    )
+)
@@ -1,10 +1,66 @@
-"""TaskFlow domain models."""
+"""TaskFlow domain models.
 
-from .enums import BackoffStrategy, JobStatus
-from .retry_policy import RetryPolicy
+Names are resolved lazily (PEP 562), so ``from taskflow.models import
+JobStatus`` loads only the enums module and not pydantic. Worker and
+scheduler processes pay only for the models they use.
+"""
+
+import importlib
+import typing as t
+
+if t.TYPE_CHECKING:
+    from .cron import CronSchedule
+    from .enums import BackoffStrategy, JobStatus, MisfirePolicy, SchedulingMode
+    from .job import Job
+    from .recurring import RecurringJobTemplate
+    from .requests import (
+        JobCreateRequest,
+        WorkflowCreateRequest,
+        WorkflowJobRequest,
+    )
+    from .result import JobResult
+    from .retry_policy import RetryPolicy
+
+_EXPORTS = {
+    "BackoffStrategy": ".enums",
+    "CronSchedule": ".cron",
+    "Job": ".job",
+    "JobCreateRequest": ".requests",
+    "JobResult": ".result",
+    "JobStatus": ".enums",
+    "MisfirePolicy": ".enums",
+    "RecurringJobTemplate": ".recurring",
+    "RetryPolicy": ".retry_policy",
+    "SchedulingMode": ".enums",
+    "WorkflowCreateRequest": ".requests",
+    "WorkflowJobRequest": ".requests",
+}
 
 __all__ = [
     "BackoffStrategy",
+    "CronSchedule",
+    "Job",
+    "JobCreateRequest",
+    "JobResult",
     "JobStatus",
+    "MisfirePolicy",
+    "RecurringJobTemplate",
     "RetryPolicy",
+    "SchedulingMode",
+    "WorkflowCreateRequest",
+    "WorkflowJobRequest",
 ]
+
+
+def __getattr__(name: str) -> object:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -0,0 +1,156 @@
+"""Cron schedule model with next fire time computation."""
+
+import typing as t
+from bisect import bisect_left
+from datetime import UTC, datetime, timedelta
+
+from pydantic import BaseModel
+
+_FIELD_BOUNDS: tuple[tuple[str, int, int], ...] = (
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day_of_month", 1, 31),
+    ("month", 1, 12),
+    ("day_of_week", 0, 7),
+)
+
+# A valid expression fires within eight years (Feb 29 restricted to a weekday
+# is the worst case); each searched day costs at most three steps.
+_MAX_SEARCH_STEPS = 366 * 8 * 3
+
+
+class CronSchedule(BaseModel, frozen=True):
+    """A parsed five-field cron expression evaluated in UTC.
+
+    Day-of-week uses 0-6 with Sunday as 0 (7 is also accepted for Sunday).
+    When both day-of-month and day-of-week are restricted, a day matches if
+    either does, as in classic cron.
+
+    Attributes:
+        expression: The original cron expression.
+        minutes: Sorted minutes (0-59) the schedule fires on.
+        hours: Sorted hours (0-23) the schedule fires on.
+        days_of_month: Days of the month (1-31) that match.
+        months: Months (1-12) that match.
+        days_of_week: Days of the week (0-6, Sunday = 0) that match.
+        day_of_month_restricted: Whether the day-of-month field lacks ``*``.
+        day_of_week_restricted: Whether the day-of-week field lacks ``*``.
+    """
+
+    expression: str
+    minutes: tuple[int, ...]
+    hours: tuple[int, ...]
+    days_of_month: frozenset[int]
+    months: frozenset[int]
+    days_of_week: frozenset[int]
+    day_of_month_restricted: bool
+    day_of_week_restricted: bool
+
+    @classmethod
+    def parse(cls, expression: str) -> t.Self:
+        """Parse a five-field cron expression.
+
+        Args:
+            expression: Cron expression, e.g. ``"*/5 9-17 * * 1-5"``.
+
+        Returns:
+            The parsed schedule.
+
+        Raises:
+            ValueError: If the expression is malformed or never fires.
+        """
+        fields = expression.split()
+        if len(fields) != len(_FIELD_BOUNDS):
+            msg = f"cron expression must have 5 fields, got {len(fields)}"
+            raise ValueError(msg)
+        parsed = [
+            _parse_field(field, name=name, low=low, high=high)
+            for field, (name, low, high) in zip(fields, _FIELD_BOUNDS, strict=True)
+        ]
+        minutes, hours, days_of_month, months, days_of_week = parsed
+        schedule = cls(
+            expression=expression,
+            minutes=tuple(sorted(minutes)),
+            hours=tuple(sorted(hours)),
+            days_of_month=frozenset(days_of_month),
+            months=frozenset(months),
+            days_of_week=frozenset(d % 7 for d in days_of_week),
+            day_of_month_restricted=not fields[2].startswith("*"),
+            day_of_week_restricted=not fields[4].startswith("*"),
+        )
+        schedule.next_after(datetime(2000, 1, 1, tzinfo=UTC))
+        return schedule
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Compute the first fire time strictly after ``moment``.
+
+        Skips whole months, days and hours that cannot match instead of
+        probing minute by minute, so each call is a handful of steps.
+
+        Args:
+            moment: Timezone-aware reference time.
+
+        Returns:
+            The next fire time in UTC.
+
+        Raises:
+            ValueError: If the schedule never fires.
+        """
+        candidate = moment.astimezone(UTC).replace(second=0, microsecond=0)
+        candidate += timedelta(minutes=1)
+        for _ in range(_MAX_SEARCH_STEPS):
+            if candidate.month not in self.months or not self._matches_day(candidate):
+                candidate = _start_of_next_day(candidate)
+                continue
+            hour_index = bisect_left(self.hours, candidate.hour)
+            if hour_index == len(self.hours):
+                candidate = _start_of_next_day(candidate)
+                continue
+            hour = self.hours[hour_index]
+            if hour != candidate.hour:
+                candidate = candidate.replace(hour=hour, minute=0)
+            minute_index = bisect_left(self.minutes, candidate.minute)
+            if minute_index < len(self.minutes):
+                return candidate.replace(minute=self.minutes[minute_index])
+            candidate = candidate.replace(minute=0) + timedelta(hours=1)
+        msg = f"cron expression {self.expression!r} never fires"
+        raise ValueError(msg)
+
+    def _matches_day(self, moment: datetime) -> bool:
+        in_month = moment.day in self.days_of_month
+        in_week = moment.isoweekday() % 7 in self.days_of_week
+        if self.day_of_month_restricted and self.day_of_week_restricted:
+            return in_month or in_week
+        return in_month and in_week
+
+
+def _start_of_next_day(moment: datetime) -> datetime:
+    return moment.replace(hour=0, minute=0) + timedelta(days=1)
+
+
+def _parse_field(field: str, *, name: str, low: int, high: int) -> set[int]:
+    values: set[int] = set()
+    for part in field.split(","):
+        values.update(_parse_part(part, name=name, low=low, high=high))
+    return values
+
+
+def _parse_part(part: str, *, name: str, low: int, high: int) -> range:
+    range_part, _, step_part = part.partition("/")
+    try:
+        step = int(step_part) if step_part else 1
+        if range_part == "*":
+            start, end = low, high
+        elif "-" in range_part:
+            start_text, end_text = range_part.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = int(range_part)
+            end = high if step_part else start
+    except ValueError:
+        msg = f"invalid cron {name} field: {part!r}"
+        raise ValueError(msg) from None
+    if not low <= start <= end <= high or step < 1:
+        msg = f"cron {name} field {part!r} must be within {low}-{high}"
+        raise ValueError(msg)
+    return range(start, end + 1, step)
@@ -35,3 +35,28 @@ class BackoffStrategy(str, Enum):
     FIXED = "fixed"
     LINEAR = "linear"
     EXPONENTIAL = "exponential"
+
+
+class MisfirePolicy(str, Enum):
+    """How a recurring template handles fire times missed during downtime.
+
+    Values:
+        CATCH_UP: Materialize a job for every missed fire time.
+        SKIP: Materialize a single job for the latest missed fire time.
+    """
+
+    CATCH_UP = "catch_up"
+    SKIP = "skip"
+
+
+class SchedulingMode(str, Enum):
+    """How READY jobs of equal priority are ordered for execution.
+
+    Values:
+        PRIORITY: SRS §2.2.1 ordering: priority, then age, then id.
+        CRITICAL_PATH: Within a priority level, jobs heading the longest
+            remaining path of dependents run first, then §2.2.1 applies.
+    """
+
+    PRIORITY = "priority"
+    CRITICAL_PATH = "critical_path"
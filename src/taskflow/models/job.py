@@ -0,0 +1,78 @@
+"""Job model, the central scheduling entity."""
+
+import json
+import typing as t
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel, Field, field_validator
+
+from .enums import JobStatus
+from .retry_policy import RetryPolicy
+
+MAX_PAYLOAD_BYTES = 65536
+
+
+def check_payload_size(payload: dict[str, t.Any]) -> dict[str, t.Any]:
+    """Ensure a payload is at most 64KB when JSON encoded.
+
+    Args:
+        payload: Job payload.
+
+    Returns:
+        The payload, unchanged.
+
+    Raises:
+        ValueError: If the encoded payload exceeds ``MAX_PAYLOAD_BYTES``.
+    """
+    size = len(json.dumps(payload).encode())
+    if size > MAX_PAYLOAD_BYTES:
+        msg = f"payload is {size} bytes, must be <= {MAX_PAYLOAD_BYTES}"
+        raise ValueError(msg)
+    return payload
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
+class Job(BaseModel):
+    """A unit of work tracked by the scheduler.
+
+    Instances built from untrusted input are fully validated. Rows read
+    back from the database were validated on insert and are mapped with
+    ``taskflow.db.mappers`` instead, which skips validation.
+
+    Attributes:
+        id: Unique job identifier.
+        name: Human-readable name (1-255 chars).
+        queue: Logical queue grouping (``^[a-zA-Z0-9_]{1,64}$``).
+        payload: Arbitrary job data, at most 64KB when JSON encoded.
+        priority: Execution priority (1-10, 10 = highest).
+        status: Current job state.
+        dependencies: Ids of jobs that must complete first (max 50).
+        retry_policy: Retry configuration.
+        created_at: Submission time (UTC).
+        updated_at: Last modification time (UTC).
+        attempt_count: Current attempt number.
+
+    Raises:
+        ValueError: If the encoded payload exceeds 64KB.
+    """
+
+    id: UUID = Field(default_factory=uuid4)
+    name: str = Field(min_length=1, max_length=255)
+    queue: str = Field(pattern=r"^[a-zA-Z0-9_]{1,64}$")
+    payload: dict[str, t.Any] = Field(default_factory=dict)
+    priority: int = Field(default=5, ge=1, le=10)
+    status: JobStatus = JobStatus.PENDING
+    dependencies: list[UUID] = Field(default_factory=list, max_length=50)
+    retry_policy: RetryPolicy = Field(default_factory=RetryPolicy)
+    created_at: datetime = Field(default_factory=_utc_now)
+    updated_at: datetime = Field(default_factory=_utc_now)
+    attempt_count: int = Field(default=0, ge=0)
+
+    @field_validator("payload")
+    @classmethod
+    def _validate_payload_size(cls, payload: dict[str, t.Any]) -> dict[str, t.Any]:
+        return check_payload_size(payload)
@@ -0,0 +1,37 @@
+"""Recurring job template model."""
+
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel, Field, field_serializer, field_validator
+
+from .cron import CronSchedule
+from .enums import MisfirePolicy
+from .requests import JobCreateRequest
+
+
+class RecurringJobTemplate(BaseModel):
+    """A job submission repeated on a cron schedule.
+
+    Attributes:
+        id: Unique template identifier.
+        schedule: When the template fires; accepts a cron expression string.
+        job: Request used to materialize a job at each fire time. Its
+            ``retry_policy`` applies to every materialized job.
+        misfire_policy: How fire times missed during downtime are handled.
+    """
+
+    id: UUID = Field(default_factory=uuid4)
+    schedule: CronSchedule
+    job: JobCreateRequest
+    misfire_policy: MisfirePolicy = Field(default=MisfirePolicy.SKIP)
+
+    @field_validator("schedule", mode="before")
+    @classmethod
+    def _parse_schedule(cls, value: object) -> object:
+        if isinstance(value, str):
+            return CronSchedule.parse(value)
+        return value
+
+    @field_serializer("schedule")
+    def _serialize_schedule(self, schedule: CronSchedule) -> str:
+        return schedule.expression
@@ -0,0 +1,136 @@
+"""API request models for job submission."""
+
+import typing as t
+from collections import Counter
+from uuid import UUID
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from .job import check_payload_size
+from .retry_policy import RetryPolicy
+
+MAX_DEPENDENCIES = 50
+MAX_WORKFLOW_JOBS = 100_000
+
+
+class JobCreateRequest(BaseModel):
+    """Request body for submitting a new job.
+
+    Attributes:
+        name: Human-readable name (1-255 chars).
+        queue: Logical queue grouping (``^[a-zA-Z0-9_]{1,64}$``).
+        payload: Arbitrary job data, at most 64KB when JSON encoded.
+        priority: Execution priority (1-10, 10 = highest).
+        dependencies: Ids of jobs that must complete first (max 50).
+        retry_policy: Retry configuration.
+        idempotency_key: Optional client key; resubmitting the same key to
+            the same queue within the deduplication window returns the
+            original job instead of creating a new one.
+
+    Raises:
+        ValueError: If the encoded payload exceeds 64KB.
+    """
+
+    name: str = Field(min_length=1, max_length=255)
+    queue: str = Field(pattern=r"^[a-zA-Z0-9_]{1,64}$")
+    payload: dict[str, t.Any] = Field(default_factory=dict)
+    priority: int = Field(default=5, ge=1, le=10)
+    dependencies: list[UUID] = Field(default_factory=list, max_length=MAX_DEPENDENCIES)
+    retry_policy: RetryPolicy = Field(default_factory=RetryPolicy)
+    idempotency_key: str | None = Field(default=None, min_length=1, max_length=255)
+
+    @field_validator("payload")
+    @classmethod
+    def _validate_payload_size(cls, payload: dict[str, t.Any]) -> dict[str, t.Any]:
+        return check_payload_size(payload)
+
+
+class WorkflowJobRequest(JobCreateRequest):
+    """One job of a workflow, addressed by a client-local key.
+
+    ``idempotency_key`` is inherited but must be left unset: a workflow is
+    created in one transaction, so deduplicating single jobs inside it
+    would leave dependents pointing at jobs from another submission.
+
+    Attributes:
+        key: Identifier unique within the workflow (1-255 chars).
+        depends_on: Distinct keys of jobs in the same workflow that must
+            complete first; together with ``dependencies`` at most 50
+            entries.
+
+    Raises:
+        ValueError: If the job has more than 50 dependencies in total,
+            ``depends_on`` or ``dependencies`` repeats an entry, or
+            ``idempotency_key`` is set.
+    """
+
+    key: str = Field(min_length=1, max_length=255)
+    depends_on: list[str] = Field(default_factory=list, max_length=MAX_DEPENDENCIES)
+
+    @model_validator(mode="after")
+    def _validate_dependency_count(self) -> t.Self:
+        total = len(self.dependencies) + len(self.depends_on)
+        if total > MAX_DEPENDENCIES:
+            msg = (
+                f"job {self.key!r} has {total} dependencies, "
+                f"must be <= {MAX_DEPENDENCIES}"
+            )
+            raise ValueError(msg)
+        return self
+
+    @model_validator(mode="after")
+    def _validate_dependencies_unique(self) -> t.Self:
+        for field, entries in (
+            ("depends_on keys", self.depends_on),
+            ("dependencies", self.dependencies),
+        ):
+            repeated = sorted(
+                str(entry) for entry, count in Counter(entries).items() if count > 1
+            )
+            if repeated:
+                msg = f"job {self.key!r} repeats {field}: {', '.join(repeated)}"
+                raise ValueError(msg)
+        return self
+
+    @model_validator(mode="after")
+    def _validate_no_idempotency_key(self) -> t.Self:
+        if self.idempotency_key is not None:
+            msg = (
+                f"job {self.key!r} sets idempotency_key, which is not supported "
+                "on workflow jobs"
+            )
+            raise ValueError(msg)
+        return self
+
+
+class WorkflowCreateRequest(BaseModel):
+    """Request body for submitting a whole DAG of jobs at once.
+
+    Jobs may be listed in any order; ``depends_on`` references are
+    resolved within the workflow, so clients need not create
+    dependencies before their dependents.
+
+    Attributes:
+        jobs: The workflow's jobs (1-100000).
+
+    Raises:
+        ValueError: If keys are repeated or ``depends_on`` names a key that
+            is not in the workflow.
+    """
+
+    jobs: list[WorkflowJobRequest] = Field(min_length=1, max_length=MAX_WORKFLOW_JOBS)
+
+    @model_validator(mode="after")
+    def _validate_keys(self) -> t.Self:
+        keys = Counter(job.key for job in self.jobs)
+        duplicates = sorted(key for key, count in keys.items() if count > 1)
+        if duplicates:
+            msg = f"duplicate job keys: {', '.join(duplicates[:10])}"
+            raise ValueError(msg)
+        unknown = sorted(
+            {key for job in self.jobs for key in job.depends_on if key not in keys}
+        )
+        if unknown:
+            msg = f"depends_on references unknown keys: {', '.join(unknown[:10])}"
+            raise ValueError(msg)
+        return self
@@ -0,0 +1,24 @@
+"""Job result metadata model."""
+
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class JobResult(BaseModel):
+    """Output recorded for a completed job.
+
+    Small results are kept inline; larger ones live in the result store and
+    are streamed on retrieval.
+
+    Attributes:
+        job_id: Id of the job that produced the result.
+        content_type: MIME type of the result body.
+        size_bytes: Size of the result body in bytes.
+        inline: The result body when small enough to store inline.
+    """
+
+    job_id: UUID
+    content_type: str = Field(default="application/octet-stream")
+    size_bytes: int = Field(ge=0)
+    inline: bytes | None = None
@@ -0,0 +1,31 @@
+"""Construction of models from data that is already known to be valid."""
+
+import typing as t
+
+from pydantic import BaseModel
+
+
+def construct_trusted[ModelT: BaseModel](
+    model: type[ModelT], values: dict[str, t.Any]
+) -> ModelT:
+    """Build a model instance without validation.
+
+    Equivalent to ``model.model_construct(**values)`` when ``values``
+    supplies every field with its final type, minus the per-call default
+    and alias handling, which makes it several times cheaper. Use it only
+    for data validated earlier, such as rows read back from our own
+    database or requests already validated at the API boundary.
+
+    Args:
+        model: Model class to instantiate.
+        values: Every field of the model; the dict is adopted, not copied.
+
+    Returns:
+        The instance.
+    """
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
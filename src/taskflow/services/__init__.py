@@ -0,0 +1 @@
+"""TaskFlow business logic services."""
@@ -0,0 +1,156 @@
+"""Per-queue backlog limits for job submission."""
+
+import math
+from collections import defaultdict
+from collections.abc import Mapping
+from datetime import datetime
+
+from taskflow.config import Settings
+from taskflow.metrics import ADMISSION_REJECTIONS, QUEUE_DEPTH, Gauge
+
+BACKLOG_REJECTION = "backlog"
+
+
+class QueueFullError(Exception):
+    """Raised when a queue's backlog is at its limit.
+
+    Attributes:
+        queue: The saturated queue.
+        depth: Jobs counted in the queue's backlog.
+        limit: The queue's backlog limit.
+        retry_after_seconds: Suggested wait before resubmitting.
+    """
+
+    def __init__(
+        self, *, queue: str, depth: int, limit: int, retry_after_seconds: int
+    ) -> None:
+        """Create the error.
+
+        Args:
+            queue: The saturated queue.
+            depth: Jobs counted in the queue's backlog.
+            limit: The queue's backlog limit.
+            retry_after_seconds: Suggested wait before resubmitting.
+        """
+        self.queue = queue
+        self.depth = depth
+        self.limit = limit
+        self.retry_after_seconds = retry_after_seconds
+        super().__init__(f"queue {queue!r} has {depth} jobs waiting, limit is {limit}")
+
+
+class QueueBacklog:
+    """Cached per-queue backlog counters deciding job admission.
+
+    Counts PENDING and READY jobs per queue without touching the database:
+    submissions increment the counter, jobs leaving the backlog (started,
+    deleted) decrement it, and ``sync`` periodically replaces the counters
+    with authoritative ``GROUP BY queue`` counts to correct drift from
+    other processes. Admission is therefore a dict lookup, so saturated
+    queues are rejected before any validation or SQL. The counters live in
+    the ``taskflow_queue_depth`` gauge, so ``/metrics`` reports exactly
+    what admission sees. Queue names come from clients, so a gauge series
+    is only created when a job is admitted; reads of unknown queues count
+    them as empty.
+
+    ``Retry-After`` is estimated from each queue's drain rate between the
+    last two syncs. Jobs are started by scheduler and worker processes, so
+    the rate is derived from the authoritative depths: the earlier depth
+    plus the jobs admitted here since, minus the later depth. Submissions
+    to other API processes are not seen, which only understates the rate
+    and lengthens the advice. The wait is the time to drain the excess
+    over the limit, clamped to the configured bounds.
+    """
+
+    def __init__(self, *, settings: Settings, gauge: Gauge = QUEUE_DEPTH) -> None:
+        """Create empty counters.
+
+        Args:
+            settings: Application settings with the backlog limits.
+            gauge: Gauge labelled by queue holding the counters.
+        """
+        self._default_limit = settings.queue_backlog_limit
+        self._limits = settings.queue_backlog_limits
+        self._min_retry_after = settings.retry_after_seconds
+        self._max_retry_after = settings.max_retry_after_seconds
+        self._gauge = gauge
+        self._admitted: defaultdict[str, int] = defaultdict(int)
+        self._synced_depths: Mapping[str, int] = {}
+        self._drain_rates: dict[str, float] = {}
+        self._synced_at: datetime | None = None
+
+    def depth(self, *, queue: str) -> int:
+        """Return the cached backlog of ``queue``."""
+        counter = self._gauge.get(queue)
+        return 0 if counter is None else int(counter.value)
+
+    def admit(self, *, queue: str) -> None:
+        """Count a new job against its queue's backlog.
+
+        Args:
+            queue: Queue the job is submitted to.
+
+        Raises:
+            QueueFullError: If the queue is at its limit; the job is not
+                counted.
+        """
+        depth = self.depth(queue=queue)
+        limit = self._limits.get(queue, self._default_limit)
+        if depth >= limit:
+            ADMISSION_REJECTIONS.labels(BACKLOG_REJECTION).inc()
+            raise QueueFullError(
+                queue=queue,
+                depth=depth,
+                limit=limit,
+                retry_after_seconds=self._retry_after(
+                    queue=queue, excess=depth - limit + 1
+                ),
+            )
+        self._gauge.labels(queue).inc()
+        self._admitted[queue] += 1
+
+    def release(self, *, queue: str, count: int = 1) -> None:
+        """Remove jobs from a queue's backlog.
+
+        Args:
+            queue: Queue the jobs belong to.
+            count: Number of jobs that started running or were deleted.
+        """
+        counter = self._gauge.get(queue)
+        if counter is not None:
+            counter.set(max(0, counter.value - count))
+
+    def sync(self, *, depths: Mapping[str, int], now: datetime) -> None:
+        """Replace the counters with authoritative counts.
+
+        Args:
+            depths: Map of queue → PENDING plus READY jobs; queues absent
+                from the map are empty and dropped from the gauge.
+            now: Time the counts were taken.
+        """
+        if self._synced_at is not None and now > self._synced_at:
+            elapsed = (now - self._synced_at).total_seconds()
+            previous = self._synced_depths
+            self._drain_rates = {
+                queue: max(
+                    0,
+                    previous.get(queue, 0)
+                    + self._admitted.get(queue, 0)
+                    - depths.get(queue, 0),
+                )
+                / elapsed
+                for queue in previous.keys() | self._admitted.keys()
+            }
+        self._gauge.clear()
+        for queue, depth in depths.items():
+            self._gauge.labels(queue).set(depth)
+        self._synced_depths = dict(depths)
+        self._admitted.clear()
+        self._synced_at = now
+
+    def _retry_after(self, *, queue: str, excess: int) -> int:
+        rate = self._drain_rates.get(queue, 0)
+        if not rate:
+            return self._max_retry_after
+        estimate = math.ceil(excess / rate)
+        return min(self._max_retry_after, max(self._min_retry_after, estimate))
@@ -0,0 +1,142 @@
+"""Dependency resolution and graph queries over job dependencies."""
+
+from collections.abc import Iterable, Mapping
+from enum import Enum
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from taskflow.models import JobStatus
+
+_BLOCKING_STATUSES = frozenset({JobStatus.FAILED, JobStatus.BLOCKED})
+
+
+class DependencyStatus(str, Enum):
+    """Readiness of a job derived from its dependencies' states.
+
+    Values:
+        SATISFIED: All dependencies completed.
+        WAITING: At least one dependency is still pending, ready or running.
+        BLOCKED: At least one dependency failed or is blocked.
+    """
+
+    SATISFIED = "satisfied"
+    WAITING = "waiting"
+    BLOCKED = "blocked"
+
+
+_INITIAL_STATUSES: dict[DependencyStatus, JobStatus] = {
+    DependencyStatus.SATISFIED: JobStatus.READY,
+    DependencyStatus.WAITING: JobStatus.PENDING,
+    DependencyStatus.BLOCKED: JobStatus.BLOCKED,
+}
+
+
+class DependencyResolution(BaseModel):
+    """Outcome of resolving a new job's dependencies from one status lookup.
+
+    Attributes:
+        missing: Dependencies that do not exist, in request order.
+        initial_status: Status the job should be created with.
+    """
+
+    missing: list[UUID]
+    initial_status: JobStatus
+
+
+def find_jobs_with_dependents(
+    *,
+    job_ids: Iterable[UUID],
+    existing_jobs: Mapping[UUID, Iterable[UUID]],
+) -> dict[UUID, set[UUID]]:
+    """Find which of the given jobs are still depended upon (SRS §3.3).
+
+    A pure in-memory helper: it checks every candidate in one pass over
+    ``existing_jobs`` and costs O(E) in the size of that map. It is not a
+    delete path on its own. The caller must pass only the rows that
+    reference a candidate, e.g. ``SELECT id, dependencies FROM jobs WHERE
+    dependencies && $1`` served by a GIN index on ``dependencies``, so the
+    work is bounded by the dependents found, not by the table size.
+    Dependents that are themselves part of ``job_ids`` are ignored,
+    allowing a job and everything that depends on it to be deleted
+    together.
+
+    Args:
+        job_ids: Ids of the jobs requested for deletion.
+        existing_jobs: Map of job_id to the ids it depends on, restricted
+            to jobs that depend on at least one candidate.
+
+    Returns:
+        Map of each blocked job_id to the ids of its remaining dependents.
+        An empty map means every job may be deleted.
+    """
+    candidates = set(job_ids)
+    blocked: dict[UUID, set[UUID]] = {}
+    for job_id, dependencies in existing_jobs.items():
+        if job_id in candidates:
+            continue
+        for dependency_id in candidates.intersection(dependencies):
+            blocked.setdefault(dependency_id, set()).add(job_id)
+    return blocked
+
+
+def check_dependency_satisfaction(
+    *,
+    dependencies: Iterable[UUID],
+    dependency_statuses: Mapping[UUID, JobStatus],
+) -> DependencyStatus:
+    """Determine a job's readiness from its dependencies (SRS §2.1.2).
+
+    Args:
+        dependencies: Ids the job depends on.
+        dependency_statuses: Map of dependency_id to its current status.
+
+    Returns:
+        BLOCKED if any dependency failed or is blocked, WAITING if any is
+        not yet completed, otherwise SATISFIED.
+    """
+    waiting = False
+    for dependency_id in dependencies:
+        status = dependency_statuses[dependency_id]
+        if status in _BLOCKING_STATUSES:
+            return DependencyStatus.BLOCKED
+        if status != JobStatus.COMPLETED:
+            waiting = True
+    return DependencyStatus.WAITING if waiting else DependencyStatus.SATISFIED
+
+
+def resolve_new_job_dependencies(
+    *,
+    dependencies: list[UUID],
+    dependency_statuses: Mapping[UUID, JobStatus],
+) -> DependencyResolution:
+    """Validate and classify a new job's dependencies (SRS §3.1, §2.1.2).
+
+    ``dependency_statuses`` is the result of a single
+    ``SELECT id, status FROM jobs WHERE id = ANY($1)`` over all of the
+    dependencies, so existence and readiness come from one round trip.
+    A freshly generated job id cannot be referenced by any existing job,
+    so a new job can never close a cycle and needs no graph traversal.
+
+    Args:
+        dependencies: Ids the new job depends on.
+        dependency_statuses: Statuses of the dependencies that exist.
+
+    Returns:
+        The missing dependencies and the status to create the job with.
+        ``initial_status`` is only meaningful when ``missing`` is empty.
+    """
+    missing = [d for d in dependencies if d not in dependency_statuses]
+    if missing:
+        return DependencyResolution(
+            missing=missing,
+            initial_status=JobStatus.PENDING,
+        )
+    readiness = check_dependency_satisfaction(
+        dependencies=dependencies,
+        dependency_statuses=dependency_statuses,
+    )
+    return DependencyResolution(
+        missing=[],
+        initial_status=_INITIAL_STATUSES[readiness],
+    )
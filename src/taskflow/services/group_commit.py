@@ -0,0 +1,176 @@
+"""Group commit of job completion and failure reports from workers.
+
+Committing every report in its own transaction caps throughput at the
+database's commit rate. Reports are instead buffered for a few
+milliseconds and applied together: one transaction, one status update
+per outcome and one batched cascade over the dependents of the whole
+batch. Workers are acknowledged only after that transaction commits, so
+an acknowledged report is durable and an unacknowledged one must be
+resent.
+"""
+
+import asyncio
+import contextlib
+import typing as t
+from collections.abc import Awaitable, Callable, Iterable
+from uuid import UUID
+
+from pydantic import BaseModel
+
+DEFAULT_MAX_DELAY_SECONDS = 0.002
+DEFAULT_MAX_BATCH_SIZE = 1000
+
+
+class CompletionReport(BaseModel, frozen=True):
+    """A worker's report on one execution attempt.
+
+    Attributes:
+        job_id: Id of the executed job.
+        succeeded: Whether the attempt succeeded; failed attempts are
+            retried or marked FAILED according to the job's retry policy.
+    """
+
+    job_id: UUID
+    succeeded: bool
+
+
+class CompletionBatch(BaseModel, frozen=True):
+    """Reports grouped by outcome for set-based SQL (``id = ANY($1)``).
+
+    Attributes:
+        completed: Jobs whose attempt succeeded.
+        failed: Jobs whose attempt failed.
+    """
+
+    completed: list[UUID]
+    failed: list[UUID]
+
+    @classmethod
+    def from_reports(cls, reports: Iterable[CompletionReport]) -> t.Self:
+        """Group reports by outcome; a repeated job keeps its last report.
+
+        Args:
+            reports: Reports in arrival order.
+
+        Returns:
+            The batch.
+        """
+        outcomes = {report.job_id: report.succeeded for report in reports}
+        return cls(
+            completed=[job_id for job_id, ok in outcomes.items() if ok],
+            failed=[job_id for job_id, ok in outcomes.items() if not ok],
+        )
+
+
+type ApplyBatch = Callable[[CompletionBatch], Awaitable[None]]
+type _Pending = tuple[CompletionReport, asyncio.Future[None], float]
+
+
+class GroupCommitter:
+    """Buffers completion reports and applies them in batches.
+
+    A batch is applied once its oldest report has waited
+    ``max_delay_seconds`` or ``max_batch_size`` reports are buffered,
+    whichever comes first. Batches are applied one at a time; reports
+    arriving during a commit form the next batch, so under load batches
+    grow to match the commit latency.
+    """
+
+    def __init__(
+        self,
+        *,
+        apply: ApplyBatch,
+        max_delay_seconds: float = DEFAULT_MAX_DELAY_SECONDS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
+        """Create an idle committer.
+
+        Args:
+            apply: Applies a batch in a single transaction and returns once
+                it has committed; if it raises or is cancelled, every report
+                in the batch fails with that error or is cancelled.
+            max_delay_seconds: Longest a report waits for others to join
+                its batch.
+            max_batch_size: Most reports applied in one batch.
+        """
+        self._apply = apply
+        self._max_delay = max_delay_seconds
+        self._max_batch_size = max_batch_size
+        self._pending: list[_Pending] = []
+        self._full = asyncio.Event()
+        self._flusher: asyncio.Task[None] | None = None
+        self._draining = False
+
+    async def submit(self, *, report: CompletionReport) -> None:
+        """Buffer a report and wait until it has been committed.
+
+        Args:
+            report: The worker's report.
+
+        Raises:
+            Exception: Whatever ``apply`` raised for the report's batch.
+            asyncio.CancelledError: If the batch's commit was cancelled.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        self._pending.append((report, future, loop.time()))
+        if len(self._pending) >= self._max_batch_size:
+            self._full.set()
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_pending())
+        await future
+
+    async def drain(self) -> None:
+        """Apply every buffered report without waiting for the delay."""
+        self._draining = True
+        self._full.set()
+        try:
+            if self._flusher is not None:
+                await self._flusher
+        finally:
+            self._draining = False
+
+    async def _flush_pending(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while self._pending:
+                wait = self._pending[0][2] + self._max_delay - loop.time()
+                if wait > 0 and not self._full.is_set():
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(self._full.wait(), timeout=wait)
+                batch = self._pending[: self._max_batch_size]
+                del self._pending[: self._max_batch_size]
+                if len(self._pending) < self._max_batch_size and not self._draining:
+                    self._full.clear()
+                await self._commit(batch)
+        except BaseException as exc:
+            # Reports still buffered will never be committed by this task;
+            # fail them so their workers resend instead of waiting forever.
+            pending, self._pending = self._pending, []
+            _fail(pending, exc)
+            raise
+
+    async def _commit(self, batch: list[_Pending]) -> None:
+        try:
+            await self._apply(
+                CompletionBatch.from_reports(report for report, _, _ in batch)
+            )
+        except Exception as exc:
+            _fail(batch, exc)
+        except BaseException as exc:
+            _fail(batch, exc)
+            raise
+        else:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_result(None)
+
+
+def _fail(batch: list[_Pending], exc: BaseException) -> None:
+    for _, future, _ in batch:
+        if future.done():
+            continue
+        if isinstance(exc, asyncio.CancelledError):
+            future.cancel()
+        else:
+            future.set_exception(exc)
@@ -0,0 +1,79 @@
+"""Deduplication of job submissions by idempotency key."""
+
+from collections import deque
+from datetime import datetime, timedelta
+from uuid import UUID
+
+DEFAULT_IDEMPOTENCY_TTL = timedelta(hours=24)
+
+
+class IdempotencyCache:
+    """Maps ``(queue, idempotency_key)`` to the job first submitted with it.
+
+    Mirrors the semantics of ``INSERT ... ON CONFLICT DO NOTHING RETURNING``
+    against a unique ``(queue, idempotency_key)`` index: the first claim
+    wins and replays within the TTL window resolve to the original job, so
+    the create path can answer a retry before validating dependencies.
+
+    Every entry has the same TTL, so insertion order is expiry order and
+    expired keys are evicted from the front of a deque in amortized O(1).
+    """
+
+    def __init__(self, *, ttl: timedelta = DEFAULT_IDEMPOTENCY_TTL) -> None:
+        """Create an empty cache.
+
+        Args:
+            ttl: How long a key deduplicates submissions after first use.
+        """
+        self._ttl = ttl
+        self._entries: dict[tuple[str, str], tuple[UUID, datetime]] = {}
+        self._expiry: deque[tuple[datetime, tuple[str, str]]] = deque()
+
+    def __len__(self) -> int:
+        """Return the number of keys still inside their TTL window."""
+        return len(self._entries)
+
+    def lookup(self, *, queue: str, key: str, now: datetime) -> UUID | None:
+        """Return the job previously submitted with this key, if any.
+
+        Args:
+            queue: Queue the job is submitted to.
+            key: Client-supplied idempotency key.
+            now: Current time.
+
+        Returns:
+            The original job id, or None if the key is unused or expired.
+        """
+        self._evict(now=now)
+        entry = self._entries.get((queue, key))
+        return entry[0] if entry else None
+
+    def claim(self, *, queue: str, key: str, job_id: UUID, now: datetime) -> UUID:
+        """Associate a key with a job unless it is already taken.
+
+        Args:
+            queue: Queue the job is submitted to.
+            key: Client-supplied idempotency key.
+            job_id: Id of the job being created.
+            now: Current time.
+
+        Returns:
+            ``job_id`` if the claim succeeded, otherwise the id of the job
+            that already holds the key.
+        """
+        self._evict(now=now)
+        scoped_key = (queue, key)
+        existing = self._entries.get(scoped_key)
+        if existing:
+            return existing[0]
+        expires_at = now + self._ttl
+        self._entries[scoped_key] = (job_id, expires_at)
+        self._expiry.append((expires_at, scoped_key))
+        return job_id
+
+    def _evict(self, *, now: datetime) -> None:
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, scoped_key = self._expiry.popleft()
+            entry = self._entries.get(scoped_key)
+            if entry and entry[1] == expires_at:
+                del self._entries[scoped_key]
@@ -0,0 +1,240 @@
+"""In-process fan-out of job status changes to waiting clients."""
+
+import asyncio
+import typing as t
+from collections.abc import AsyncIterator, Collection, Iterator
+from contextlib import contextmanager
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from taskflow.models import JobStatus
+
+STATUS_CHANNEL = "job_status"
+DEFAULT_STREAM_BUFFER = 256
+
+
+class StatusChange(BaseModel):
+    """A job status transition published on the ``job_status`` channel.
+
+    Attributes:
+        job_id: Id of the job that changed.
+        queue: Queue the job belongs to.
+        status: Status the job transitioned to.
+    """
+
+    job_id: UUID
+    queue: str
+    status: JobStatus
+
+    def to_sse(self) -> str:
+        """Format the change as a Server-Sent Events message."""
+        return f"event: status\ndata: {self.model_dump_json()}\n\n"
+
+
+class StatusBroadcaster:
+    """Fans status changes from one ``LISTEN`` connection out to many waiters.
+
+    Long-poll waiters cost a single future each, indexed by job id, and are
+    only woken by a change into a status they wait for. Stream subscribers
+    get a bounded queue; a subscriber that falls behind loses its oldest
+    buffered changes rather than growing without bound.
+
+    Routes must register before reading the job's current status, or a
+    change committed between the read and the registration is lost::
+
+        with broadcaster.subscribe(job_id=job_id, statuses=terminal) as change:
+            job = await repository.get(job_id=job_id)
+            if job.status not in terminal:
+                await asyncio.wait_for(change, timeout=timeout_seconds)
+    """
+
+    def __init__(self, *, stream_buffer: int = DEFAULT_STREAM_BUFFER) -> None:
+        """Create a broadcaster with no waiters.
+
+        Args:
+            stream_buffer: Changes buffered per stream subscriber.
+        """
+        self._stream_buffer = stream_buffer
+        self._waiters: dict[
+            UUID, dict[asyncio.Future[StatusChange], Collection[JobStatus]]
+        ] = {}
+        self._job_streams: dict[UUID, set[asyncio.Queue[StatusChange]]] = {}
+        self._queue_streams: dict[str, set[asyncio.Queue[StatusChange]]] = {}
+
+    @property
+    def waiter_count(self) -> int:
+        """Number of pending long-poll waiters."""
+        return sum(len(futures) for futures in self._waiters.values())
+
+    def on_notification(
+        self,
+        _connection: object,
+        _pid: int,
+        _channel: str,
+        payload: str,
+    ) -> None:
+        """Handle a notification; matches asyncpg's listener signature.
+
+        Args:
+            _connection: Connection that received the notification.
+            _pid: Backend process id of the notifying session.
+            _channel: Channel name.
+            payload: JSON-encoded ``StatusChange``.
+        """
+        self.publish(change=StatusChange.model_validate_json(payload))
+
+    def publish(self, *, change: StatusChange) -> None:
+        """Deliver a change to every waiter and subscriber interested in it.
+
+        Args:
+            change: The status transition to deliver.
+        """
+        waiters = self._waiters.get(change.job_id, {})
+        for future, statuses in list(waiters.items()):
+            if change.status in statuses:
+                del waiters[future]
+                if not future.done():
+                    future.set_result(change)
+        if not waiters:
+            self._waiters.pop(change.job_id, None)
+        for stream in (
+            *self._job_streams.get(change.job_id, ()),
+            *self._queue_streams.get(change.queue, ()),
+        ):
+            if stream.full():
+                stream.get_nowait()
+            stream.put_nowait(change)
+
+    @contextmanager
+    def subscribe(
+        self,
+        *,
+        job_id: UUID,
+        statuses: Collection[JobStatus],
+    ) -> Iterator[asyncio.Future[StatusChange]]:
+        """Register a long-poll waiter for the duration of the block.
+
+        Registration happens synchronously on entry, so every change
+        published after entering the block resolves the future.
+
+        Args:
+            job_id: Id of the job to wait on.
+            statuses: Statuses that resolve the future.
+
+        Yields:
+            A future resolved with the first matching change.
+        """
+        future: asyncio.Future[StatusChange] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._waiters.setdefault(job_id, {})[future] = statuses
+        try:
+            yield future
+        finally:
+            self._discard_waiter(job_id=job_id, future=future)
+
+    @contextmanager
+    def subscribe_stream(
+        self,
+        *,
+        job_id: UUID | None = None,
+        queue: str | None = None,
+    ) -> Iterator[asyncio.Queue[StatusChange]]:
+        """Register a stream subscriber for the duration of the block.
+
+        Registration happens synchronously on entry, so every change
+        published after entering the block is buffered.
+
+        Args:
+            job_id: Job to follow.
+            queue: Queue to follow; ignored if ``job_id`` is given.
+
+        Yields:
+            A bounded queue receiving changes in publication order.
+
+        Raises:
+            ValueError: If neither ``job_id`` nor ``queue`` is given.
+        """
+        streams: dict[t.Any, set[asyncio.Queue[StatusChange]]]
+        if job_id is not None:
+            streams, key = self._job_streams, job_id
+        elif queue is not None:
+            streams, key = self._queue_streams, queue
+        else:
+            msg = "stream requires a job_id or a queue"
+            raise ValueError(msg)
+        buffer: asyncio.Queue[StatusChange] = asyncio.Queue(self._stream_buffer)
+        streams.setdefault(key, set()).add(buffer)
+        try:
+            yield buffer
+        finally:
+            subscribers = streams[key]
+            subscribers.discard(buffer)
+            if not subscribers:
+                del streams[key]
+
+    async def wait_for(
+        self,
+        *,
+        job_id: UUID,
+        statuses: Collection[JobStatus],
+        timeout_seconds: float,
+    ) -> StatusChange | None:
+        """Wait until a job transitions into one of ``statuses``.
+
+        Only changes published after this coroutine starts running are
+        observed; use ``subscribe`` to check the current status without
+        missing a concurrent change.
+
+        Args:
+            job_id: Id of the job to wait on.
+            statuses: Statuses that end the wait.
+            timeout_seconds: Maximum seconds to wait.
+
+        Returns:
+            The matching change, or None if the timeout elapsed first.
+        """
+        with self.subscribe(job_id=job_id, statuses=statuses) as future:
+            try:
+                return await asyncio.wait_for(future, timeout=timeout_seconds)
+            except TimeoutError:
+                return None
+
+    async def stream(
+        self,
+        *,
+        job_id: UUID | None = None,
+        queue: str | None = None,
+    ) -> AsyncIterator[StatusChange]:
+        """Yield status changes for one job or one queue until cancelled.
+
+        Only changes published after the first ``anext`` are observed; use
+        ``subscribe_stream`` to send a snapshot without missing a change.
+
+        Args:
+            job_id: Job to follow.
+            queue: Queue to follow; ignored if ``job_id`` is given.
+
+        Yields:
+            Status changes in publication order.
+
+        Raises:
+            ValueError: If neither ``job_id`` nor ``queue`` is given.
+        """
+        with self.subscribe_stream(job_id=job_id, queue=queue) as buffer:
+            while True:
+                yield await buffer.get()
+
+    def _discard_waiter(
+        self,
+        *,
+        job_id: UUID,
+        future: asyncio.Future[StatusChange],
+    ) -> None:
+        futures = self._waiters.get(job_id)
+        if futures is None:
+            return
+        futures.pop(future, None)
+        if not futures:
+            del self._waiters[job_id]
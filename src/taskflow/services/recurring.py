@@ -0,0 +1,117 @@
+"""Min-heap of recurring template fire times."""
+
+import heapq
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from taskflow.metrics import DISPATCH_LAG
+from taskflow.models import MisfirePolicy, RecurringJobTemplate
+
+
+class DueFire(BaseModel):
+    """A template fire time that is due for materialization.
+
+    Attributes:
+        template: The template that fired.
+        fire_at: Scheduled fire time the job is materialized for.
+    """
+
+    template: RecurringJobTemplate
+    fire_at: datetime
+
+
+class RecurringScheduler:
+    """Tracks the next fire time of every template in a min-heap.
+
+    Only templates whose next fire time has passed are touched on each
+    ``pop_due`` call, so a tick costs O(k log n) for k due templates out of
+    n registered ones. Removed or replaced templates leave stale heap
+    entries that are discarded lazily when they surface.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty scheduler."""
+        self._heap: list[tuple[datetime, int, UUID]] = []
+        self._templates: dict[UUID, RecurringJobTemplate] = {}
+        self._generations: dict[UUID, int] = {}
+        self._generation = 0
+
+    def __len__(self) -> int:
+        """Return the number of registered templates."""
+        return len(self._templates)
+
+    def add(
+        self,
+        *,
+        template: RecurringJobTemplate,
+        last_fired_at: datetime,
+    ) -> None:
+        """Register or replace a template.
+
+        Args:
+            template: Template to schedule.
+            last_fired_at: Last time the template was materialized, or its
+                registration time if it never fired. Fire times after this
+                moment are due, including any missed during downtime.
+        """
+        self._generation += 1
+        self._templates[template.id] = template
+        self._generations[template.id] = self._generation
+        fire_at = template.schedule.next_after(last_fired_at)
+        heapq.heappush(self._heap, (fire_at, self._generation, template.id))
+
+    def remove(self, *, template_id: UUID) -> None:
+        """Unregister a template; unknown ids are ignored.
+
+        Args:
+            template_id: Id of the template to remove.
+        """
+        self._templates.pop(template_id, None)
+        self._generations.pop(template_id, None)
+
+    def next_fire_at(self) -> datetime | None:
+        """Return the earliest pending fire time, or None if idle."""
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, *, now: datetime) -> list[DueFire]:
+        """Collect every fire time at or before ``now``.
+
+        Templates are rescheduled for their first fire time after ``now``.
+        Missed fire times are all returned under ``CATCH_UP``; under
+        ``SKIP`` only the latest one is.
+
+        Args:
+            now: Current time.
+
+        Returns:
+            Due fires ordered by fire time.
+        """
+        due: list[DueFire] = []
+        while self._heap and self._heap[0][0] <= now:
+            fire_at, generation, template_id = heapq.heappop(self._heap)
+            if self._generations.get(template_id) != generation:
+                continue
+            template = self._templates[template_id]
+            fire_times = [fire_at]
+            next_fire_at = template.schedule.next_after(fire_at)
+            while next_fire_at <= now:
+                fire_times.append(next_fire_at)
+                next_fire_at = template.schedule.next_after(next_fire_at)
+            if template.misfire_policy == MisfirePolicy.SKIP:
+                fire_times = fire_times[-1:]
+            for fire_time in fire_times:
+                DISPATCH_LAG.observe((now - fire_time).total_seconds())
+                due.append(DueFire(template=template, fire_at=fire_time))
+            heapq.heappush(self._heap, (next_fire_at, generation, template_id))
+        due.sort(key=lambda fire: fire.fire_at)
+        return due
+
+    def _discard_stale(self) -> None:
+        while self._heap:
+            _, generation, template_id = self._heap[0]
+            if self._generations.get(template_id) == generation:
+                return
+            heapq.heappop(self._heap)
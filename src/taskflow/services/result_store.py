@@ -0,0 +1,137 @@
+"""Filesystem-backed storage for job results."""
+
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from uuid import UUID
+
+from taskflow.models import JobResult
+
+DEFAULT_INLINE_LIMIT_BYTES = 64 * 1024
+DEFAULT_MAX_RESULT_BYTES = 1024 * 1024 * 1024
+DEFAULT_CHUNK_BYTES = 1024 * 1024
+
+
+class ResultTooLargeError(ValueError):
+    """Raised when a result exceeds the configured maximum size."""
+
+
+class FilesystemResultStore:
+    """Stores job results inline or as blobs under a local directory.
+
+    Results are written and read in fixed-size chunks, so neither storing
+    nor streaming a result holds more than one chunk in memory. Results up
+    to ``inline_limit`` bytes are returned inline and never touch disk.
+    """
+
+    def __init__(
+        self,
+        *,
+        root: Path,
+        inline_limit: int = DEFAULT_INLINE_LIMIT_BYTES,
+        max_size: int = DEFAULT_MAX_RESULT_BYTES,
+        chunk_size: int = DEFAULT_CHUNK_BYTES,
+    ) -> None:
+        """Create a store rooted at ``root``.
+
+        Args:
+            root: Directory blobs are written to; created if missing.
+            inline_limit: Largest result kept inline, in bytes.
+            max_size: Largest result accepted, in bytes.
+            chunk_size: Size of chunks yielded when streaming a blob.
+        """
+        self._root = root
+        self._inline_limit = inline_limit
+        self._max_size = max_size
+        self._chunk_size = chunk_size
+        self._root.mkdir(parents=True, exist_ok=True)
+
+    def save(
+        self,
+        *,
+        job_id: UUID,
+        chunks: Iterable[bytes],
+        content_type: str = "application/octet-stream",
+    ) -> JobResult:
+        """Store a result from an iterable of byte chunks.
+
+        The blob is written to a temporary file and renamed into place, so
+        a failed or oversized write never leaves a partial result visible.
+        Saving a result inline removes any blob stored for the job before.
+
+        Args:
+            job_id: Id of the job that produced the result.
+            chunks: Result body, possibly streamed in pieces.
+            content_type: MIME type of the result body.
+
+        Returns:
+            Metadata for the stored result.
+
+        Raises:
+            ResultTooLargeError: If the body exceeds ``max_size``.
+        """
+        buffered: list[bytes] = []
+        size = 0
+        chunk_iter = iter(chunks)
+        for chunk in chunk_iter:
+            size += len(chunk)
+            self._check_size(size=size)
+            buffered.append(chunk)
+            if size > self._inline_limit:
+                break
+        else:
+            # A previous, larger result for the job may have left a blob.
+            self.delete(job_id=job_id)
+            return JobResult(
+                job_id=job_id,
+                content_type=content_type,
+                size_bytes=size,
+                inline=b"".join(buffered),
+            )
+
+        path = self._blob_path(job_id=job_id)
+        partial = path.with_suffix(".partial")
+        try:
+            with partial.open("wb") as blob:
+                for chunk in buffered:
+                    blob.write(chunk)
+                for chunk in chunk_iter:
+                    size += len(chunk)
+                    self._check_size(size=size)
+                    blob.write(chunk)
+            self._check_size(size=size)
+            partial.replace(path)
+        finally:
+            partial.unlink(missing_ok=True)
+        return JobResult(job_id=job_id, content_type=content_type, size_bytes=size)
+
+    def iter_chunks(self, *, result: JobResult) -> Iterator[bytes]:
+        """Stream a stored result one chunk at a time.
+
+        Args:
+            result: Metadata returned by ``save``.
+
+        Yields:
+            Consecutive chunks of the result body.
+        """
+        if result.inline is not None:
+            yield result.inline
+            return
+        with self._blob_path(job_id=result.job_id).open("rb") as blob:
+            while chunk := blob.read(self._chunk_size):
+                yield chunk
+
+    def delete(self, *, job_id: UUID) -> None:
+        """Remove a job's blob, if any.
+
+        Args:
+            job_id: Id of the job whose result should be removed.
+        """
+        self._blob_path(job_id=job_id).unlink(missing_ok=True)
+
+    def _blob_path(self, *, job_id: UUID) -> Path:
+        return self._root / f"{job_id}.blob"
+
+    def _check_size(self, *, size: int) -> None:
+        if size > self._max_size:
+            msg = f"result is larger than the {self._max_size} byte limit"
+            raise ResultTooLargeError(msg)
@@ -0,0 +1,275 @@
+"""Execution ordering of READY jobs (SRS §2.2)."""
+
+import heapq
+from collections.abc import Iterable
+from datetime import datetime
+from uuid import UUID
+
+from taskflow.models import Job
+
+DEFAULT_RUNTIME_SECONDS = 1.0
+DEFAULT_RUNTIME_SMOOTHING = 0.2
+
+
+class RuntimeEstimates:
+    """Exponentially weighted average run time per queue."""
+
+    def __init__(
+        self,
+        *,
+        default_seconds: float = DEFAULT_RUNTIME_SECONDS,
+        smoothing: float = DEFAULT_RUNTIME_SMOOTHING,
+    ) -> None:
+        """Create estimates with no history.
+
+        Args:
+            default_seconds: Estimate for queues with no observed runs.
+            smoothing: Weight of each new observation (0-1).
+        """
+        self._default = default_seconds
+        self._smoothing = smoothing
+        self._seconds: dict[str, float] = {}
+
+    def observe(self, *, queue: str, seconds: float) -> None:
+        """Record the run time of a finished job."""
+        previous = self._seconds.get(queue)
+        self._seconds[queue] = (
+            seconds
+            if previous is None
+            else previous + self._smoothing * (seconds - previous)
+        )
+
+    def estimate(self, *, queue: str) -> float:
+        """Return the expected run time of a job in ``queue``."""
+        return self._seconds.get(queue, self._default)
+
+
+class CriticalPathIndex:
+    """Incrementally maintained remaining path length of each job.
+
+    A job's remaining path is its own estimated run time plus the longest
+    remaining path among its dependents: a lower bound on the time from
+    starting it to finishing everything downstream. With the default
+    estimates every job costs 1 and this is the downstream depth.
+
+    Adding a job only lengthens the paths of its ancestors, so updates
+    walk up from the new job and stop where a path does not grow. Adding
+    a chain one job at a time in dependency order walks the whole chain
+    for every job, so batches such as workflow submissions go through
+    ``add_many``, which computes them in one reverse-topological pass.
+    Removing a job recomputes its dependencies and walks up only while
+    paths shrink. Estimates are sampled when a job is added; later
+    observations affect jobs added afterwards.
+    """
+
+    def __init__(self, *, estimates: RuntimeEstimates | None = None) -> None:
+        """Create an empty index.
+
+        Args:
+            estimates: Per-queue run times; every job costs 1 if omitted.
+        """
+        self._estimates = estimates or RuntimeEstimates()
+        self._cost: dict[UUID, float] = {}
+        self._remaining: dict[UUID, float] = {}
+        self._dependencies: dict[UUID, list[UUID]] = {}
+        self._dependents: dict[UUID, set[UUID]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed jobs."""
+        return len(self._remaining)
+
+    def remaining(self, *, job_id: UUID) -> float:
+        """Return a job's remaining path length, or 0 if it is not indexed."""
+        return self._remaining.get(job_id, 0.0)
+
+    def add(self, *, job_id: UUID, queue: str, dependencies: Iterable[UUID]) -> None:
+        """Index a new job.
+
+        Jobs may be added in any order; dependents added before their
+        dependencies are accounted for when the dependency arrives. Use
+        ``add_many`` for jobs created together.
+
+        Args:
+            job_id: Id of the job.
+            queue: Queue of the job, for its run time estimate.
+            dependencies: Ids the job depends on.
+        """
+        cost = self._estimates.estimate(queue=queue)
+        self._cost[job_id] = cost
+        self._dependencies[job_id] = list(dependencies)
+        for dependency_id in self._dependencies[job_id]:
+            self._dependents.setdefault(dependency_id, set()).add(job_id)
+        self._remaining[job_id] = cost + max(
+            (self._remaining[d] for d in self._dependents.get(job_id, ())),
+            default=0.0,
+        )
+        self._lengthen(start=job_id)
+
+    def add_many(self, *, jobs: Iterable[Job]) -> None:
+        """Index a batch of new jobs, such as a workflow, in O(V + E).
+
+        Paths are computed from the batch's sinks back to its sources, so
+        each job is visited once regardless of the order of ``jobs``. Only
+        jobs depending on already indexed ones walk further up.
+
+        Args:
+            jobs: The new jobs.
+
+        Raises:
+            ValueError: If the batch's dependencies form a cycle; nothing
+                is indexed.
+        """
+        batch = {job.id: job for job in jobs}
+        order = _dependents_first(jobs=batch)
+        for job in batch.values():
+            self._cost[job.id] = self._estimates.estimate(queue=job.queue)
+            self._dependencies[job.id] = list(job.dependencies)
+            for dependency_id in job.dependencies:
+                self._dependents.setdefault(dependency_id, set()).add(job.id)
+        for job_id in order:
+            self._remaining[job_id] = self._cost[job_id] + max(
+                (self._remaining[d] for d in self._dependents.get(job_id, ())),
+                default=0.0,
+            )
+        for job_id in order:
+            if any(
+                d not in batch and d in self._remaining
+                for d in self._dependencies[job_id]
+            ):
+                self._lengthen(start=job_id)
+
+    def remove(self, *, job_id: UUID) -> None:
+        """Drop a completed or deleted job.
+
+        Args:
+            job_id: Id of the job.
+        """
+        if job_id not in self._remaining:
+            return
+        del self._remaining[job_id]
+        del self._cost[job_id]
+        dependencies = self._dependencies.pop(job_id)
+        for dependency_id in dependencies:
+            dependents = self._dependents.get(dependency_id)
+            if dependents is not None:
+                dependents.discard(job_id)
+                if not dependents:
+                    del self._dependents[dependency_id]
+        self._shorten(starts=dependencies)
+
+    def _lengthen(self, *, start: UUID) -> None:
+        stack = [start]
+        while stack:
+            job_id = stack.pop()
+            length = self._remaining[job_id]
+            for dependency_id in self._dependencies[job_id]:
+                current = self._remaining.get(dependency_id)
+                if current is None:
+                    continue
+                candidate = self._cost[dependency_id] + length
+                if candidate > current:
+                    self._remaining[dependency_id] = candidate
+                    stack.append(dependency_id)
+
+    def _shorten(self, *, starts: list[UUID]) -> None:
+        stack = list(starts)
+        while stack:
+            job_id = stack.pop()
+            current = self._remaining.get(job_id)
+            if current is None:
+                continue
+            recomputed = self._cost[job_id] + max(
+                (self._remaining[d] for d in self._dependents.get(job_id, ())),
+                default=0.0,
+            )
+            if recomputed < current:
+                self._remaining[job_id] = recomputed
+                stack.extend(self._dependencies[job_id])
+
+
+def _dependents_first(*, jobs: dict[UUID, Job]) -> list[UUID]:
+    pending = dict.fromkeys(jobs, 0)
+    for job in jobs.values():
+        for dependency_id in job.dependencies:
+            if dependency_id in pending:
+                pending[dependency_id] += 1
+    ready = [job_id for job_id, count in pending.items() if not count]
+    order: list[UUID] = []
+    while ready:
+        job_id = ready.pop()
+        order.append(job_id)
+        for dependency_id in jobs[job_id].dependencies:
+            if dependency_id in pending:
+                pending[dependency_id] -= 1
+                if not pending[dependency_id]:
+                    ready.append(dependency_id)
+    if len(order) < len(jobs):
+        msg = "jobs contain a dependency cycle"
+        raise ValueError(msg)
+    return order
+
+
+def sort_jobs_by_priority(
+    *,
+    jobs: Iterable[Job],
+    critical_path: CriticalPathIndex | None = None,
+) -> list[Job]:
+    """Sort jobs for execution (SRS §2.2.1).
+
+    Higher priority first, then earlier ``created_at``, then lower id.
+    With a critical path index, jobs with a longer remaining path come
+    first within a priority level, ahead of the ``created_at`` rule.
+
+    Args:
+        jobs: Jobs to order.
+        critical_path: Index enabling critical-path ordering.
+
+    Returns:
+        The jobs in execution order.
+    """
+    if critical_path is None:
+        return sorted(jobs, key=_priority_key)
+    return sorted(jobs, key=lambda job: _critical_path_key(job, critical_path))
+
+
+def select_next_jobs(
+    *,
+    ready_jobs: Iterable[Job],
+    running_count: int,
+    max_concurrent: int,
+    critical_path: CriticalPathIndex | None = None,
+) -> list[Job]:
+    """Select the READY jobs to start now (SRS §2.2.2).
+
+    Args:
+        ready_jobs: Jobs in READY status.
+        running_count: Number of jobs currently RUNNING.
+        max_concurrent: Maximum jobs allowed to run at once.
+        critical_path: Index enabling critical-path ordering.
+
+    Returns:
+        Up to ``max_concurrent - running_count`` jobs in execution order.
+    """
+    slots = max_concurrent - running_count
+    if slots <= 0:
+        return []
+    if critical_path is None:
+        return heapq.nsmallest(slots, ready_jobs, key=_priority_key)
+    return heapq.nsmallest(
+        slots, ready_jobs, key=lambda job: _critical_path_key(job, critical_path)
+    )
+
+
+def _priority_key(job: Job) -> tuple[int, datetime, UUID]:
+    return (-job.priority, job.created_at, job.id)
+
+
+def _critical_path_key(
+    job: Job, critical_path: CriticalPathIndex
+) -> tuple[int, float, datetime, UUID]:
+    return (
+        -job.priority,
+        -critical_path.remaining(job_id=job.id),
+        job.created_at,
+        job.id,
+    )
@@ -0,0 +1,181 @@
+"""Planning of whole-DAG workflow submissions."""
+
+from collections import deque
+from collections.abc import Mapping
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel
+
+from taskflow.models import Job, JobStatus, WorkflowCreateRequest
+from taskflow.models.trusted import construct_trusted
+
+from .dependency import resolve_new_job_dependencies
+
+_MAX_REPORTED_KEYS = 10
+
+
+class WorkflowCycleError(ValueError):
+    """Raised when a workflow's ``depends_on`` edges form a cycle.
+
+    Attributes:
+        keys: Keys of the jobs on or downstream of a cycle, sorted.
+    """
+
+    def __init__(self, *, keys: list[str]) -> None:
+        """Create the error.
+
+        Args:
+            keys: Keys of the jobs that could not be ordered.
+        """
+        self.keys = keys
+        shown = ", ".join(keys[:_MAX_REPORTED_KEYS])
+        more = len(keys) - _MAX_REPORTED_KEYS
+        suffix = f" and {more} more" if more > 0 else ""
+        super().__init__(f"workflow contains a cycle through: {shown}{suffix}")
+
+
+class WorkflowPlan(BaseModel):
+    """Jobs of a workflow, ready to insert in one transaction.
+
+    Once inserted, ``jobs`` go to ``CriticalPathIndex.add_many`` as one
+    batch; adding them one by one is quadratic on long chains.
+
+    Attributes:
+        jobs: New jobs in topological order; every job appears after the
+            workflow jobs it depends on.
+        ids: Map of client key to assigned job id.
+        missing: External dependencies that do not exist, in request
+            order; the workflow must be rejected if any are listed.
+    """
+
+    jobs: list[Job]
+    ids: dict[str, UUID]
+    missing: list[UUID]
+
+
+def plan_workflow(
+    *,
+    request: WorkflowCreateRequest,
+    dependency_statuses: Mapping[UUID, JobStatus],
+    now: datetime,
+) -> WorkflowPlan:
+    """Order a workflow, assign ids and compute initial statuses.
+
+    Kahn's algorithm orders the jobs in O(V + E) and detects cycles in the
+    same pass: jobs left with unmet in-degree once the queue is empty lie
+    on or behind a cycle. Statuses are then derived in that order, so a
+    job is READY only if all its dependencies are existing completed jobs,
+    BLOCKED if any dependency (existing or in the workflow) is failed or
+    blocked, and PENDING otherwise.
+
+    The request was validated at the API boundary, so jobs are built with
+    ``construct_trusted`` rather than validated a second time.
+
+    Args:
+        request: The validated workflow.
+        dependency_statuses: Statuses of the existing jobs referenced in
+            ``dependencies``, from one ``SELECT ... WHERE id = ANY($1)``.
+        now: Creation time of every job.
+
+    Returns:
+        The plan.
+
+    Raises:
+        WorkflowCycleError: If the ``depends_on`` edges contain a cycle.
+    """
+    specs = request.jobs
+    positions = {spec.key: position for position, spec in enumerate(specs)}
+    upstream = [[positions[key] for key in spec.depends_on] for spec in specs]
+    in_degree = [len(edges) for edges in upstream]
+    dependents: list[list[int]] = [[] for _ in specs]
+    for position, edges in enumerate(upstream):
+        for dependency in edges:
+            dependents[dependency].append(position)
+
+    ready = deque(position for position, degree in enumerate(in_degree) if not degree)
+    order: list[int] = []
+    while ready:
+        position = ready.popleft()
+        order.append(position)
+        for dependent in dependents[position]:
+            in_degree[dependent] -= 1
+            if not in_degree[dependent]:
+                ready.append(dependent)
+    if len(order) < len(specs):
+        raise WorkflowCycleError(
+            keys=sorted(
+                spec.key
+                for spec, degree in zip(specs, in_degree, strict=True)
+                if degree
+            )
+        )
+
+    missing = list(
+        dict.fromkeys(
+            dependency_id
+            for spec in specs
+            for dependency_id in spec.dependencies
+            if dependency_id not in dependency_statuses
+        )
+    )
+    ids = [uuid4() for _ in specs]
+    statuses: list[JobStatus] = [JobStatus.PENDING] * len(specs)
+    jobs: list[Job] = []
+    for position in order:
+        spec = specs[position]
+        edges = upstream[position]
+        status = _initial_status(
+            spec_dependencies=spec.dependencies,
+            workflow_statuses=[statuses[dependency] for dependency in edges],
+            dependency_statuses=dependency_statuses,
+        )
+        statuses[position] = status
+        jobs.append(
+            construct_trusted(
+                Job,
+                {
+                    "id": ids[position],
+                    "name": spec.name,
+                    "queue": spec.queue,
+                    "payload": spec.payload,
+                    "priority": spec.priority,
+                    "status": status,
+                    "dependencies": [
+                        *spec.dependencies,
+                        *(ids[dependency] for dependency in edges),
+                    ],
+                    "retry_policy": spec.retry_policy,
+                    "created_at": now,
+                    "updated_at": now,
+                    "attempt_count": 0,
+                },
+            )
+        )
+    return WorkflowPlan.model_construct(
+        jobs=jobs,
+        ids={spec.key: job_id for spec, job_id in zip(specs, ids, strict=True)},
+        missing=missing,
+    )
+
+
+def _initial_status(
+    *,
+    spec_dependencies: list[UUID],
+    workflow_statuses: list[JobStatus],
+    dependency_statuses: Mapping[UUID, JobStatus],
+) -> JobStatus:
+    status = JobStatus.READY
+    if spec_dependencies:
+        resolution = resolve_new_job_dependencies(
+            dependencies=spec_dependencies,
+            dependency_statuses=dependency_statuses,
+        )
+        if resolution.missing:
+            return JobStatus.PENDING
+        status = resolution.initial_status
+    if status is JobStatus.BLOCKED or JobStatus.BLOCKED in workflow_statuses:
+        return JobStatus.BLOCKED
+    if workflow_statuses:
+        return JobStatus.PENDING
+    return status
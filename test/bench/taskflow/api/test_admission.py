@@ -0,0 +1,100 @@
+import asyncio
+import time
+import typing as t
+
+import httpx
+from fastapi import FastAPI
+
+from taskflow.api.middleware import InFlightLimitMiddleware
+
+POOL_SIZE = 8
+SERVICE_SECONDS = 0.005
+REQUESTS_PER_CLIENT = 40
+
+
+def _app(*, max_inflight: int | None) -> FastAPI:
+    # The semaphore stands in for the database pool: beyond POOL_SIZE
+    # concurrent requests, work queues instead of running.
+    pool = asyncio.Semaphore(POOL_SIZE)
+    app = FastAPI()
+    if max_inflight is not None:
+        app.add_middleware(
+            InFlightLimitMiddleware, max_inflight=max_inflight, retry_after_seconds=1
+        )
+
+    @app.post("/api/v1/jobs", status_code=201)
+    async def create() -> dict[str, str]:
+        async with pool:
+            await asyncio.sleep(SERVICE_SECONDS)
+        return {"status": "pending"}
+
+    return app
+
+
+async def _drive(app: FastAPI, *, clients: int) -> tuple[list[float], int]:
+    # Raw ASGI calls keep client-side work off the shared event loop, so
+    # the latencies reflect the server rather than the load generator.
+    admitted: list[float] = []
+    rejected = 0
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/api/v1/jobs",
+        "raw_path": b"/api/v1/jobs",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "server": ("t", 80),
+    }
+
+    async def receive() -> dict[str, t.Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def client_loop() -> None:
+        nonlocal rejected
+        for _ in range(REQUESTS_PER_CLIENT):
+            status = 0
+
+            async def send(message: dict[str, t.Any]) -> None:
+                nonlocal status
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+
+            start = time.perf_counter()
+            await app(dict(scope), receive, send)
+            if status == httpx.codes.TOO_MANY_REQUESTS:
+                rejected += 1
+                await asyncio.sleep(SERVICE_SECONDS)
+            else:
+                admitted.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(client_loop() for _ in range(clients)))
+    return admitted, rejected
+
+
+def _p99(samples: list[float]) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(0.99 * (len(ordered) - 1)))]
+
+
+async def test_should_keep_admitted_latency_stable_when_overloaded_5x(bench):
+    nominal, _ = await _drive(_app(max_inflight=POOL_SIZE), clients=POOL_SIZE)
+    limited, rejected = await _drive(
+        _app(max_inflight=POOL_SIZE), clients=POOL_SIZE * 5
+    )
+    unlimited, _ = await _drive(_app(max_inflight=None), clients=POOL_SIZE * 5)
+
+    bench.record("api.admission.p99.nominal", seconds=_p99(nominal))
+    bench.record(
+        "api.admission.p99.overload_limited", seconds=_p99(limited), rejected=rejected
+    )
+    bench.record("api.admission.p99.overload_unlimited", seconds=_p99(unlimited))
+
+    assert _p99(limited) < 2 * _p99(nominal), (
+        f"Admitted p99 under 5x overload is {_p99(limited) * 1000:.1f}ms versus "
+        f"{_p99(nominal) * 1000:.1f}ms at nominal load; the in-flight limit must "
+        "shed the excess instead of queueing it."
+    )
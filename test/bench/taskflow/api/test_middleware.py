@@ -0,0 +1,46 @@
+import asyncio
+import time
+
+from taskflow.api.middleware import ProfilingMiddleware
+from taskflow.config import Settings
+from taskflow.profiling import Profiler
+
+_REQUESTS = 20_000
+
+
+async def _app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def _send(message):
+    pass
+
+
+async def _receive():
+    return {"type": "http.request"}
+
+
+async def _serve(app) -> float:
+    scope = {"type": "http", "method": "GET", "path": "/api/v1/jobs"}
+    start = time.perf_counter()
+    for _ in range(_REQUESTS):
+        await app(scope, _receive, _send)
+    return time.perf_counter() - start
+
+
+async def test_should_add_near_zero_overhead_when_profiling_disabled(bench):
+    profiler = Profiler(settings=Settings(profiling_enabled=False))
+    wrapped = ProfilingMiddleware(_app, profiler=profiler)
+    await _serve(wrapped)
+
+    bare = min([await _serve(_app) for _ in range(5)])
+    profiled = min([await _serve(wrapped) for _ in range(5)])
+    await asyncio.sleep(0)
+
+    bench.record("api.profiling_middleware.bare", seconds=bare)
+    bench.record("api.profiling_middleware.disabled", seconds=profiled)
+    per_request_us = (profiled - bare) / _REQUESTS * 1e6
+    assert per_request_us < 1, (
+        f"Disabled profiling adds {per_request_us:.2f}us per request, must be < 1us."
+    )
@@ -0,0 +1,76 @@
+import json
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from taskflow.db.mappers import rows_to_jobs
+from taskflow.models import Job
+
+SEARCH_PAGE_SIZE = 100
+
+
+def _rows(count):
+    now = datetime.now(UTC)
+    retry_policy = json.dumps(
+        {
+            "max_attempts": 3,
+            "backoff_strategy": "exponential",
+            "base_delay_seconds": 10,
+            "max_delay_seconds": 300,
+        }
+    )
+    return [
+        {
+            "id": uuid4(),
+            "name": f"job-{index}",
+            "queue": "default",
+            "payload": json.dumps({"index": index, "data": "x" * 256}),
+            "priority": index % 10 + 1,
+            "status": "ready",
+            "dependencies": [uuid4(), uuid4()],
+            "retry_policy": retry_policy,
+            "created_at": now,
+            "updated_at": now,
+            "attempt_count": 0,
+        }
+        for index in range(count)
+    ]
+
+
+def _validate_rows(rows):
+    return [
+        Job.model_validate(
+            {
+                **row,
+                "payload": json.loads(row["payload"]),
+                "retry_policy": json.loads(row["retry_policy"]),
+            }
+        )
+        for row in rows
+    ]
+
+
+@pytest.mark.parametrize(
+    ("name", "count"),
+    [("search_page", SEARCH_PAGE_SIZE), ("scheduler_load", 100_000)],
+)
+def test_should_map_rows_faster_than_validation_when_trusted(bench, name, count):
+    rows = _rows(count)
+    rounds = 200 if count == SEARCH_PAGE_SIZE else 3
+
+    validated = bench(
+        f"db.mappers.{name}.validate[{count}]",
+        lambda: _validate_rows(rows),
+        rounds=rounds,
+    )
+    trusted = bench(
+        f"db.mappers.{name}.trusted[{count}]",
+        lambda: rows_to_jobs(rows),
+        rounds=rounds,
+    )
+
+    assert trusted < validated, (
+        f"Trusted mapping ({trusted:.4f}s) must beat validation "
+        f"({validated:.4f}s) for {count} rows."
+    )
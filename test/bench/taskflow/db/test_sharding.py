@@ -0,0 +1,18 @@
+import pytest
+
+from taskflow.db.sharding import ShardRing
+
+
+@pytest.mark.parametrize("shard_count", [1, 2, 4, 8, 16])
+def test_should_route_queues_quickly_when_shards_added(bench, shard_count):
+    shards = [f"shard_{index}" for index in range(shard_count)]
+    queues = [f"queue_{index}" for index in range(10_000)]
+    lookups = queues * 10
+
+    def route():
+        ring = ShardRing(shards=shards)
+        for queue in lookups:
+            ring.shard_for(queue=queue)
+        return ring
+
+    bench(f"db.sharding.route[{shard_count}]", route)
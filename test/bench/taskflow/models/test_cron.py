@@ -0,0 +1,17 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from taskflow.models import CronSchedule
+
+
+@pytest.mark.parametrize("expression", ["* * * * *", "*/5 9-17 * * 1-5", "0 0 1 */3 *"])
+def test_should_compute_next_fire_times_when_scaled(bench, scale, expression):
+    schedule = CronSchedule.parse(expression)
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    moments = [start + timedelta(minutes=7 * index) for index in range(scale)]
+
+    bench(
+        f"models.cron.next_after[{expression}][{scale}]",
+        lambda: [schedule.next_after(moment) for moment in moments],
+    )
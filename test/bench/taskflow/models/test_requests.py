@@ -0,0 +1,22 @@
+from uuid import uuid4
+
+from taskflow.models import JobCreateRequest
+
+
+def test_should_validate_job_create_requests_when_scaled(bench, scale):
+    dependencies = [str(uuid4()) for _ in range(10)]
+    bodies = [
+        {
+            "name": f"job-{index}",
+            "queue": "default",
+            "payload": {"index": index, "data": "x" * 256},
+            "priority": index % 10 + 1,
+            "dependencies": dependencies,
+        }
+        for index in range(scale)
+    ]
+
+    bench(
+        f"models.job_create_request.validate[{scale}]",
+        lambda: [JobCreateRequest.model_validate(body) for body in bodies],
+    )
@@ -0,0 +1,18 @@
+from taskflow.models import RetryPolicy
+
+
+def test_should_validate_retry_policies_when_scaled(bench, scale):
+    rows = [
+        {
+            "max_attempts": index % 10 + 1,
+            "backoff_strategy": "exponential",
+            "base_delay_seconds": 10,
+            "max_delay_seconds": 300,
+        }
+        for index in range(scale)
+    ]
+
+    bench(
+        f"models.retry_policy.validate[{scale}]",
+        lambda: [RetryPolicy.model_validate(row) for row in rows],
+    )
@@ -0,0 +1,49 @@
+import random
+from uuid import uuid4
+
+import pytest
+
+from taskflow.models import JobStatus
+from taskflow.services.dependency import (
+    find_jobs_with_dependents,
+    resolve_new_job_dependencies,
+)
+
+
+def _random_dag(size: int) -> dict:
+    rng = random.Random(size)  # noqa: S311
+    ids = [uuid4() for _ in range(size)]
+    # Sampling positions from a range is O(k); slicing ids would be O(n).
+    return {
+        job_id: [ids[i] for i in rng.sample(range(index), min(index, 3))]
+        for index, job_id in enumerate(ids)
+    }
+
+
+def test_should_check_bulk_deletion_when_scaled(bench, scale):
+    existing_jobs = _random_dag(scale)
+    candidates = list(existing_jobs)[-max(scale // 100, 1) :]
+
+    bench(
+        f"services.dependency.find_jobs_with_dependents[{scale}]",
+        lambda: find_jobs_with_dependents(
+            job_ids=candidates, existing_jobs=existing_jobs
+        ),
+    )
+
+
+@pytest.mark.parametrize("dependency_count", [0, 10, 50])
+def test_should_resolve_new_job_dependencies_when_creating(bench, dependency_count):
+    dependencies = [uuid4() for _ in range(dependency_count)]
+    statuses = dict.fromkeys(dependencies, JobStatus.COMPLETED)
+
+    def create_many() -> None:
+        for _ in range(10_000):
+            resolve_new_job_dependencies(
+                dependencies=dependencies, dependency_statuses=statuses
+            )
+
+    bench(
+        f"services.dependency.resolve_new_job[{dependency_count}]x10000",
+        create_many,
+    )
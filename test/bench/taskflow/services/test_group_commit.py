@@ -0,0 +1,75 @@
+import asyncio
+import time
+from uuid import uuid4
+
+from taskflow.services.group_commit import (
+    CompletionBatch,
+    CompletionReport,
+    GroupCommitter,
+)
+
+WORKERS = 200
+REPORTS_PER_WORKER = 20
+COMMIT_SECONDS = 0.001
+ROW_SECONDS = 0.000002
+
+
+class _Database:
+    """Commits are serialized and dominated by the WAL flush."""
+
+    def __init__(self):
+        self._wal = asyncio.Lock()
+
+    async def apply(self, batch: CompletionBatch) -> None:
+        async with self._wal:
+            rows = len(batch.completed) + len(batch.failed)
+            await asyncio.sleep(COMMIT_SECONDS + rows * ROW_SECONDS)
+
+
+async def _run(submit) -> tuple[float, float]:
+    latencies: list[float] = []
+
+    async def worker():
+        for _ in range(REPORTS_PER_WORKER):
+            report = CompletionReport(job_id=uuid4(), succeeded=True)
+            start = time.perf_counter()
+            await submit(report)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(WORKERS)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return len(latencies) / elapsed, latencies[round(0.99 * (len(latencies) - 1))]
+
+
+async def test_should_outperform_per_job_commits_when_grouped(bench):
+    database = _Database()
+
+    async def per_job(report):
+        await database.apply(CompletionBatch.from_reports([report]))
+
+    committer = GroupCommitter(apply=database.apply)
+
+    async def grouped(report):
+        await committer.submit(report=report)
+
+    single_rate, single_p99 = await _run(per_job)
+    group_rate, group_p99 = await _run(grouped)
+
+    bench.record(
+        "services.group_commit.per_job",
+        seconds=1 / single_rate,
+        completions_per_second=single_rate,
+        p99_ack_seconds=single_p99,
+    )
+    bench.record(
+        "services.group_commit.grouped",
+        seconds=1 / group_rate,
+        completions_per_second=group_rate,
+        p99_ack_seconds=group_p99,
+    )
+    assert (group_rate > 10 * single_rate, group_p99 < single_p99) == (True, True), (
+        f"Group commit: {group_rate:.0f}/s, p99 {group_p99 * 1000:.1f}ms; "
+        f"per-job: {single_rate:.0f}/s, p99 {single_p99 * 1000:.1f}ms."
+    )
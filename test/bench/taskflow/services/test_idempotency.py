@@ -0,0 +1,28 @@
+import random
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from taskflow.services.idempotency import IdempotencyCache
+
+
+def test_should_deduplicate_submissions_when_30_percent_replayed(bench, scale):
+    rng = random.Random(scale)  # noqa: S311
+    keys = [f"key-{index}" for index in range(scale)]
+    submissions = [
+        rng.choice(keys[: index + 1]) if rng.random() < 0.3 else keys[index]
+        for index in range(scale)
+    ]
+    job_ids = [uuid4() for _ in range(scale)]
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+
+    def submit_all() -> None:
+        cache = IdempotencyCache(ttl=timedelta(hours=1))
+        for index, key in enumerate(submissions):
+            cache.claim(
+                queue="default",
+                key=key,
+                job_id=job_ids[index],
+                now=start + timedelta(milliseconds=index),
+            )
+
+    bench(f"services.idempotency.claim_30pct_duplicates[{scale}]", submit_all)
@@ -0,0 +1,43 @@
+import asyncio
+import time
+import tracemalloc
+from uuid import uuid4
+
+from taskflow.models import JobStatus
+from taskflow.services.notifications import StatusBroadcaster, StatusChange
+
+_WAITERS = 50_000
+
+
+async def test_should_fan_out_to_50k_waiters_when_notified(bench):
+    broadcaster = StatusBroadcaster()
+    job_ids = [uuid4() for _ in range(_WAITERS // 10)]
+    tracemalloc.start()
+    waiters = [
+        asyncio.create_task(
+            broadcaster.wait_for(
+                job_id=job_ids[index % len(job_ids)],
+                statuses={JobStatus.COMPLETED},
+                timeout_seconds=60,
+            )
+        )
+        for index in range(_WAITERS)
+    ]
+    await asyncio.sleep(0)
+    waiting_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for job_id in job_ids:
+        broadcaster.publish(
+            change=StatusChange(job_id=job_id, queue="q", status=JobStatus.COMPLETED)
+        )
+    await asyncio.gather(*waiters)
+    elapsed = time.perf_counter() - start
+
+    bench.record(
+        "services.notifications.fan_out[50000]",
+        seconds=elapsed,
+        bytes_per_waiter=waiting_bytes / _WAITERS,
+    )
+    assert broadcaster.waiter_count == 0
@@ -0,0 +1,22 @@
+from datetime import UTC, datetime, timedelta
+
+from taskflow.models import JobCreateRequest, RecurringJobTemplate
+from taskflow.services.recurring import RecurringScheduler
+
+
+def test_should_materialize_minutely_templates_when_scaled(bench, scale):
+    request = JobCreateRequest(name="tick", queue="default")
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    scheduler = RecurringScheduler()
+    for _ in range(scale):
+        scheduler.add(
+            template=RecurringJobTemplate(schedule="* * * * *", job=request),
+            last_fired_at=start,
+        )
+    minute = iter(range(1, 1_000))
+
+    def tick() -> None:
+        due = scheduler.pop_due(now=start + timedelta(minutes=next(minute)))
+        assert len(due) == scale
+
+    bench(f"services.recurring.pop_due[{scale}]", tick)
@@ -0,0 +1,28 @@
+import tracemalloc
+from uuid import uuid4
+
+from taskflow.services.result_store import DEFAULT_CHUNK_BYTES, FilesystemResultStore
+
+_RESULT_BYTES = 100 * 1024 * 1024
+
+
+def test_should_stream_100mb_result_in_bounded_memory(bench, tmp_path):
+    store = FilesystemResultStore(root=tmp_path)
+    chunk = b"x" * DEFAULT_CHUNK_BYTES
+    result = store.save(
+        job_id=uuid4(),
+        chunks=(chunk for _ in range(_RESULT_BYTES // len(chunk))),
+    )
+
+    def drain() -> None:
+        for _ in store.iter_chunks(result=result):
+            pass
+
+    tracemalloc.start()
+    bench("services.result_store.stream[100MB]", drain)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert peak_bytes < 4 * DEFAULT_CHUNK_BYTES, (
+        "Streaming a result must hold only a few chunks in memory at once."
+    )
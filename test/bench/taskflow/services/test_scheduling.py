@@ -0,0 +1,177 @@
+import heapq
+import random
+import time
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+
+from taskflow.models import Job
+from taskflow.services.scheduling import (
+    CriticalPathIndex,
+    RuntimeEstimates,
+    select_next_jobs,
+)
+
+WORKERS = 8
+QUEUE_RUNTIMES = {"fast": 1.0, "medium": 3.0, "slow": 8.0}
+EPOCH = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+class _Workload:
+    def __init__(self):
+        self.jobs: list[Job] = []
+        self.dependencies: dict[UUID, list[UUID]] = {}
+
+    def add(self, *, queue: str, dependencies: list[UUID]) -> UUID:
+        job = Job(
+            name=f"job-{len(self.jobs)}",
+            queue=queue,
+            created_at=EPOCH + timedelta(microseconds=len(self.jobs)),
+        )
+        self.jobs.append(job)
+        self.dependencies[job.id] = dependencies
+        return job.id
+
+
+def _chains_behind_leaves(rng: random.Random) -> _Workload:
+    # Old independent work queued ahead of a few long chains: the FIFO
+    # tie-breaker drains the leaves first and starts the chains late.
+    workload = _Workload()
+    for _ in range(400):
+        workload.add(queue=rng.choice(list(QUEUE_RUNTIMES)), dependencies=[])
+    for _ in range(WORKERS // 2):
+        previous: list[UUID] = []
+        for _ in range(40):
+            previous = [workload.add(queue="medium", dependencies=previous)]
+    return workload
+
+
+def _random_layers(rng: random.Random) -> _Workload:
+    workload = _Workload()
+    layer: list[UUID] = []
+    for _ in range(30):
+        width = rng.randint(1, 40)
+        layer = [
+            workload.add(
+                queue=rng.choice(list(QUEUE_RUNTIMES)),
+                dependencies=rng.sample(layer, min(len(layer), rng.randint(0, 3))),
+            )
+            for _ in range(width)
+        ]
+    return workload
+
+
+def _makespan(workload: _Workload, *, critical_path: bool) -> float:
+    estimates = RuntimeEstimates()
+    for queue, seconds in QUEUE_RUNTIMES.items():
+        estimates.observe(queue=queue, seconds=seconds)
+    index = CriticalPathIndex(estimates=estimates) if critical_path else None
+    by_id = {job.id: job for job in workload.jobs}
+    waiting = {job_id: len(deps) for job_id, deps in workload.dependencies.items()}
+    dependents: dict[UUID, list[UUID]] = {}
+    for job_id, dependencies in workload.dependencies.items():
+        if index is not None:
+            index.add(
+                job_id=job_id, queue=by_id[job_id].queue, dependencies=dependencies
+            )
+        for dependency_id in dependencies:
+            dependents.setdefault(dependency_id, []).append(job_id)
+    ready = {job_id: by_id[job_id] for job_id, count in waiting.items() if not count}
+    running: list[tuple[float, UUID]] = []
+    now = 0.0
+    while ready or running:
+        for job in select_next_jobs(
+            ready_jobs=ready.values(),
+            running_count=len(running),
+            max_concurrent=WORKERS,
+            critical_path=index,
+        ):
+            del ready[job.id]
+            heapq.heappush(running, (now + QUEUE_RUNTIMES[job.queue], job.id))
+        now, finished = heapq.heappop(running)
+        if index is not None:
+            index.remove(job_id=finished)
+        for dependent in dependents.get(finished, ()):
+            waiting[dependent] -= 1
+            if not waiting[dependent]:
+                ready[dependent] = by_id[dependent]
+    return now
+
+
+@pytest.mark.parametrize(
+    ("shape", "build", "required_gain"),
+    [
+        ("chains_behind_leaves", _chains_behind_leaves, 0.15),
+        ("random_layers", _random_layers, 0.0),
+    ],
+)
+def test_should_shorten_makespan_when_critical_path_enabled(
+    bench, shape, build, required_gain
+):
+    workload = build(random.Random(0))  # noqa: S311
+
+    start = time.perf_counter()
+    baseline = _makespan(workload, critical_path=False)
+    critical = _makespan(workload, critical_path=True)
+    elapsed = time.perf_counter() - start
+    gain = 1 - critical / baseline
+
+    bench.record(
+        f"services.scheduling.makespan[{shape}]",
+        seconds=elapsed,
+        priority_makespan=baseline,
+        critical_path_makespan=critical,
+        gain=gain,
+    )
+    assert gain >= required_gain, (
+        f"{shape}: critical-path makespan {critical:.0f} vs {baseline:.0f} with "
+        f"priority ordering ({gain:.0%} gain, need {required_gain:.0%})."
+    )
+
+
+def _index_edges(*, shape: str, ids: list[UUID]) -> list[list[UUID]]:
+    if shape == "chain":
+        return [[], *([dependency] for dependency in ids[:-1])]
+    rng = random.Random(0)  # noqa: S311
+    # Sampling positions rather than slicing ids keeps setup O(n).
+    return [
+        [ids[position] for position in rng.sample(range(index), min(index, 3))]
+        for index in range(len(ids))
+    ]
+
+
+@pytest.mark.parametrize("shape", ["random", "chain"])
+def test_should_index_workflow_quickly_when_scaled(bench, scale, shape):
+    ids = [uuid4() for _ in range(scale)]
+    jobs = [
+        Job.model_construct(id=job_id, queue="default", dependencies=dependencies)
+        for job_id, dependencies in zip(
+            ids, _index_edges(shape=shape, ids=ids), strict=True
+        )
+    ]
+
+    def build_and_drain():
+        index = CriticalPathIndex()
+        index.add_many(jobs=jobs)
+        for job_id in ids:
+            index.remove(job_id=job_id)
+
+    bench(
+        f"services.scheduling.critical_path_index.add_many[{shape},{scale}]",
+        build_and_drain,
+    )
+
+
+def test_should_update_index_quickly_when_scaled(bench, scale):
+    ids = [uuid4() for _ in range(scale)]
+    edges = _index_edges(shape="random", ids=ids)
+
+    def build_and_drain():
+        index = CriticalPathIndex()
+        for job_id, dependencies in zip(ids, edges, strict=True):
+            index.add(job_id=job_id, queue="default", dependencies=dependencies)
+        for job_id in ids:
+            index.remove(job_id=job_id)
+
+    bench(f"services.scheduling.critical_path_index[{scale}]", build_and_drain)
@@ -0,0 +1,60 @@
+import random
+import tracemalloc
+from datetime import UTC, datetime
+
+from taskflow.models import WorkflowCreateRequest
+from taskflow.services.workflow import plan_workflow
+
+NODES = 100_000
+
+
+def _body(count: int) -> dict:
+    rng = random.Random(0)  # noqa: S311
+    jobs = []
+    for index in range(count):
+        upstream = rng.sample(range(index), min(index, 3))
+        jobs.append(
+            {
+                "key": f"job-{index}",
+                "name": f"job-{index}",
+                "queue": "default",
+                "depends_on": [f"job-{position}" for position in upstream],
+            }
+        )
+    rng.shuffle(jobs)
+    return {"jobs": jobs}
+
+
+def test_should_plan_large_workflows_when_scaled(bench, scale):
+    request = WorkflowCreateRequest.model_validate(_body(scale))
+    now = datetime.now(UTC)
+
+    bench(
+        f"services.workflow.plan[{scale}]",
+        lambda: plan_workflow(request=request, dependency_statuses={}, now=now),
+    )
+
+
+def test_should_bound_planning_memory_when_100k_nodes(bench):
+    body = _body(NODES)
+
+    validate = bench(
+        f"services.workflow.validate[{NODES}]",
+        lambda: WorkflowCreateRequest.model_validate(body),
+        rounds=1,
+    )
+    request = WorkflowCreateRequest.model_validate(body)
+    tracemalloc.start()
+    plan_workflow(request=request, dependency_statuses={}, now=datetime.now(UTC))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    bench.record(
+        f"services.workflow.plan_peak_memory[{NODES}]",
+        seconds=validate,
+        peak_bytes=peak,
+    )
+
+    assert peak < 2048 * NODES, (
+        f"Planning {NODES} jobs peaked at {peak / 2**20:.0f}MiB; more than "
+        "2KiB per planned job."
+    )
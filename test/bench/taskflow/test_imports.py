@@ -0,0 +1,25 @@
+import statistics
+
+import pytest
+
+# Generous ceilings on top of pydantic's own import cost; the baseline
+# comparison catches smaller regressions.
+STARTUP_BUDGET_SECONDS = {
+    "taskflow.models": 0.01,
+    "taskflow.db.mappers": 0.5,
+    "taskflow.services.dependency": 0.5,
+    "taskflow.services.recurring": 0.5,
+    "taskflow.api.middleware": 1.0,
+}
+
+
+@pytest.mark.parametrize("module", sorted(STARTUP_BUDGET_SECONDS))
+def test_should_import_within_budget_when_cold(bench, import_profile, module):
+    samples = [import_profile(module).total_us / 1e6 for _ in range(5)]
+    actual = statistics.median(samples)
+    bench.record(f"startup.import[{module}]", seconds=actual, best=min(samples))
+
+    assert actual < STARTUP_BUDGET_SECONDS[module], (
+        f"Cold import of {module} took {actual * 1000:.1f}ms, over its "
+        f"{STARTUP_BUDGET_SECONDS[module] * 1000:.0f}ms budget."
+    )
@@ -0,0 +1,68 @@
+"""Run the application image against the PostgreSQL testcontainer."""
+
+import time
+from collections.abc import Generator
+
+import httpx
+import pytest
+from testcontainers.core.container import DockerContainer
+
+_APP_PORT = 8000
+_STARTUP_TIMEOUT_SECONDS = 60
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register options selecting the application under test."""
+    group = parser.getgroup("app", "application under test")
+    group.addoption(
+        "--image_name",
+        help="Docker image of the application, built by scripts/build.py.",
+    )
+    group.addoption(
+        "--app-base-url",
+        help="Use an already running application instead of the image.",
+    )
+
+
+@pytest.fixture(scope="session")
+def app_base_url(
+    request: pytest.FixtureRequest,
+) -> Generator[str]:
+    """Provide the base URL of a running application.
+
+    Uses ``--app-base-url`` when given; otherwise starts ``--image_name``
+    on the host network, pointed at the session PostgreSQL container.
+
+    Yields:
+        The application base URL.
+    """
+    base_url: str | None = request.config.getoption("--app-base-url")
+    if base_url:
+        yield base_url
+        return
+    image_name: str | None = request.config.getoption("--image_name")
+    if not image_name:
+        pytest.skip("requires --image_name or --app-base-url")
+    postgres_dsn: str = request.getfixturevalue("postgres_dsn")
+    container = (
+        DockerContainer(image_name)
+        .with_env("TASKFLOW_DATABASE_URL", postgres_dsn)
+        .with_kwargs(network_mode="host")
+    )
+    with container:
+        base_url = f"http://localhost:{_APP_PORT}"
+        _wait_until_healthy(base_url=base_url)
+        yield base_url
+
+
+def _wait_until_healthy(*, base_url: str) -> None:
+    deadline = time.monotonic() + _STARTUP_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health").status_code == httpx.codes.OK:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.5)
+    msg = f"application at {base_url} did not become healthy"
+    raise TimeoutError(msg)
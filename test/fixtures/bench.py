@@ -0,0 +1,188 @@
+"""Benchmark fixtures with JSON output and baseline regression checks."""
+
+import json
+import platform
+import statistics
+import time
+import typing as t
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+_RESULTS_KEY = pytest.StashKey[dict[str, dict[str, float]]]()
+_BASELINE_KEY = pytest.StashKey[dict[str, dict[str, float]] | None]()
+
+
+class BenchRunner:
+    """Times callables and records the results for the session report."""
+
+    def __init__(self, *, results: dict[str, dict[str, float]], rounds: int) -> None:
+        self._results = results
+        self._rounds = rounds
+
+    def __call__(
+        self,
+        name: str,
+        func: Callable[[], t.Any],
+        *,
+        rounds: int | None = None,
+    ) -> float:
+        """Run ``func`` repeatedly and record its best wall time.
+
+        Args:
+            name: Unique benchmark name, stable across runs.
+            func: Zero-argument callable to time.
+            rounds: Repetitions; defaults to ``--bench-rounds``.
+
+        Returns:
+            The best observed duration in seconds.
+        """
+        timings: list[float] = []
+        for _ in range(rounds or self._rounds):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        best = min(timings)
+        self.record(
+            name,
+            seconds=best,
+            mean_seconds=statistics.fmean(timings),
+            rounds=len(timings),
+        )
+        return best
+
+    def record(self, name: str, *, seconds: float, **extra: float) -> None:
+        """Record an externally measured result, e.g. from async code.
+
+        Args:
+            name: Unique benchmark name, stable across runs.
+            seconds: Duration compared against the baseline.
+            **extra: Additional figures stored in the report only.
+        """
+        self._results[name] = {"best_seconds": seconds, **extra}
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register benchmark command line options."""
+    group = parser.getgroup("bench", "benchmarks")
+    group.addoption("--bench", action="store_true", help="Run benchmarks.")
+    group.addoption(
+        "--bench-max-scale",
+        type=int,
+        default=5,
+        help="Largest problem size exponent (10^N) for scaled benchmarks.",
+    )
+    group.addoption("--bench-rounds", type=int, default=3)
+    group.addoption("--bench-output", type=Path, help="Write results as JSON.")
+    group.addoption("--bench-baseline", type=Path, help="Compare with a saved run.")
+    group.addoption(
+        "--bench-threshold",
+        type=float,
+        default=0.2,
+        help="Allowed slowdown versus the baseline (0.2 = 20%%).",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Create the session-wide results store and load the baseline.
+
+    The baseline is read up front, so ``--bench-baseline`` may name the
+    same file as ``--bench-output``: the run is compared with the previous
+    one before the file is overwritten.
+
+    Raises:
+        pytest.UsageError: If the baseline file does not exist.
+    """
+    config.stash[_RESULTS_KEY] = {}
+    baseline_path: Path | None = config.getoption("--bench-baseline")
+    if baseline_path is not None and not baseline_path.exists():
+        msg = f"--bench-baseline {baseline_path} does not exist"
+        raise pytest.UsageError(msg)
+    config.stash[_BASELINE_KEY] = (
+        json.loads(baseline_path.read_text())["benchmarks"]
+        if baseline_path is not None
+        else None
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize ``scale`` over 10^3 up to 10^--bench-max-scale."""
+    if "scale" in metafunc.fixturenames:
+        max_exponent = metafunc.config.getoption("--bench-max-scale")
+        scales = [10**exponent for exponent in range(3, max_exponent + 1)]
+        metafunc.parametrize(
+            "scale", scales, ids=[f"1e{len(str(s)) - 1}" for s in scales]
+        )
+
+
+@pytest.fixture()
+def bench(request: pytest.FixtureRequest) -> BenchRunner:
+    """Provide a benchmark runner; skips unless ``--bench`` is given.
+
+    Returns:
+        A runner recording results for the session report.
+    """
+    if not request.config.getoption("--bench"):
+        pytest.skip("benchmarks run via scripts/test.py bench")
+    return BenchRunner(
+        results=request.config.stash[_RESULTS_KEY],
+        rounds=request.config.getoption("--bench-rounds"),
+    )
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """Write the results file and fail the run on baseline regressions."""
+    config = session.config
+    results = config.stash[_RESULTS_KEY]
+    if not results:
+        return
+    output: Path | None = config.getoption("--bench-output")
+    if output is not None:
+        report = {"python": platform.python_version(), "benchmarks": results}
+        output.write_text(json.dumps(report, indent=2, sort_keys=True))
+
+    baseline = config.stash[_BASELINE_KEY]
+    if baseline is None:
+        return
+    threshold: float = config.getoption("--bench-threshold")
+    regressions = find_regressions(
+        results=results, baseline=baseline, threshold=threshold
+    )
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    for line in regressions:
+        if reporter is not None:
+            reporter.write_line(f"REGRESSION {line}", red=True)
+    if regressions and exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def find_regressions(
+    *,
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    """List benchmarks slower than the baseline by more than ``threshold``.
+
+    Args:
+        results: Current results keyed by benchmark name.
+        baseline: Saved results keyed by benchmark name.
+        threshold: Allowed relative slowdown.
+
+    Returns:
+        One description per regressed benchmark; benchmarks missing from
+        the baseline, or with a non-positive baseline time, are skipped.
+    """
+    regressions: list[str] = []
+    for name, current in sorted(results.items()):
+        previous = baseline.get(name)
+        if previous is None or previous["best_seconds"] <= 0:
+            continue
+        ratio = current["best_seconds"] / previous["best_seconds"]
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{name}: {previous['best_seconds']:.6f}s -> "
+                f"{current['best_seconds']:.6f}s ({ratio:.2f}x)"
+            )
+    return regressions
@@ -0,0 +1,79 @@
+"""Fixtures measuring module import cost in a fresh interpreter."""
+
+import os
+import subprocess
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+import taskflow
+
+_SOURCE_ROOT = Path(taskflow.__file__).resolve().parents[1]
+
+
+@dataclass(frozen=True)
+class ImportProfile:
+    """Modules loaded by one import and what they cost.
+
+    Attributes:
+        modules: Every module imported, keyed by dotted name, with its
+            cumulative import time in microseconds.
+        total_us: Cumulative time of the top-level imports, in microseconds.
+    """
+
+    modules: dict[str, int]
+    total_us: int
+
+    def loaded(self, package: str) -> bool:
+        """Check whether a package or any of its submodules was imported."""
+        return any(
+            name == package or name.startswith(f"{package}.") for name in self.modules
+        )
+
+
+def profile_import(module: str) -> ImportProfile:
+    """Import ``module`` in a new interpreter under ``-X importtime``.
+
+    Args:
+        module: Dotted module name.
+
+    Returns:
+        The modules imported after interpreter startup.
+    """
+    env = {**os.environ, "PYTHONPATH": str(_SOURCE_ROOT)}
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    modules: dict[str, int] = {}
+    total_us = 0
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, raw_name = line.removeprefix("import time:").split("|")
+        name = raw_name.strip()
+        if name == "site":
+            # Everything up to here is interpreter startup
+            modules.clear()
+            total_us = 0
+            continue
+        modules[name] = int(cumulative)
+        if not raw_name.startswith("  "):
+            total_us += int(cumulative)
+    return ImportProfile(modules=modules, total_us=total_us)
+
+
+@pytest.fixture()
+def import_profile() -> Callable[[str], ImportProfile]:
+    """Provide a function profiling a module import in a fresh interpreter.
+
+    Returns:
+        ``profile_import``.
+    """
+    return profile_import
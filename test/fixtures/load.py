@@ -0,0 +1,68 @@
+"""Options and fixtures for API load tests."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+_SUMMARY_KEY = pytest.StashKey[list[str]]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register load test command line options."""
+    group = parser.getgroup("load", "API load tests")
+    group.addoption("--load", action="store_true", help="Run load tests.")
+    group.addoption("--load-requests", type=int, default=5_000)
+    group.addoption("--load-concurrency", type=int, default=32)
+    group.addoption(
+        "--load-report-dir",
+        type=Path,
+        default=Path("load_reports"),
+        help="Directory load test reports are written to.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Create the session-wide load summary."""
+    config.stash[_SUMMARY_KEY] = []
+
+
+@pytest.fixture()
+def load_settings(request: pytest.FixtureRequest) -> dict[str, int | Path]:
+    """Provide load test parameters; skips unless ``--load`` is given.
+
+    Returns:
+        Request count, concurrency and report directory.
+    """
+    if not request.config.getoption("--load"):
+        pytest.skip("load tests run via scripts/test.py load")
+    return {
+        "requests": request.config.getoption("--load-requests"),
+        "concurrency": request.config.getoption("--load-concurrency"),
+        "report_dir": request.config.getoption("--load-report-dir"),
+    }
+
+
+@pytest.fixture()
+def load_summary(request: pytest.FixtureRequest) -> Callable[[str], None]:
+    """Provide a callback adding a line to the end-of-run load summary.
+
+    Lines are written by the terminal reporter after the run, where output
+    capture no longer swallows them.
+
+    Returns:
+        A function appending one summary line.
+    """
+    return request.config.stash[_SUMMARY_KEY].append
+
+
+def pytest_terminal_summary(
+    terminalreporter: pytest.TerminalReporter, exitstatus: int, config: pytest.Config
+) -> None:
+    """Write the throughput summary of every load scenario that ran."""
+    lines = config.stash[_SUMMARY_KEY]
+    if not lines:
+        return
+    terminalreporter.section("load")
+    for line in lines:
+        terminalreporter.write_line(line)
@@ -0,0 +1,58 @@
+from collections.abc import AsyncGenerator
+
+import asyncpg
+import pytest
+
+from taskflow.config import Settings
+from taskflow.db.sharding import ShardedPools
+
+SHARD_COUNT = 3
+
+
+@pytest.fixture()
+async def sharded_pools(postgres_dsn: str) -> AsyncGenerator[ShardedPools]:
+    base, _, _ = postgres_dsn.rpartition("/")
+    admin = await asyncpg.connect(dsn=postgres_dsn)
+    names = [f"shard_{index}" for index in range(SHARD_COUNT)]
+    for name in names:
+        await admin.execute(f"DROP DATABASE IF EXISTS {name}")
+        await admin.execute(f"CREATE DATABASE {name}")
+    await admin.close()
+
+    pools = ShardedPools(
+        settings=Settings(
+            shard_urls={name: f"{base}/{name}" for name in names},
+            database_pool_min_size=1,
+            database_pool_max_size=2,
+        )
+    )
+    await pools.connect()
+    for pool in pools.pools_for():
+        await pool.execute("CREATE TABLE jobs (queue TEXT NOT NULL, name TEXT)")
+    yield pools
+    await pools.disconnect()
+
+
+async def test_should_store_queue_on_its_shard_when_routed(sharded_pools):
+    queues = [f"queue_{index}" for index in range(30)]
+    for queue in queues:
+        await sharded_pools.pool_for(queue=queue).execute(
+            "INSERT INTO jobs (queue, name) VALUES ($1, 'job')", queue
+        )
+
+    actual = {}
+    for pool in sharded_pools.pools_for():
+        rows = await pool.fetch("SELECT DISTINCT queue FROM jobs")
+        for row in rows:
+            actual[row["queue"]] = pool
+    expected = {queue: sharded_pools.pool_for(queue=queue) for queue in queues}
+
+    assert actual == expected, "Every queue must be stored only on its own shard."
+
+
+async def test_should_visit_only_owning_shards_when_search_filtered(sharded_pools):
+    expected = {sharded_pools.pool_for(queue="builds")}
+
+    actual = set(sharded_pools.pools_for(queues=["builds"]))
+
+    assert actual == expected, "A search filtered by queue must hit one shard."
@@ -0,0 +1,206 @@
+"""Asynchronous load generator and report for the TaskFlow HTTP API."""
+
+import asyncio
+import json
+import random
+import statistics
+import time
+import typing as t
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from uuid import UUID
+
+import httpx
+
+from .workload import (
+    JobPool,
+    Operation,
+    Scenario,
+    choose_dependencies,
+    choose_operation,
+    create_body,
+)
+
+JOBS_PATH = "/api/v1/jobs"
+
+
+@dataclass
+class LoadReport:
+    """Latency samples and status codes collected during a run."""
+
+    scenario: str
+    concurrency: int
+    elapsed_seconds: float = 0.0
+    latencies: dict[Operation, list[float]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    statuses: dict[Operation, dict[int, int]] = field(
+        default_factory=lambda: defaultdict(lambda: defaultdict(int))
+    )
+
+    @property
+    def total_requests(self) -> int:
+        """Number of requests issued."""
+        return sum(len(samples) for samples in self.latencies.values())
+
+    @property
+    def server_errors(self) -> int:
+        """Number of 5xx responses."""
+        return sum(
+            count
+            for codes in self.statuses.values()
+            for code, count in codes.items()
+            if code >= 500
+        )
+
+    def success_ratio(self, *, operation: Operation) -> float:
+        """Fraction of an operation's responses that were 2xx.
+
+        Returns:
+            The ratio, or 0.0 if the operation was never issued.
+        """
+        codes = self.statuses[operation]
+        total = sum(codes.values())
+        succeeded = sum(count for code, count in codes.items() if code < 300)
+        return succeeded / total if total else 0.0
+
+    def summary(self) -> dict[str, t.Any]:
+        """Summarize throughput and latency percentiles per operation."""
+        operations = {
+            operation.value: {
+                "count": len(samples),
+                "p50_ms": _percentile(samples, 50) * 1000,
+                "p90_ms": _percentile(samples, 90) * 1000,
+                "p99_ms": _percentile(samples, 99) * 1000,
+                "max_ms": max(samples) * 1000,
+                "mean_ms": statistics.fmean(samples) * 1000,
+                "statuses": dict(self.statuses[operation]),
+                "success_ratio": self.success_ratio(operation=operation),
+            }
+            for operation, samples in self.latencies.items()
+            if samples
+        }
+        return {
+            "scenario": self.scenario,
+            "concurrency": self.concurrency,
+            "elapsed_seconds": self.elapsed_seconds,
+            "total_requests": self.total_requests,
+            "throughput_rps": self.total_requests / self.elapsed_seconds
+            if self.elapsed_seconds
+            else 0.0,
+            "server_errors": self.server_errors,
+            "operations": operations,
+        }
+
+    def save(self, *, directory: Path) -> Path:
+        """Write the summary as JSON into ``directory``.
+
+        Returns:
+            Path of the written report.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+        path = directory / f"{self.scenario}-{stamp}.json"
+        path.write_text(json.dumps(self.summary(), indent=2))
+        return path
+
+
+async def run_load(
+    *,
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    requests: int,
+    concurrency: int,
+    seed: int = 0,
+) -> LoadReport:
+    """Drive ``requests`` API calls from ``concurrency`` concurrent workers.
+
+    Args:
+        client: Client bound to the API base URL.
+        scenario: Operation mix, DAG shape and payload size.
+        requests: Total number of requests to issue.
+        concurrency: Number of concurrent workers.
+        seed: Seed for reproducible operation sequences.
+
+    Returns:
+        The collected report.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    session = _LoadSession(
+        client=client,
+        scenario=scenario,
+        rng=rng,
+        pool=JobPool(rng=rng),
+        report=LoadReport(scenario=scenario.name, concurrency=concurrency),
+    )
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        for sequence in remaining:
+            await session.issue(sequence=sequence)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    session.report.elapsed_seconds = time.perf_counter() - start
+    return session.report
+
+
+@dataclass
+class _LoadSession:
+    client: httpx.AsyncClient
+    scenario: Scenario
+    rng: random.Random
+    pool: JobPool
+    report: LoadReport
+
+    async def issue(self, *, sequence: int) -> None:
+        operation = choose_operation(scenario=self.scenario, rng=self.rng)
+        target = self.pool.pick()
+        if target is None:
+            operation = Operation.CREATE
+        dependencies: list[UUID] = []
+        start = time.perf_counter()
+        match operation:
+            case Operation.CREATE:
+                dependencies = choose_dependencies(
+                    scenario=self.scenario, pool=self.pool, rng=self.rng
+                )
+                body = create_body(
+                    scenario=self.scenario,
+                    sequence=sequence,
+                    dependencies=dependencies,
+                    rng=self.rng,
+                )
+                response = await self.client.post(JOBS_PATH, json=body)
+            case Operation.GET:
+                response = await self.client.get(f"{JOBS_PATH}/{target}")
+            case Operation.UPDATE:
+                priority = self.rng.randint(1, 10)
+                response = await self.client.put(
+                    f"{JOBS_PATH}/{target}", json={"priority": priority}
+                )
+            case Operation.SEARCH:
+                queue = f"load_{self.rng.randrange(self.scenario.queues)}"
+                response = await self.client.get(JOBS_PATH, params={"queue": queue})
+            case Operation.DELETE:
+                deletable = self.pool.pop_deletable()
+                if deletable is None:
+                    return
+                start = time.perf_counter()
+                response = await self.client.delete(f"{JOBS_PATH}/{deletable}")
+        self.report.latencies[operation].append(time.perf_counter() - start)
+        self.report.statuses[operation][response.status_code] += 1
+        if (
+            operation is Operation.CREATE
+            and response.status_code == httpx.codes.CREATED
+        ):
+            job_id = UUID(response.json()["id"])
+            self.pool.add(job_id=job_id, dependencies=dependencies)
+
+
+def _percentile(samples: list[float], percent: int) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(percent / 100 * (len(ordered) - 1)))
+    return ordered[index]
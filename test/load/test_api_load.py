@@ -0,0 +1,48 @@
+import httpx
+import pytest
+
+from .runner import run_load
+from .workload import SCENARIOS, Operation
+
+# The workload only targets jobs it created and never deletes a job that
+# others depend on, so anything beyond occasional races is a broken route.
+_MIN_SUCCESS_RATIO = 0.95
+
+
+# The image under test is built from the repository Dockerfile, which
+# serves ``main:app`` and copies ``assets/config/``; neither exists in this
+# tree yet, so these tests need an image that serves the TaskFlow API.
+@pytest.mark.timeout(0)
+@pytest.mark.parametrize("scenario", SCENARIOS, ids=lambda s: s.name)
+async def test_should_serve_workload_without_server_errors(
+    scenario, load_settings, load_summary, app_base_url
+):
+    limits = httpx.Limits(max_connections=load_settings["concurrency"])
+    async with httpx.AsyncClient(base_url=app_base_url, limits=limits) as client:
+        report = await run_load(
+            client=client,
+            scenario=scenario,
+            requests=load_settings["requests"],
+            concurrency=load_settings["concurrency"],
+        )
+    path = report.save(directory=load_settings["report_dir"])
+    summary = report.summary()
+
+    load_summary(f"{scenario.name}: {summary['throughput_rps']:.0f} req/s -> {path}")
+    assert summary["server_errors"] == 0, (
+        f"{scenario.name} produced {summary['server_errors']} 5xx responses; "
+        f"see {path}."
+    )
+    assert report.statuses[Operation.CREATE][httpx.codes.CREATED] > 0, (
+        f"{scenario.name} created no jobs, so the API under test does not "
+        f"serve the jobs routes; see {path}."
+    )
+    failing = {
+        operation.value: ratio
+        for operation in report.latencies
+        if (ratio := report.success_ratio(operation=operation)) < _MIN_SUCCESS_RATIO
+    }
+    assert not failing, (
+        f"{scenario.name} operations succeeded below {_MIN_SUCCESS_RATIO:.0%}: "
+        f"{failing}; see {path}."
+    )
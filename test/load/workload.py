@@ -0,0 +1,167 @@
+"""Workload definitions for API load tests."""
+
+import random
+import typing as t
+from dataclasses import dataclass, field
+from enum import Enum
+from uuid import UUID
+
+
+class Operation(str, Enum):
+    """API operations exercised by the load generator (SRS §5)."""
+
+    CREATE = "create"
+    GET = "get"
+    UPDATE = "update"
+    SEARCH = "search"
+    DELETE = "delete"
+
+
+class DagShape(str, Enum):
+    """How newly created jobs depend on previously created ones.
+
+    Values:
+        INDEPENDENT: No dependencies.
+        CHAIN: Each job depends on the previous one.
+        FAN_OUT: Every job depends on one shared root.
+        FAN_IN: Each job depends on up to 50 recent jobs.
+        RANDOM: Each job depends on up to 3 random earlier jobs.
+    """
+
+    INDEPENDENT = "independent"
+    CHAIN = "chain"
+    FAN_OUT = "fan_out"
+    FAN_IN = "fan_in"
+    RANDOM = "random"
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A named load profile.
+
+    Attributes:
+        name: Report name.
+        mix: Relative weight of each operation.
+        dag_shape: Dependency structure of created jobs.
+        payload_bytes: Approximate payload size of created jobs.
+        queues: Number of distinct queues jobs are spread over.
+    """
+
+    name: str
+    mix: dict[Operation, int]
+    dag_shape: DagShape = DagShape.INDEPENDENT
+    payload_bytes: int = 256
+    queues: int = 4
+
+
+@dataclass
+class JobPool:
+    """Jobs created so far, used to pick targets and dependencies.
+
+    Deletion candidates are jobs that no other created job depends on, so
+    deletes exercise the happy path rather than the §3.3 conflict.
+    """
+
+    rng: random.Random
+    ids: list[UUID] = field(default_factory=list)
+    depended_on: set[UUID] = field(default_factory=set)
+
+    def add(self, *, job_id: UUID, dependencies: list[UUID]) -> None:
+        """Record a created job."""
+        self.ids.append(job_id)
+        self.depended_on.update(dependencies)
+
+    def pick(self) -> UUID | None:
+        """Return a random existing job id, if any."""
+        return self.rng.choice(self.ids) if self.ids else None
+
+    def pop_deletable(self) -> UUID | None:
+        """Remove and return a job nothing depends on, if any."""
+        for _ in range(8):
+            if not self.ids:
+                return None
+            index = self.rng.randrange(len(self.ids))
+            job_id = self.ids[index]
+            if job_id not in self.depended_on:
+                self.ids[index] = self.ids[-1]
+                self.ids.pop()
+                return job_id
+        return None
+
+
+def choose_operation(*, scenario: Scenario, rng: random.Random) -> Operation:
+    """Draw the next operation according to the scenario's mix."""
+    operations = list(scenario.mix)
+    weights = [scenario.mix[operation] for operation in operations]
+    return rng.choices(operations, weights=weights)[0]
+
+
+def choose_dependencies(
+    *,
+    scenario: Scenario,
+    pool: JobPool,
+    rng: random.Random,
+) -> list[UUID]:
+    """Pick dependencies for a new job according to the DAG shape."""
+    if not pool.ids or scenario.dag_shape is DagShape.INDEPENDENT:
+        return []
+    if scenario.dag_shape is DagShape.CHAIN:
+        return [pool.ids[-1]]
+    if scenario.dag_shape is DagShape.FAN_OUT:
+        return [pool.ids[0]]
+    if scenario.dag_shape is DagShape.FAN_IN:
+        return pool.ids[-50:]
+    return rng.sample(pool.ids, min(len(pool.ids), 3))
+
+
+def create_body(
+    *,
+    scenario: Scenario,
+    sequence: int,
+    dependencies: list[UUID],
+    rng: random.Random,
+) -> dict[str, t.Any]:
+    """Build a ``JobCreateRequest`` body."""
+    return {
+        "name": f"{scenario.name}-{sequence}",
+        "queue": f"load_{sequence % scenario.queues}",
+        "payload": {"data": "x" * scenario.payload_bytes},
+        "priority": rng.randint(1, 10),
+        "dependencies": [str(d) for d in dependencies],
+    }
+
+
+SCENARIOS: tuple[Scenario, ...] = (
+    Scenario(
+        name="read_heavy",
+        mix={
+            Operation.CREATE: 10,
+            Operation.GET: 60,
+            Operation.SEARCH: 25,
+            Operation.UPDATE: 4,
+            Operation.DELETE: 1,
+        },
+    ),
+    Scenario(
+        name="write_heavy_chain",
+        mix={Operation.CREATE: 70, Operation.GET: 20, Operation.UPDATE: 10},
+        dag_shape=DagShape.CHAIN,
+    ),
+    Scenario(
+        name="fan_in_large_payload",
+        mix={Operation.CREATE: 50, Operation.GET: 30, Operation.SEARCH: 20},
+        dag_shape=DagShape.FAN_IN,
+        payload_bytes=32 * 1024,
+    ),
+    Scenario(
+        name="random_dag_churn",
+        mix={
+            Operation.CREATE: 40,
+            Operation.GET: 20,
+            Operation.SEARCH: 10,
+            Operation.UPDATE: 10,
+            Operation.DELETE: 20,
+        },
+        dag_shape=DagShape.RANDOM,
+    ),
+)
@@ -0,0 +1,245 @@
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from taskflow.api.admin import router as admin_router
+from taskflow.api.errors import queue_full_handler
+from taskflow.api.metrics import router as metrics_router
+from taskflow.api.middleware import (
+    InFlightLimitMiddleware,
+    MetricsMiddleware,
+    ProfilingMiddleware,
+)
+from taskflow.config import Settings
+from taskflow.metrics import REQUEST_LATENCY
+from taskflow.profiling import Profiler
+from taskflow.services.admission import QueueFullError
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics_router)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int) -> dict[str, int]:
+        return {"item_id": item_id}
+
+    return app
+
+
+async def test_should_label_latency_by_route_template_when_request_served():
+    transport = httpx.ASGITransport(app=_app())
+    child = REQUEST_LATENCY.labels("GET", "/items/{item_id}", "200")
+    before = child.count
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+        await client.get("/items/1")
+        await client.get("/items/2")
+
+    assert child.count - before == 2, (
+        "Requests must be grouped under the route template, not the raw path."
+    )
+
+
+async def test_should_expose_request_metrics_when_scraped():
+    transport = httpx.ASGITransport(app=_app())
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+        await client.get("/items/1")
+        response = await client.get("/metrics")
+
+    assert (
+        response.status_code,
+        'route="/items/{item_id}"' in response.text,
+    ) == (200, True), "The /metrics endpoint must expose request latency series."
+
+
+def _busy(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _profiled_app(profiler: Profiler, release: asyncio.Event) -> FastAPI:
+    app = FastAPI()
+    app.state.profiler = profiler
+    app.add_middleware(ProfilingMiddleware, profiler=profiler)
+    app.include_router(admin_router)
+
+    @app.get("/busy/{item_id}")
+    async def busy(item_id: int) -> dict[str, int]:
+        _busy(0.05)
+        return {"item_id": item_id}
+
+    @app.get("/wait")
+    async def wait() -> dict[str, bool]:
+        await release.wait()
+        return {"ok": True}
+
+    return app
+
+
+async def test_should_serve_route_profiles_when_profiling_enabled():
+    profiler = Profiler(
+        settings=Settings(
+            profiling_enabled=True,
+            profiling_sample_rate=1,
+            profiling_interval_seconds=0.001,
+        )
+    )
+    transport = httpx.ASGITransport(app=_profiled_app(profiler, asyncio.Event()))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+        await client.get("/busy/1")
+        response = await client.get("/admin/profile")
+    lines = response.text.splitlines()
+
+    assert any(
+        line.startswith("GET /busy/{item_id};") and "busy" in line for line in lines
+    ), "Sampled requests must be exposed with their handler frames."
+
+
+async def test_should_exclude_concurrent_requests_when_request_profiled():
+    profiler = Profiler(
+        settings=Settings(
+            profiling_enabled=True,
+            profiling_sample_rate=1,
+            profiling_interval_seconds=0.001,
+        )
+    )
+    release = asyncio.Event()
+    transport = httpx.ASGITransport(app=_profiled_app(profiler, release))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+        waiting = asyncio.create_task(client.get("/wait"))
+        await asyncio.sleep(0.01)
+        await client.get("/busy/1")
+        release.set()
+        await waiting
+    collapsed = profiler.collapsed()
+
+    assert "_busy" not in collapsed, (
+        "CPU work of a concurrent request must not be charged to the request "
+        f"being profiled, got:\n{collapsed}"
+    )
+
+
+async def test_should_reject_with_retry_after_when_inflight_limit_reached():
+    release = asyncio.Event()
+    app = FastAPI()
+    app.add_middleware(InFlightLimitMiddleware, max_inflight=1, retry_after_seconds=2)
+    app.include_router(metrics_router)
+
+    @app.get("/slow")
+    async def slow() -> dict[str, bool]:
+        await release.wait()
+        return {"ok": True}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+        admitted = asyncio.create_task(client.get("/slow"))
+        await asyncio.sleep(0.01)
+        rejected = await client.get("/slow")
+        scrape = await client.get("/metrics")
+        release.set()
+        await admitted
+
+    assert (
+        rejected.status_code,
+        rejected.headers.get("Retry-After"),
+        scrape.status_code,
+        admitted.result().status_code,
+    ) == (429, "2", 200, 200), (
+        "Requests over the in-flight limit must get 429 with Retry-After, "
+        "while /metrics stays reachable."
+    )
+
+
+async def test_should_not_count_waiters_when_inflight_limit_reached():
+    release = asyncio.Event()
+    app = FastAPI()
+    app.add_middleware(InFlightLimitMiddleware, max_inflight=1, retry_after_seconds=2)
+
+    @app.get("/jobs/{job_id}/wait")
+    async def wait(job_id: int) -> dict[str, int]:
+        await release.wait()
+        return {"job_id": job_id}
+
+    @app.get("/queues/{queue}/events")
+    async def stream(queue: str) -> dict[str, str]:
+        await release.wait()
+        return {"queue": queue}
+
+    @app.get("/jobs/{job_id}")
+    async def get_job(job_id: int) -> dict[str, int]:
+        return {"job_id": job_id}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+        waiters = [
+            *(asyncio.create_task(client.get(f"/jobs/{i}/wait")) for i in range(5)),
+            *(
+                asyncio.create_task(
+                    client.get(
+                        "/queues/builds/events",
+                        headers={"Accept": "text/event-stream"},
+                    )
+                )
+                for _ in range(5)
+            ),
+        ]
+        await asyncio.sleep(0.01)
+        response = await client.get("/jobs/1")
+        release.set()
+        statuses = {(await waiter).status_code for waiter in waiters}
+
+    assert (response.status_code, statuses) == (200, {200}), (
+        "Long-poll and SSE waiters must neither be rejected nor count "
+        "against the in-flight limit of short requests."
+    )
+
+
+async def test_should_count_request_when_only_header_claims_event_stream():
+    release = asyncio.Event()
+    app = FastAPI()
+    app.add_middleware(InFlightLimitMiddleware, max_inflight=1, retry_after_seconds=2)
+
+    @app.post("/jobs/events")
+    async def create() -> dict[str, bool]:
+        await release.wait()
+        return {"ok": True}
+
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Accept": "text/event-stream"}
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+        admitted = asyncio.create_task(client.post("/jobs/events", headers=headers))
+        await asyncio.sleep(0.01)
+        rejected = await client.post("/jobs/events", headers=headers)
+        release.set()
+        await admitted
+
+    assert rejected.status_code == 429, (
+        "Only GET long-poll and SSE routes may bypass the limiter; a POST "
+        "with an event-stream Accept header must still be counted."
+    )
+
+
+async def test_should_return_429_when_queue_full():
+    app = FastAPI()
+    app.add_exception_handler(QueueFullError, queue_full_handler)
+
+    @app.post("/jobs")
+    async def create() -> None:
+        raise QueueFullError(queue="builds", depth=3, limit=3, retry_after_seconds=7)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+        response = await client.post("/jobs")
+
+    assert (response.status_code, response.headers.get("Retry-After")) == (
+        429,
+        "7",
+    ), "Saturated queues must be rejected with 429 and the estimated wait."
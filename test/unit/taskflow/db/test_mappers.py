@@ -0,0 +1,115 @@
+import json
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from taskflow.db.mappers import row_to_job, row_to_retry_policy, rows_to_jobs
+from taskflow.models import BackoffStrategy, Job, JobStatus, RetryPolicy
+
+
+def _row(**overrides):
+    now = datetime(2025, 1, 1, tzinfo=UTC)
+    row = {
+        "id": uuid4(),
+        "name": "build",
+        "queue": "default",
+        "payload": json.dumps({"branch": "main"}),
+        "priority": 7,
+        "status": "ready",
+        "dependencies": [uuid4()],
+        "retry_policy": json.dumps(
+            {
+                "max_attempts": 5,
+                "backoff_strategy": "linear",
+                "base_delay_seconds": 20,
+                "max_delay_seconds": 600,
+            }
+        ),
+        "created_at": now,
+        "updated_at": now,
+        "attempt_count": 2,
+    }
+    row.update(overrides)
+    return row
+
+
+def _validated(row):
+    return Job.model_validate(
+        {
+            **row,
+            "payload": json.loads(row["payload"]),
+            "retry_policy": json.loads(row["retry_policy"]),
+        }
+    )
+
+
+def test_should_match_validated_job_when_row_mapped():
+    row = _row()
+    expected = _validated(row)
+
+    actual = row_to_job(row)
+
+    assert (actual, actual.model_dump_json()) == (
+        expected,
+        expected.model_dump_json(),
+    ), "Trusted mapping must produce the same job as full validation."
+
+
+def test_should_convert_enums_when_row_holds_raw_values():
+    actual = row_to_job(_row())
+
+    assert (actual.status, actual.retry_policy.backoff_strategy) == (
+        JobStatus.READY,
+        BackoffStrategy.LINEAR,
+    ), "Stored enum values must be mapped to their enum members."
+
+
+def test_should_accept_decoded_json_when_codec_registered():
+    row = _row(
+        payload={"branch": "main"},
+        retry_policy={
+            "max_attempts": 3,
+            "backoff_strategy": "exponential",
+            "base_delay_seconds": 10,
+            "max_delay_seconds": 300,
+        },
+    )
+
+    actual = row_to_job(row)
+
+    assert (actual.payload, actual.retry_policy) == (
+        {"branch": "main"},
+        RetryPolicy(),
+    ), "JSONB columns already decoded by a codec must be used as-is."
+
+
+def test_should_skip_validation_when_row_trusted():
+    row = _row(priority=42)
+
+    actual = row_to_job(row)
+
+    assert actual.priority == 42, (
+        "Rows from our own database are trusted and must not be re-validated."
+    )
+
+
+def test_should_mark_all_fields_set_when_retry_policy_mapped():
+    actual = row_to_retry_policy(
+        {
+            "max_attempts": 3,
+            "backoff_strategy": "fixed",
+            "base_delay_seconds": 10,
+            "max_delay_seconds": 300,
+        }
+    )
+
+    assert actual.model_fields_set == set(RetryPolicy.model_fields), (
+        "Mapped models must report every field as explicitly set."
+    )
+
+
+def test_should_preserve_order_when_rows_mapped():
+    rows = [_row(name=f"job_{index}") for index in range(3)]
+
+    actual = [job.name for job in rows_to_jobs(rows)]
+
+    assert actual == ["job_0", "job_1", "job_2"], "Jobs must follow row order."
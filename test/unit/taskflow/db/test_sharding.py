@@ -0,0 +1,134 @@
+from collections import Counter
+from uuid import uuid4
+
+import pytest
+
+from taskflow.config import DEFAULT_SHARD, Settings
+from taskflow.db.sharding import CrossShardDependencyError, ShardedPools, ShardRing
+
+SHARDS = [f"shard_{index}" for index in range(4)]
+QUEUES = [f"queue_{index}" for index in range(2000)]
+
+
+def test_should_route_queue_to_same_shard_when_ring_rebuilt():
+    expected = [ShardRing(shards=SHARDS).shard_for(queue=q) for q in QUEUES]
+
+    actual = [ShardRing(shards=SHARDS[::-1]).shard_for(queue=q) for q in QUEUES]
+
+    assert actual == expected, (
+        "Placement must depend only on the set of shards, so every process "
+        "routes a queue to the same database."
+    )
+
+
+def test_should_move_only_new_shard_share_when_shard_added():
+    before = ShardRing(shards=SHARDS)
+    after = ShardRing(shards=[*SHARDS, "shard_4"])
+
+    moved = [q for q in QUEUES if before.shard_for(queue=q) != after.shard_for(queue=q)]
+    actual = {after.shard_for(queue=q) for q in moved}
+
+    assert (actual, len(moved) < len(QUEUES) * 0.3) == ({"shard_4"}, True), (
+        "Adding a shard must only move about 1/n of the queues, all of them "
+        "onto the new shard."
+    )
+
+
+def test_should_spread_queues_evenly_when_many_queues():
+    ring = ShardRing(shards=SHARDS)
+
+    counts = Counter(ring.shard_for(queue=q) for q in QUEUES)
+    actual = max(counts.values()) / (len(QUEUES) / len(SHARDS))
+
+    assert actual < 1.25, (
+        f"The busiest shard holds {actual:.2f}x its fair share of queues."
+    )
+
+
+@pytest.mark.parametrize("shard_count", [2, 4, 8, 16])
+def test_should_scale_aggregate_capacity_when_shards_added(shard_count):
+    shards = [f"shard_{index}" for index in range(shard_count)]
+    queues = [f"queue_{index}" for index in range(10_000)]
+    ring = ShardRing(shards=shards)
+
+    counts = Counter(ring.shard_for(queue=q) for q in queues)
+    # With uniform per-queue load the busiest shard saturates first, so
+    # aggregate throughput scales by total / busiest relative to one shard.
+    actual = len(queues) / max(counts.values())
+
+    assert actual > shard_count * 0.75, (
+        f"{shard_count} shards only give a {actual:.2f}x aggregate speedup."
+    )
+
+
+def test_should_reject_ring_when_no_shards():
+    with pytest.raises(ValueError, match="at least one shard"):
+        ShardRing(shards=[])
+
+
+def test_should_reject_ring_when_shard_repeated():
+    with pytest.raises(ValueError, match="unique"):
+        ShardRing(shards=[SHARDS[0], SHARDS[0]])
+
+
+def test_should_reject_dependencies_when_on_other_shard():
+    ring = ShardRing(shards=SHARDS)
+    home = ring.shard_for(queue="builds")
+    local = next(q for q in QUEUES if ring.shard_for(queue=q) == home)
+    remote = next(q for q in QUEUES if ring.shard_for(queue=q) != home)
+    local_id, remote_id = uuid4(), uuid4()
+
+    with pytest.raises(CrossShardDependencyError) as exc_info:
+        ring.check_dependencies_colocated(
+            queue="builds",
+            dependency_queues={local_id: local, remote_id: remote},
+        )
+
+    assert exc_info.value.dependency_ids == [remote_id], (
+        "Only dependencies stored on another shard must be reported."
+    )
+
+
+def test_should_accept_dependencies_when_on_same_shard():
+    ring = ShardRing(shards=SHARDS)
+
+    ring.check_dependencies_colocated(
+        queue="builds", dependency_queues={uuid4(): "builds"}
+    )
+
+
+def test_should_keep_placement_when_shard_dsns_change():
+    settings = Settings(
+        shard_urls={shard: f"postgresql://old@{shard}/taskflow" for shard in SHARDS}
+    )
+    rotated = Settings(
+        shard_urls={shard: f"postgresql://new@{shard}-replica/jobs" for shard in SHARDS}
+    )
+    expected = [ShardedPools(settings=settings).ring.shard_for(queue=q) for q in QUEUES]
+
+    actual = [ShardedPools(settings=rotated).ring.shard_for(queue=q) for q in QUEUES]
+
+    assert actual == expected, (
+        "Changing a shard's credentials or host must not move its queues."
+    )
+
+
+def test_should_use_database_url_when_no_shards_configured():
+    settings = Settings(database_url="postgresql://primary/taskflow")
+
+    actual = settings.shard_dsns
+
+    assert actual == {DEFAULT_SHARD: "postgresql://primary/taskflow"}, (
+        "An unsharded deployment is a single shard on database_url."
+    )
+
+
+def test_should_raise_when_pool_requested_before_connect():
+    pools = ShardedPools(
+        settings=Settings(
+            shard_urls={shard: f"postgresql://{shard}/taskflow" for shard in SHARDS}
+        )
+    )
+
+    with pytest.raises(RuntimeError, match="connect"):
+        pools.pool_for(queue="builds")
@@ -0,0 +1,93 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from taskflow.models import CronSchedule
+
+
+def _at(*args: int) -> datetime:
+    return datetime(*args, tzinfo=UTC)
+
+
+def test_should_fire_next_minute_when_every_minute():
+    schedule = CronSchedule.parse("* * * * *")
+    expected = _at(2025, 1, 1, 12, 1)
+
+    actual = schedule.next_after(_at(2025, 1, 1, 12, 0, 30))
+
+    assert actual == expected, (
+        "An every-minute schedule must fire at the start of the next minute."
+    )
+
+
+def test_should_fire_strictly_after_when_moment_is_fire_time():
+    schedule = CronSchedule.parse("*/15 * * * *")
+    expected = _at(2025, 1, 1, 12, 15)
+
+    actual = schedule.next_after(_at(2025, 1, 1, 12, 0))
+
+    assert actual == expected, (
+        "next_after must never return the reference moment itself, otherwise "
+        "a template would fire twice for the same slot."
+    )
+
+
+def test_should_roll_over_to_next_day_when_hours_exhausted():
+    schedule = CronSchedule.parse("30 9-17 * * *")
+    expected = _at(2025, 1, 2, 9, 30)
+
+    actual = schedule.next_after(_at(2025, 1, 1, 17, 45))
+
+    assert actual == expected, (
+        "After the last matching hour the schedule must continue on the "
+        "next day's first matching hour."
+    )
+
+
+def test_should_match_weekdays_when_day_of_week_restricted():
+    schedule = CronSchedule.parse("0 8 * * 1-5")
+    expected = _at(2025, 1, 6, 8, 0)
+
+    actual = schedule.next_after(_at(2025, 1, 3, 9, 0))
+
+    assert actual == expected, (
+        "A Friday-after-fire reference must skip the weekend to Monday (2025-01-06)."
+    )
+
+
+def test_should_match_either_day_when_both_day_fields_restricted():
+    schedule = CronSchedule.parse("0 0 15 * 0")
+    expected = [_at(2025, 1, 5), _at(2025, 1, 12), _at(2025, 1, 15)]
+
+    actual = [
+        schedule.next_after(_at(2025, 1, 1)),
+        schedule.next_after(_at(2025, 1, 5)),
+        schedule.next_after(_at(2025, 1, 12)),
+    ]
+
+    assert actual == expected, (
+        "With both day fields restricted, cron matches the 15th OR any Sunday."
+    )
+
+
+def test_should_find_leap_day_when_schedule_is_yearly():
+    schedule = CronSchedule.parse("0 0 29 2 *")
+    expected = _at(2028, 2, 29)
+
+    actual = schedule.next_after(_at(2024, 3, 1))
+
+    assert actual == expected, "A Feb 29 schedule must fire on the next leap day."
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["* * * *", "60 * * * *", "* 24 * * *", "*/0 * * * *", "a * * * *"],
+)
+def test_should_reject_expression_when_malformed(expression):
+    with pytest.raises(ValueError, match="cron"):
+        CronSchedule.parse(expression)
+
+
+def test_should_reject_expression_when_it_never_fires():
+    with pytest.raises(ValueError, match="never fires"):
+        CronSchedule.parse("0 0 30 2 *")
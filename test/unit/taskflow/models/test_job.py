@@ -0,0 +1,45 @@
+import pytest
+from pydantic import ValidationError
+
+from taskflow.models import Job, JobStatus, RetryPolicy
+
+
+def test_should_create_with_minimal_fields_when_name_and_queue_provided():
+    actual = Job(name="build", queue="default")
+
+    assert (
+        actual.status,
+        actual.priority,
+        actual.dependencies,
+        actual.retry_policy,
+        actual.attempt_count,
+    ) == (JobStatus.PENDING, 5, [], RetryPolicy(), 0), (
+        "New jobs must default to PENDING, priority 5, no dependencies, the "
+        "default retry policy and zero attempts."
+    )
+
+
+def test_should_reject_payload_over_64kb_when_too_large():
+    with pytest.raises(ValidationError) as exc_info:
+        Job(name="build", queue="default", payload={"x": "a" * 65536})
+
+    assert "payload" in str(exc_info.value), (
+        "Payloads larger than 65536 bytes must be rejected (SRS §3.1)."
+    )
+
+
+def test_should_reject_dependencies_over_50_when_too_many():
+    with pytest.raises(ValidationError) as exc_info:
+        Job.model_validate(
+            {
+                "name": "build",
+                "queue": "default",
+                "dependencies": [
+                    f"00000000-0000-0000-0000-{index:012d}" for index in range(51)
+                ],
+            }
+        )
+
+    assert "dependencies" in str(exc_info.value), (
+        "A job may depend on at most 50 other jobs (SRS §1.1)."
+    )
@@ -0,0 +1,36 @@
+import pytest
+from pydantic import ValidationError
+
+from taskflow.models import JobCreateRequest, RetryPolicy
+
+
+def test_should_create_job_create_request_with_defaults_when_minimal():
+    actual = JobCreateRequest(name="build", queue="default")
+
+    assert (
+        actual.payload,
+        actual.priority,
+        actual.dependencies,
+        actual.retry_policy,
+    ) == ({}, 5, [], RetryPolicy()), (
+        "Omitted fields must default to an empty payload, priority 5, no "
+        "dependencies and the default retry policy."
+    )
+
+
+def test_should_reject_invalid_queue_when_special_chars():
+    with pytest.raises(ValidationError) as exc_info:
+        JobCreateRequest(name="build", queue="bad-queue!")
+
+    assert "queue" in str(exc_info.value), (
+        "Queue names are restricted to ^[a-zA-Z0-9_]{1,64}$ (SRS §3.1)."
+    )
+
+
+def test_should_reject_payload_over_64kb_when_too_large():
+    with pytest.raises(ValidationError) as exc_info:
+        JobCreateRequest(name="build", queue="default", payload={"x": "a" * 65536})
+
+    assert "payload" in str(exc_info.value), (
+        "Payloads larger than 65536 bytes must be rejected (SRS §3.1)."
+    )
@@ -0,0 +1,154 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from taskflow.config import Settings
+from taskflow.metrics import Gauge
+from taskflow.services.admission import QueueBacklog, QueueFullError
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _backlog(gauge=None, **overrides):
+    return QueueBacklog(
+        settings=Settings(
+            queue_backlog_limit=3,
+            retry_after_seconds=1,
+            max_retry_after_seconds=60,
+            **overrides,
+        ),
+        gauge=gauge or Gauge("depth", "Depth.", labels=("queue",)),
+    )
+
+
+def test_should_admit_jobs_when_under_limit():
+    backlog = _backlog()
+
+    for _ in range(3):
+        backlog.admit(queue="builds")
+
+    assert backlog.depth(queue="builds") == 3, "Admitted jobs must be counted."
+
+
+def test_should_reject_without_counting_when_queue_full():
+    backlog = _backlog()
+    for _ in range(3):
+        backlog.admit(queue="builds")
+
+    with pytest.raises(QueueFullError) as exc_info:
+        backlog.admit(queue="builds")
+
+    assert (exc_info.value.limit, backlog.depth(queue="builds")) == (3, 3), (
+        "A rejected job must not be counted against the backlog."
+    )
+
+
+def test_should_apply_queue_override_when_configured():
+    backlog = _backlog(queue_backlog_limits={"bulk": 1})
+    backlog.admit(queue="bulk")
+
+    with pytest.raises(QueueFullError):
+        backlog.admit(queue="bulk")
+
+    backlog.admit(queue="builds")
+
+
+def test_should_admit_again_when_jobs_released():
+    backlog = _backlog()
+    for _ in range(3):
+        backlog.admit(queue="builds")
+
+    backlog.release(queue="builds")
+    backlog.admit(queue="builds")
+
+    assert backlog.depth(queue="builds") == 3, (
+        "Released capacity must be available to new submissions."
+    )
+
+
+def test_should_replace_counters_when_synced():
+    backlog = _backlog()
+    backlog.admit(queue="builds")
+
+    backlog.sync(depths={"reports": 2}, now=NOW)
+
+    assert (backlog.depth(queue="builds"), backlog.depth(queue="reports")) == (
+        0,
+        2,
+    ), "Sync must replace every counter with the authoritative counts."
+
+
+def test_should_estimate_retry_after_when_queue_drained_by_other_processes():
+    backlog = _backlog()
+    backlog.sync(depths={"builds": 5}, now=NOW)
+    backlog.sync(depths={"builds": 3}, now=NOW + timedelta(seconds=10))
+
+    with pytest.raises(QueueFullError) as exc_info:
+        backlog.admit(queue="builds")
+
+    assert exc_info.value.retry_after_seconds == 5, (
+        "A queue drained from 5 to 3 jobs in 10s by workers elsewhere drains "
+        "at 0.2 jobs/s, so one job over the limit must wait 5s."
+    )
+
+
+def test_should_count_local_admissions_when_estimating_drain_rate():
+    backlog = _backlog()
+    backlog.sync(depths={"builds": 0}, now=NOW)
+    for _ in range(3):
+        backlog.admit(queue="builds")
+    backlog.sync(depths={"builds": 3}, now=NOW + timedelta(seconds=10))
+
+    with pytest.raises(QueueFullError) as exc_info:
+        backlog.admit(queue="builds")
+
+    assert exc_info.value.retry_after_seconds == 60, (
+        "Jobs admitted here and still waiting must not count as drained."
+    )
+
+
+def test_should_advertise_max_retry_after_when_queue_not_draining():
+    backlog = _backlog()
+    backlog.sync(depths={"builds": 3}, now=NOW)
+    backlog.sync(depths={"builds": 3}, now=NOW + timedelta(seconds=10))
+
+    with pytest.raises(QueueFullError) as exc_info:
+        backlog.admit(queue="builds")
+
+    assert exc_info.value.retry_after_seconds == 60, (
+        "A queue that has not drained since the last sync gets the maximum."
+    )
+
+
+def test_should_publish_depths_when_synced():
+    gauge = Gauge("depth", "Depth.", labels=("queue",))
+    backlog = _backlog(gauge)
+    backlog.admit(queue="builds")
+    backlog.sync(depths={"reports": 2}, now=NOW)
+    backlog.admit(queue="reports")
+
+    actual = gauge.render().splitlines()[2:]
+
+    assert actual == ['depth{queue="reports"} 3.0'], (
+        "The gauge must hold exactly the counters admission decides on."
+    )
+
+
+def test_should_not_create_series_when_queue_only_read_or_rejected():
+    gauge = Gauge("depth", "Depth.", labels=("queue",))
+    backlog = _backlog(gauge, queue_backlog_limits={"closed": 0})
+
+    depth = backlog.depth(queue="unknown")
+    backlog.release(queue="unknown")
+    with pytest.raises(QueueFullError):
+        backlog.admit(queue="closed")
+
+    assert (depth, gauge.render().splitlines()[2:]) == (0, []), (
+        "Client-supplied queue names must only become gauge series once a "
+        "job is admitted to them."
+    )
+
+
+def test_should_reject_settings_when_retry_after_range_inverted():
+    with pytest.raises(ValueError, match="max_retry_after_seconds"):
+        Settings(retry_after_seconds=30, max_retry_after_seconds=10)
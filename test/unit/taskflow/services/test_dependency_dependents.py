@@ -0,0 +1,37 @@
+from uuid import uuid4
+
+from taskflow.services.dependency import find_jobs_with_dependents
+
+
+def test_should_return_empty_when_no_dependents():
+    a, b = uuid4(), uuid4()
+    existing_jobs = {a: [], b: []}
+
+    actual = find_jobs_with_dependents(job_ids=[a, b], existing_jobs=existing_jobs)
+
+    assert actual == {}, "Jobs nobody depends on must be deletable (SRS §3.3)."
+
+
+def test_should_report_dependents_when_jobs_are_depended_upon():
+    a, b, c, d = uuid4(), uuid4(), uuid4(), uuid4()
+    existing_jobs = {a: [], b: [], c: [a], d: [a, b]}
+    expected = {a: {c, d}, b: {d}}
+
+    actual = find_jobs_with_dependents(job_ids=[a, b], existing_jobs=existing_jobs)
+
+    assert actual == expected, (
+        "Every requested job with a remaining dependent must be reported "
+        "together with all of its dependents in one pass."
+    )
+
+
+def test_should_ignore_dependents_when_deleted_in_same_batch():
+    a, b, c = uuid4(), uuid4(), uuid4()
+    existing_jobs = {a: [], b: [a], c: [b]}
+
+    actual = find_jobs_with_dependents(job_ids=[a, b, c], existing_jobs=existing_jobs)
+
+    assert actual == {}, (
+        "Deleting a job together with all of its dependents leaves no "
+        "dangling references and must be allowed."
+    )
@@ -0,0 +1,102 @@
+from uuid import uuid4
+
+from taskflow.models import JobStatus
+from taskflow.services.dependency import (
+    DependencyStatus,
+    check_dependency_satisfaction,
+    resolve_new_job_dependencies,
+)
+
+
+def test_should_return_satisfied_when_no_dependencies():
+    actual = check_dependency_satisfaction(dependencies=[], dependency_statuses={})
+
+    assert actual == DependencyStatus.SATISFIED, (
+        "A job without dependencies is immediately satisfied (SRS §2.1.2 rule 1)."
+    )
+
+
+def test_should_return_satisfied_when_all_completed():
+    a, b = uuid4(), uuid4()
+    statuses = {a: JobStatus.COMPLETED, b: JobStatus.COMPLETED}
+
+    actual = check_dependency_satisfaction(
+        dependencies=[a, b], dependency_statuses=statuses
+    )
+
+    assert actual == DependencyStatus.SATISFIED, (
+        "All dependencies COMPLETED must yield SATISFIED."
+    )
+
+
+def test_should_return_waiting_when_any_pending():
+    a, b = uuid4(), uuid4()
+    statuses = {a: JobStatus.COMPLETED, b: JobStatus.RUNNING}
+
+    actual = check_dependency_satisfaction(
+        dependencies=[a, b], dependency_statuses=statuses
+    )
+
+    assert actual == DependencyStatus.WAITING, (
+        "A dependency that has not finished must keep the job WAITING."
+    )
+
+
+def test_should_return_blocked_when_any_failed():
+    a, b = uuid4(), uuid4()
+    statuses = {a: JobStatus.PENDING, b: JobStatus.FAILED}
+
+    actual = check_dependency_satisfaction(
+        dependencies=[a, b], dependency_statuses=statuses
+    )
+
+    assert actual == DependencyStatus.BLOCKED, (
+        "A failed dependency must win over a waiting one (SRS §2.1.2 rule 2)."
+    )
+
+
+def test_should_report_missing_dependencies_when_not_found():
+    a, b, c = uuid4(), uuid4(), uuid4()
+    statuses = {b: JobStatus.COMPLETED}
+
+    actual = resolve_new_job_dependencies(
+        dependencies=[a, b, c], dependency_statuses=statuses
+    )
+
+    assert actual.missing == [a, c], (
+        "Every dependency absent from the status lookup must be reported, "
+        "in request order, so the API can reject the job (SRS §3.1)."
+    )
+
+
+def test_should_resolve_initial_status_when_all_dependencies_exist():
+    done, running, failed = uuid4(), uuid4(), uuid4()
+    statuses = {
+        done: JobStatus.COMPLETED,
+        running: JobStatus.RUNNING,
+        failed: JobStatus.FAILED,
+    }
+    expected = {
+        "none": JobStatus.READY,
+        "completed": JobStatus.READY,
+        "waiting": JobStatus.PENDING,
+        "blocked": JobStatus.BLOCKED,
+    }
+    cases = {
+        "none": [],
+        "completed": [done],
+        "waiting": [done, running],
+        "blocked": [running, failed],
+    }
+
+    actual = {
+        name: resolve_new_job_dependencies(
+            dependencies=deps, dependency_statuses=statuses
+        ).initial_status
+        for name, deps in cases.items()
+    }
+
+    assert actual == expected, (
+        "Initial status must be READY when satisfied, PENDING when waiting "
+        "and BLOCKED when any dependency failed."
+    )
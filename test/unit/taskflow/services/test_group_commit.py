@@ -0,0 +1,136 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from taskflow.services.group_commit import (
+    CompletionBatch,
+    CompletionReport,
+    GroupCommitter,
+)
+
+
+class _Recorder:
+    def __init__(self):
+        self.batches = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self, batch):
+        await self.release.wait()
+        self.batches.append(batch)
+
+
+async def test_should_apply_one_batch_when_reports_arrive_together():
+    apply = _Recorder()
+    committer = GroupCommitter(apply=apply, max_delay_seconds=0.01)
+    reports = [CompletionReport(job_id=uuid4(), succeeded=True) for _ in range(5)]
+
+    await asyncio.gather(*(committer.submit(report=r) for r in reports))
+
+    assert [len(b.completed) for b in apply.batches] == [5], (
+        "Reports arriving within the delay must be applied in one batch."
+    )
+
+
+async def test_should_acknowledge_only_when_batch_committed():
+    apply = _Recorder()
+    apply.release.clear()
+    committer = GroupCommitter(apply=apply, max_delay_seconds=0)
+
+    submitted = asyncio.create_task(
+        committer.submit(report=CompletionReport(job_id=uuid4(), succeeded=True))
+    )
+    await asyncio.sleep(0.01)
+    acknowledged_before_commit = submitted.done()
+    apply.release.set()
+    await submitted
+
+    assert acknowledged_before_commit is False, (
+        "Workers must not be acknowledged before the batch commits."
+    )
+
+
+async def test_should_fail_every_report_when_apply_raises():
+    async def apply(_batch):
+        msg = "commit failed"
+        raise RuntimeError(msg)
+
+    committer = GroupCommitter(apply=apply, max_delay_seconds=0.01)
+    reports = [CompletionReport(job_id=uuid4(), succeeded=True) for _ in range(3)]
+
+    actual = await asyncio.gather(
+        *(committer.submit(report=r) for r in reports), return_exceptions=True
+    )
+
+    assert [type(error) for error in actual] == [RuntimeError] * 3, (
+        "Every report of a failed batch must see the error and be resent."
+    )
+
+
+async def test_should_release_every_report_when_apply_cancelled():
+    async def apply(_batch):
+        raise asyncio.CancelledError
+
+    committer = GroupCommitter(apply=apply, max_delay_seconds=0.01)
+    reports = [CompletionReport(job_id=uuid4(), succeeded=True) for _ in range(3)]
+
+    actual = await asyncio.wait_for(
+        asyncio.gather(
+            *(committer.submit(report=r) for r in reports), return_exceptions=True
+        ),
+        timeout=1,
+    )
+
+    assert [type(error) for error in actual] == [asyncio.CancelledError] * 3, (
+        "A cancelled commit must cancel its reports instead of leaving "
+        "workers waiting forever."
+    )
+
+
+async def test_should_split_batches_when_max_size_reached():
+    apply = _Recorder()
+    committer = GroupCommitter(apply=apply, max_delay_seconds=10, max_batch_size=2)
+    reports = [CompletionReport(job_id=uuid4(), succeeded=False) for _ in range(4)]
+
+    await asyncio.wait_for(
+        asyncio.gather(*(committer.submit(report=r) for r in reports)), timeout=1
+    )
+
+    assert [len(b.failed) for b in apply.batches] == [2, 2], (
+        "Full batches must be applied immediately, without the delay."
+    )
+
+
+async def test_should_flush_without_delay_when_drained():
+    apply = _Recorder()
+    committer = GroupCommitter(apply=apply, max_delay_seconds=10)
+    submitted = asyncio.create_task(
+        committer.submit(report=CompletionReport(job_id=uuid4(), succeeded=True))
+    )
+    await asyncio.sleep(0)
+
+    await asyncio.wait_for(committer.drain(), timeout=1)
+
+    assert (submitted.done(), len(apply.batches)) == (True, 1), (
+        "drain() must apply buffered reports immediately, e.g. on shutdown."
+    )
+
+
+@pytest.mark.parametrize("last_succeeded", [True, False])
+def test_should_keep_last_report_when_job_repeated(last_succeeded):
+    job_id = uuid4()
+
+    actual = CompletionBatch.from_reports(
+        [
+            CompletionReport(job_id=job_id, succeeded=not last_succeeded),
+            CompletionReport(job_id=job_id, succeeded=last_succeeded),
+        ]
+    )
+
+    expected = (
+        CompletionBatch(completed=[job_id], failed=[])
+        if last_succeeded
+        else CompletionBatch(completed=[], failed=[job_id])
+    )
+    assert actual == expected, "A repeated job must keep its latest outcome."
@@ -0,0 +1,63 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from taskflow.services.idempotency import IdempotencyCache
+
+_NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def test_should_return_original_job_when_key_replayed():
+    cache = IdempotencyCache(ttl=timedelta(minutes=10))
+    original, retry = uuid4(), uuid4()
+    cache.claim(queue="default", key="order-1", job_id=original, now=_NOW)
+
+    actual = cache.claim(
+        queue="default", key="order-1", job_id=retry, now=_NOW + timedelta(minutes=1)
+    )
+
+    assert actual == original, (
+        "A replayed submission must resolve to the first job, not create a duplicate."
+    )
+
+
+def test_should_scope_key_to_queue_when_same_key_on_other_queue():
+    cache = IdempotencyCache()
+    first, second = uuid4(), uuid4()
+    cache.claim(queue="emails", key="k", job_id=first, now=_NOW)
+
+    actual = cache.claim(queue="reports", key="k", job_id=second, now=_NOW)
+
+    assert actual == second, "Idempotency keys are unique per queue only."
+
+
+def test_should_accept_key_again_when_ttl_elapsed():
+    cache = IdempotencyCache(ttl=timedelta(minutes=10))
+    first, second = uuid4(), uuid4()
+    cache.claim(queue="default", key="k", job_id=first, now=_NOW)
+    later = _NOW + timedelta(minutes=10)
+
+    actual = (
+        cache.lookup(queue="default", key="k", now=later),
+        cache.claim(queue="default", key="k", job_id=second, now=later),
+    )
+
+    assert actual == (None, second), (
+        "Keys must stop deduplicating once their TTL window has passed."
+    )
+
+
+def test_should_evict_expired_entries_when_time_advances():
+    cache = IdempotencyCache(ttl=timedelta(seconds=30))
+    for index in range(5):
+        cache.claim(
+            queue="default",
+            key=f"k{index}",
+            job_id=uuid4(),
+            now=_NOW + timedelta(seconds=index * 10),
+        )
+
+    cache.lookup(queue="default", key="k0", now=_NOW + timedelta(seconds=45))
+
+    assert len(cache) == 3, (
+        "Only keys claimed within the last TTL window may be retained."
+    )
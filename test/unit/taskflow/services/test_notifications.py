@@ -0,0 +1,155 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from taskflow.models import JobStatus
+from taskflow.services.notifications import StatusBroadcaster, StatusChange
+
+_TERMINAL = {JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.BLOCKED}
+
+
+async def test_should_return_change_when_job_reaches_wanted_status():
+    broadcaster = StatusBroadcaster()
+    job_id = uuid4()
+    expected = StatusChange(job_id=job_id, queue="q", status=JobStatus.COMPLETED)
+    waiter = asyncio.create_task(
+        broadcaster.wait_for(job_id=job_id, statuses=_TERMINAL, timeout_seconds=1)
+    )
+    await asyncio.sleep(0)
+
+    broadcaster.publish(
+        change=StatusChange(job_id=job_id, queue="q", status=JobStatus.RUNNING)
+    )
+    broadcaster.publish(change=expected)
+    actual = await waiter
+
+    assert (actual, broadcaster.waiter_count) == (expected, 0), (
+        "Long-poll waiters must skip intermediate statuses, return on the "
+        "first wanted one and leave no waiter registered."
+    )
+
+
+async def test_should_return_none_when_timeout_elapses():
+    broadcaster = StatusBroadcaster()
+
+    actual = await broadcaster.wait_for(
+        job_id=uuid4(), statuses=_TERMINAL, timeout_seconds=0.01
+    )
+
+    assert (actual, broadcaster.waiter_count) == (None, 0), (
+        "A timed-out waiter must return None and be unregistered."
+    )
+
+
+async def test_should_wake_every_waiter_when_one_notification_arrives():
+    broadcaster = StatusBroadcaster()
+    job_id = uuid4()
+    waiters = [
+        asyncio.create_task(
+            broadcaster.wait_for(job_id=job_id, statuses=_TERMINAL, timeout_seconds=1)
+        )
+        for _ in range(100)
+    ]
+    await asyncio.sleep(0)
+    payload = StatusChange(
+        job_id=job_id, queue="q", status=JobStatus.FAILED
+    ).model_dump_json()
+
+    broadcaster.on_notification(None, 0, "job_status", payload)
+    actual = await asyncio.gather(*waiters)
+
+    assert all(change.status == JobStatus.FAILED for change in actual), (
+        "A single LISTEN notification must fan out to all waiters of the job."
+    )
+
+
+async def test_should_stream_queue_changes_when_subscribed():
+    broadcaster = StatusBroadcaster()
+    changes = [
+        StatusChange(job_id=uuid4(), queue="emails", status=JobStatus.READY),
+        StatusChange(job_id=uuid4(), queue="reports", status=JobStatus.READY),
+        StatusChange(job_id=uuid4(), queue="emails", status=JobStatus.RUNNING),
+    ]
+    stream = broadcaster.stream(queue="emails")
+    first = asyncio.ensure_future(anext(stream))
+    await asyncio.sleep(0)
+
+    for change in changes:
+        broadcaster.publish(change=change)
+    actual = [await first, await anext(stream)]
+    await stream.aclose()
+
+    assert actual == [changes[0], changes[2]], (
+        "A queue stream must deliver only that queue's changes, in order."
+    )
+
+
+async def test_should_drop_oldest_change_when_subscriber_falls_behind():
+    broadcaster = StatusBroadcaster(stream_buffer=2)
+    job_id = uuid4()
+    stream = broadcaster.stream(job_id=job_id)
+    first = asyncio.ensure_future(anext(stream))
+    await asyncio.sleep(0)
+    broadcaster.publish(
+        change=StatusChange(job_id=job_id, queue="q", status=JobStatus.PENDING)
+    )
+    await first
+    statuses = [JobStatus.READY, JobStatus.RUNNING, JobStatus.COMPLETED]
+
+    for status in statuses:
+        broadcaster.publish(
+            change=StatusChange(job_id=job_id, queue="q", status=status)
+        )
+    actual = [(await anext(stream)).status for _ in range(2)]
+    await stream.aclose()
+
+    assert actual == statuses[1:], (
+        "Slow subscribers must keep only the newest buffered changes."
+    )
+
+
+def test_should_format_server_sent_event_when_serialized():
+    change = StatusChange(job_id=uuid4(), queue="q", status=JobStatus.READY)
+
+    actual = change.to_sse()
+
+    assert actual == f"event: status\ndata: {change.model_dump_json()}\n\n", (
+        "SSE messages must carry the change as JSON and end with a blank line."
+    )
+
+
+async def test_should_reject_stream_when_no_target_given():
+    with pytest.raises(ValueError, match="job_id or a queue"):
+        await anext(StatusBroadcaster().stream())
+
+
+async def test_should_resolve_waiter_when_change_published_before_await():
+    broadcaster = StatusBroadcaster()
+    job_id = uuid4()
+    expected = StatusChange(job_id=job_id, queue="q", status=JobStatus.COMPLETED)
+
+    with broadcaster.subscribe(job_id=job_id, statuses=_TERMINAL) as change:
+        broadcaster.publish(change=expected)
+        actual = await asyncio.wait_for(change, timeout=1)
+
+    assert (actual, broadcaster.waiter_count) == (expected, 0), (
+        "A change published between subscribing and awaiting must not be "
+        "lost, and leaving the block must unregister the waiter."
+    )
+
+
+async def test_should_buffer_stream_change_when_published_before_await():
+    broadcaster = StatusBroadcaster()
+    job_id = uuid4()
+    expected = StatusChange(job_id=job_id, queue="q", status=JobStatus.RUNNING)
+
+    with broadcaster.subscribe_stream(job_id=job_id) as changes:
+        broadcaster.publish(change=expected)
+        actual = await asyncio.wait_for(changes.get(), timeout=1)
+    broadcaster.publish(change=expected)
+
+    assert (actual, changes.empty()) == (expected, True), (
+        "A stream subscriber must buffer changes published before its first "
+        "read and be unregistered when the block exits."
+    )
@@ -0,0 +1,103 @@
+from datetime import UTC, datetime
+
+from taskflow.models import JobCreateRequest, MisfirePolicy, RecurringJobTemplate
+from taskflow.services.recurring import RecurringScheduler
+
+
+def _at(*args: int) -> datetime:
+    return datetime(*args, tzinfo=UTC)
+
+
+def _template(cron: str, misfire_policy: MisfirePolicy) -> RecurringJobTemplate:
+    return RecurringJobTemplate(
+        schedule=cron,
+        job=JobCreateRequest(name="report", queue="default"),
+        misfire_policy=misfire_policy,
+    )
+
+
+def test_should_return_nothing_when_no_fire_time_reached():
+    scheduler = RecurringScheduler()
+    scheduler.add(
+        template=_template("0 * * * *", MisfirePolicy.SKIP),
+        last_fired_at=_at(2025, 1, 1, 12, 0),
+    )
+
+    actual = scheduler.pop_due(now=_at(2025, 1, 1, 12, 59))
+
+    assert actual == [], "No fire is due before the next scheduled hour."
+
+
+def test_should_materialize_every_missed_fire_when_catch_up():
+    template = _template("0 * * * *", MisfirePolicy.CATCH_UP)
+    scheduler = RecurringScheduler()
+    scheduler.add(template=template, last_fired_at=_at(2025, 1, 1, 12, 0))
+    expected = [_at(2025, 1, 1, 13), _at(2025, 1, 1, 14), _at(2025, 1, 1, 15)]
+
+    actual = [fire.fire_at for fire in scheduler.pop_due(now=_at(2025, 1, 1, 15, 5))]
+
+    assert actual == expected, (
+        "CATCH_UP must materialize one job per fire time missed during downtime."
+    )
+
+
+def test_should_materialize_latest_missed_fire_when_skip():
+    template = _template("0 * * * *", MisfirePolicy.SKIP)
+    scheduler = RecurringScheduler()
+    scheduler.add(template=template, last_fired_at=_at(2025, 1, 1, 12, 0))
+    expected = [_at(2025, 1, 1, 15)]
+
+    actual = [fire.fire_at for fire in scheduler.pop_due(now=_at(2025, 1, 1, 15, 5))]
+
+    assert actual == expected, (
+        "SKIP must coalesce missed fires into a single job for the latest one."
+    )
+
+
+def test_should_reschedule_after_next_fire_when_popped():
+    scheduler = RecurringScheduler()
+    scheduler.add(
+        template=_template("*/5 * * * *", MisfirePolicy.SKIP),
+        last_fired_at=_at(2025, 1, 1, 12, 0),
+    )
+    scheduler.pop_due(now=_at(2025, 1, 1, 12, 5))
+    expected = _at(2025, 1, 1, 12, 10)
+
+    actual = scheduler.next_fire_at()
+
+    assert actual == expected, (
+        "Popping a due fire must re-arm the template for its following slot."
+    )
+
+
+def test_should_order_due_fires_by_time_when_many_templates():
+    scheduler = RecurringScheduler()
+    hourly = _template("0 * * * *", MisfirePolicy.SKIP)
+    quarterly = _template("15 * * * *", MisfirePolicy.SKIP)
+    scheduler.add(template=quarterly, last_fired_at=_at(2025, 1, 1, 12, 0))
+    scheduler.add(template=hourly, last_fired_at=_at(2025, 1, 1, 12, 0))
+    expected = [
+        (quarterly.id, _at(2025, 1, 1, 12, 15)),
+        (hourly.id, _at(2025, 1, 1, 13)),
+    ]
+
+    actual = [
+        (fire.template.id, fire.fire_at)
+        for fire in scheduler.pop_due(now=_at(2025, 1, 1, 13, 0))
+    ]
+
+    assert actual == expected, "Due fires must be returned in fire-time order."
+
+
+def test_should_drop_template_when_removed():
+    template = _template("* * * * *", MisfirePolicy.SKIP)
+    scheduler = RecurringScheduler()
+    scheduler.add(template=template, last_fired_at=_at(2025, 1, 1, 12, 0))
+
+    scheduler.remove(template_id=template.id)
+
+    assert (
+        scheduler.pop_due(now=_at(2025, 1, 2)),
+        scheduler.next_fire_at(),
+        len(scheduler),
+    ) == ([], None, 0), "A removed template must never fire again."
@@ -0,0 +1,71 @@
+from uuid import uuid4
+
+import pytest
+
+from taskflow.services.result_store import FilesystemResultStore, ResultTooLargeError
+
+
+def test_should_store_inline_when_result_is_small(tmp_path):
+    store = FilesystemResultStore(root=tmp_path, inline_limit=16)
+    job_id = uuid4()
+
+    actual = store.save(job_id=job_id, chunks=[b"hello", b" world"])
+
+    assert (actual.inline, actual.size_bytes, list(tmp_path.iterdir())) == (
+        b"hello world",
+        11,
+        [],
+    ), "Results within the inline limit must be kept inline without a blob."
+
+
+def test_should_stream_blob_in_chunks_when_result_is_large(tmp_path):
+    store = FilesystemResultStore(root=tmp_path, inline_limit=4, chunk_size=3)
+    body = [b"abcd", b"efgh", b"ij"]
+    result = store.save(job_id=uuid4(), chunks=body)
+    expected = [b"abc", b"def", b"ghi", b"j"]
+
+    actual = list(store.iter_chunks(result=result))
+
+    assert (result.inline, result.size_bytes, actual) == (None, 10, expected), (
+        "Large results must be stored as blobs and streamed back in chunk_size pieces."
+    )
+
+
+def test_should_reject_result_when_over_max_size(tmp_path):
+    store = FilesystemResultStore(root=tmp_path, inline_limit=2, max_size=8)
+
+    with pytest.raises(ResultTooLargeError):
+        store.save(job_id=uuid4(), chunks=[b"12345", b"67890"])
+
+    assert list(tmp_path.iterdir()) == [], (
+        "A rejected result must not leave a partial blob behind."
+    )
+
+
+def test_should_remove_blob_when_deleted(tmp_path):
+    store = FilesystemResultStore(root=tmp_path, inline_limit=1)
+    job_id = uuid4()
+    store.save(job_id=job_id, chunks=[b"payload"])
+
+    store.delete(job_id=job_id)
+
+    assert list(tmp_path.iterdir()) == [], "Deleting a result must remove its blob."
+
+
+def test_should_reject_result_when_inline_but_over_max_size(tmp_path):
+    store = FilesystemResultStore(root=tmp_path, inline_limit=64, max_size=8)
+
+    with pytest.raises(ResultTooLargeError):
+        store.save(job_id=uuid4(), chunks=[b"12345", b"67890"])
+
+
+def test_should_remove_old_blob_when_result_resaved_inline(tmp_path):
+    store = FilesystemResultStore(root=tmp_path, inline_limit=4)
+    job_id = uuid4()
+    store.save(job_id=job_id, chunks=[b"large payload"])
+
+    actual = store.save(job_id=job_id, chunks=[b"ok"])
+
+    assert (actual.inline, list(tmp_path.iterdir())) == (b"ok", []), (
+        "An inline result must replace, not sit beside, an earlier blob."
+    )
@@ -0,0 +1,205 @@
+import random
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+
+from taskflow.models import Job
+from taskflow.services.scheduling import (
+    CriticalPathIndex,
+    RuntimeEstimates,
+    select_next_jobs,
+    sort_jobs_by_priority,
+)
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _job(name, *, priority=5, age=0, job_id=None):
+    return Job(
+        id=job_id or uuid4(),
+        name=name,
+        queue="default",
+        priority=priority,
+        created_at=NOW - timedelta(seconds=age),
+    )
+
+
+def test_should_sort_by_priority_desc_when_different_priorities():
+    jobs = [_job("low", priority=1), _job("high", priority=9)]
+
+    actual = [job.name for job in sort_jobs_by_priority(jobs=jobs)]
+
+    assert actual == ["high", "low"], "Higher priority must run first."
+
+
+def test_should_sort_by_created_at_asc_when_same_priority():
+    jobs = [_job("new", age=0), _job("old", age=10)]
+
+    actual = [job.name for job in sort_jobs_by_priority(jobs=jobs)]
+
+    assert actual == ["old", "new"], "Older jobs must run first at equal priority."
+
+
+def test_should_sort_by_id_asc_when_same_priority_and_time():
+    jobs = [_job("b", job_id=UUID(int=2)), _job("a", job_id=UUID(int=1))]
+
+    actual = [job.name for job in sort_jobs_by_priority(jobs=jobs)]
+
+    assert actual == ["a", "b"], "Ties must be broken by id for determinism."
+
+
+def test_should_select_available_slots_when_below_max():
+    jobs = [_job(f"job-{index}", priority=index + 1) for index in range(5)]
+
+    actual = select_next_jobs(ready_jobs=jobs, running_count=2, max_concurrent=4)
+
+    assert [job.name for job in actual] == ["job-4", "job-3"], (
+        "Only the free slots must be filled, with the best-ranked jobs."
+    )
+
+
+def test_should_select_none_when_at_max_concurrent():
+    actual = select_next_jobs(ready_jobs=[_job("a")], running_count=4, max_concurrent=4)
+
+    assert actual == [], "No jobs may start when every slot is taken."
+
+
+def test_should_prefer_longest_path_when_critical_path_enabled():
+    leaf, head = _job("leaf", age=10), _job("head")
+    index = CriticalPathIndex()
+    index.add(job_id=leaf.id, queue="default", dependencies=[])
+    index.add(job_id=head.id, queue="default", dependencies=[])
+    previous = head.id
+    for _ in range(3):
+        job_id = uuid4()
+        index.add(job_id=job_id, queue="default", dependencies=[previous])
+        previous = job_id
+
+    actual = [
+        job.name
+        for job in sort_jobs_by_priority(jobs=[leaf, head], critical_path=index)
+    ]
+
+    assert actual == ["head", "leaf"], (
+        "Within a priority level the head of the longest chain must run first."
+    )
+
+
+def test_should_keep_priority_first_when_critical_path_enabled():
+    urgent, head = _job("urgent", priority=9), _job("head")
+    index = CriticalPathIndex()
+    index.add(job_id=head.id, queue="default", dependencies=[])
+    index.add(job_id=uuid4(), queue="default", dependencies=[head.id])
+
+    actual = [
+        job.name
+        for job in sort_jobs_by_priority(jobs=[head, urgent], critical_path=index)
+    ]
+
+    assert actual == ["urgent", "head"], "Path length only breaks priority ties."
+
+
+def test_should_lengthen_ancestors_when_dependent_added():
+    a, b, c = uuid4(), uuid4(), uuid4()
+    index = CriticalPathIndex()
+    index.add(job_id=a, queue="default", dependencies=[])
+    index.add(job_id=b, queue="default", dependencies=[a])
+    index.add(job_id=c, queue="default", dependencies=[b])
+
+    actual = [index.remaining(job_id=job_id) for job_id in (a, b, c)]
+
+    assert actual == [3.0, 2.0, 1.0], "Each job's path must count its dependents."
+
+
+def test_should_account_for_dependents_when_added_out_of_order():
+    a, b = uuid4(), uuid4()
+    index = CriticalPathIndex()
+    index.add(job_id=b, queue="default", dependencies=[a])
+    index.add(job_id=a, queue="default", dependencies=[])
+
+    actual = index.remaining(job_id=a)
+
+    assert actual == 2.0, "Dependents indexed first must count once the job arrives."
+
+
+def test_should_shorten_ancestors_when_dependent_removed():
+    a, short, long_head, long_tail = uuid4(), uuid4(), uuid4(), uuid4()
+    index = CriticalPathIndex()
+    index.add(job_id=a, queue="default", dependencies=[])
+    index.add(job_id=short, queue="default", dependencies=[a])
+    index.add(job_id=long_head, queue="default", dependencies=[a])
+    index.add(job_id=long_tail, queue="default", dependencies=[long_head])
+
+    index.remove(job_id=long_tail)
+    index.remove(job_id=long_head)
+
+    assert (index.remaining(job_id=a), len(index)) == (2.0, 2), (
+        "Removing the longest branch must fall back to the next longest."
+    )
+
+
+def test_should_weight_paths_by_queue_runtime_when_estimates_observed():
+    estimates = RuntimeEstimates()
+    estimates.observe(queue="slow", seconds=30)
+    a, b = uuid4(), uuid4()
+    index = CriticalPathIndex(estimates=estimates)
+    index.add(job_id=a, queue="default", dependencies=[])
+    index.add(job_id=b, queue="slow", dependencies=[a])
+
+    actual = index.remaining(job_id=a)
+
+    assert actual == 31.0, "Path length must sum estimated run times per queue."
+
+
+def test_should_match_incremental_adds_when_batch_added():
+    rng = random.Random(0)  # noqa: S311
+    ids = [uuid4() for _ in range(200)]
+    dependencies = {
+        job_id: rng.sample(ids[:position], min(position, 3))
+        for position, job_id in enumerate(ids)
+    }
+    # Earlier ancestors plus one dependent indexed before its dependencies.
+    indexed = [*ids[:50], ids[150]]
+    batch = [job_id for job_id in ids if job_id not in indexed]
+    incremental, batched = CriticalPathIndex(), CriticalPathIndex()
+    for index in (incremental, batched):
+        for job_id in indexed:
+            index.add(job_id=job_id, queue="default", dependencies=dependencies[job_id])
+    for job_id in batch:
+        incremental.add(
+            job_id=job_id, queue="default", dependencies=dependencies[job_id]
+        )
+
+    batched.add_many(
+        jobs=[
+            Job(
+                id=job_id,
+                name="job",
+                queue="default",
+                dependencies=dependencies[job_id],
+            )
+            for job_id in reversed(batch)
+        ]
+    )
+    actual = [batched.remaining(job_id=job_id) for job_id in ids]
+
+    assert actual == [incremental.remaining(job_id=job_id) for job_id in ids], (
+        "A batch must give every job the same path length as adding its jobs "
+        "one by one, including paths through jobs indexed earlier."
+    )
+
+
+def test_should_index_nothing_when_batch_has_cycle():
+    a, b = uuid4(), uuid4()
+    index = CriticalPathIndex()
+
+    with pytest.raises(ValueError, match="cycle"):
+        index.add_many(
+            jobs=[
+                Job(id=a, name="a", queue="default", dependencies=[b]),
+                Job(id=b, name="b", queue="default", dependencies=[a]),
+            ]
+        )
+
+    assert len(index) == 0, "A rejected batch must leave the index unchanged."
@@ -0,0 +1,141 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from taskflow.models import JobStatus, WorkflowCreateRequest
+from taskflow.services.scheduling import CriticalPathIndex
+from taskflow.services.workflow import WorkflowCycleError, plan_workflow
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _workflow(*jobs):
+    return WorkflowCreateRequest.model_validate(
+        {
+            "jobs": [
+                {"name": key, "queue": "default", "key": key, **fields}
+                for key, fields in jobs
+            ]
+        }
+    )
+
+
+def test_should_order_dependencies_first_when_listed_in_reverse():
+    request = _workflow(
+        ("deploy", {"depends_on": ["test"]}),
+        ("test", {"depends_on": ["build"]}),
+        ("build", {}),
+    )
+
+    plan = plan_workflow(request=request, dependency_statuses={}, now=NOW)
+
+    actual = [job.name for job in plan.jobs]
+    assert actual == ["build", "test", "deploy"], (
+        "Every job must be inserted after the workflow jobs it depends on."
+    )
+
+
+def test_should_link_assigned_ids_when_planned():
+    request = _workflow(("build", {}), ("test", {"depends_on": ["build"]}))
+
+    plan = plan_workflow(request=request, dependency_statuses={}, now=NOW)
+
+    actual = plan.jobs[1].dependencies
+    assert actual == [plan.ids["build"]], (
+        "depends_on keys must be replaced by the ids assigned to those jobs."
+    )
+
+
+def test_should_reject_workflow_when_cycle_present():
+    request = _workflow(
+        ("a", {"depends_on": ["c"]}),
+        ("b", {"depends_on": ["a"]}),
+        ("c", {"depends_on": ["b"]}),
+        ("root", {}),
+    )
+
+    with pytest.raises(WorkflowCycleError) as exc_info:
+        plan_workflow(request=request, dependency_statuses={}, now=NOW)
+
+    assert exc_info.value.keys == ["a", "b", "c"], (
+        "Jobs that cannot be ordered must be reported as the cycle."
+    )
+
+
+def test_should_compute_initial_statuses_when_external_dependencies_mixed():
+    completed, failed = uuid4(), uuid4()
+    request = _workflow(
+        ("ready", {"dependencies": [str(completed)]}),
+        ("waiting", {"depends_on": ["ready"]}),
+        ("blocked", {"dependencies": [str(failed)]}),
+        ("blocked_downstream", {"depends_on": ["blocked"]}),
+    )
+
+    plan = plan_workflow(
+        request=request,
+        dependency_statuses={completed: JobStatus.COMPLETED, failed: JobStatus.FAILED},
+        now=NOW,
+    )
+
+    actual = {job.name: job.status for job in plan.jobs}
+    assert actual == {
+        "ready": JobStatus.READY,
+        "waiting": JobStatus.PENDING,
+        "blocked": JobStatus.BLOCKED,
+        "blocked_downstream": JobStatus.BLOCKED,
+    }, "Statuses must follow SRS §2.1.2, cascading BLOCKED within the workflow."
+
+
+def test_should_report_missing_dependencies_when_external_job_unknown():
+    unknown = uuid4()
+    request = _workflow(("build", {"dependencies": [str(unknown)]}))
+
+    plan = plan_workflow(request=request, dependency_statuses={}, now=NOW)
+
+    assert plan.missing == [unknown], "Unknown external dependencies must be listed."
+
+
+def test_should_reject_request_when_depends_on_unknown_key():
+    with pytest.raises(ValueError, match="unknown keys: missing"):
+        _workflow(("build", {"depends_on": ["missing"]}))
+
+
+def test_should_reject_request_when_keys_repeated():
+    with pytest.raises(ValueError, match="duplicate job keys: build"):
+        _workflow(("build", {}), ("build", {}))
+
+
+def test_should_reject_request_when_depends_on_repeats_key():
+    with pytest.raises(ValueError, match="repeats depends_on keys: build"):
+        _workflow(("build", {}), ("test", {"depends_on": ["build", "build"]}))
+
+
+def test_should_reject_request_when_dependencies_repeat_id():
+    existing = uuid4()
+
+    with pytest.raises(ValueError, match=f"repeats dependencies: {existing}"):
+        _workflow(("build", {"dependencies": [str(existing), str(existing)]}))
+
+
+def test_should_reject_request_when_job_sets_idempotency_key():
+    with pytest.raises(ValueError, match="idempotency_key"):
+        _workflow(("build", {"idempotency_key": "build-1"}))
+
+
+def test_should_index_critical_paths_when_plan_added_as_batch():
+    request = _workflow(
+        ("deploy", {"depends_on": ["test", "lint"]}),
+        ("test", {"depends_on": ["build"]}),
+        ("lint", {}),
+        ("build", {}),
+    )
+    plan = plan_workflow(request=request, dependency_statuses={}, now=NOW)
+    index = CriticalPathIndex()
+
+    index.add_many(jobs=plan.jobs)
+    actual = {key: index.remaining(job_id=job_id) for key, job_id in plan.ids.items()}
+
+    assert actual == {"build": 3.0, "test": 2.0, "lint": 2.0, "deploy": 1.0}, (
+        "Indexing a planned workflow must give each job its downstream depth."
+    )
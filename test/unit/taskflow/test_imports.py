@@ -0,0 +1,54 @@
+import pytest
+
+from taskflow import models
+
+WORKER_MODULES = [
+    "taskflow.models",
+    "taskflow.db.mappers",
+    "taskflow.metrics",
+    "taskflow.services.dependency",
+    "taskflow.services.group_commit",
+    "taskflow.services.idempotency",
+    "taskflow.services.notifications",
+    "taskflow.services.recurring",
+    "taskflow.services.result_store",
+    "taskflow.services.scheduling",
+    "taskflow.services.workflow",
+]
+API_STACK = ["alembic", "boto3", "fastapi", "starlette", "uvicorn"]
+
+
+@pytest.mark.parametrize("module", WORKER_MODULES)
+def test_should_not_import_api_stack_when_worker_module_imported(
+    import_profile, module
+):
+    profile = import_profile(module)
+
+    actual = [package for package in API_STACK if profile.loaded(package)]
+
+    assert actual == [], (
+        f"{module} is used by worker and scheduler processes and must not "
+        f"import {actual}; cold-start time drives autoscaling latency."
+    )
+
+
+def test_should_not_import_pydantic_when_enums_imported(import_profile):
+    profile = import_profile("taskflow.models.enums")
+
+    actual = profile.loaded("pydantic")
+
+    assert actual is False, (
+        "taskflow.models resolves names lazily; importing the enums must not "
+        "load every model and pydantic with them."
+    )
+
+
+def test_should_resolve_exports_when_accessed_lazily():
+    actual = [name for name in models.__all__ if getattr(models, name, None) is None]
+
+    assert actual == [], f"Every name in __all__ must resolve; missing {actual}."
+
+
+def test_should_raise_attribute_error_when_export_unknown():
+    with pytest.raises(AttributeError):
+        _ = models.DoesNotExist
@@ -0,0 +1,124 @@
+import pytest
+
+from taskflow.metrics import REGISTRY, Counter, Gauge, Histogram, MetricsRegistry
+
+
+def test_should_render_cumulative_buckets_when_histogram_observed():
+    histogram = Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+    expected = "\n".join(
+        [
+            "# HELP latency_seconds Latency.",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{le="0.1"} 2',
+            'latency_seconds_bucket{le="1.0"} 3',
+            'latency_seconds_bucket{le="+Inf"} 4',
+            "latency_seconds_sum 2.65",
+            "latency_seconds_count 4",
+        ]
+    )
+
+    actual = histogram.render()
+
+    assert actual == expected, (
+        "Histogram buckets must be cumulative with inclusive upper bounds."
+    )
+
+
+def test_should_render_one_series_per_label_set_when_labelled():
+    counter = Counter("requests", "Requests.", labels=("route",))
+    counter.labels("/a").inc()
+    counter.labels("/a").inc()
+    counter.labels("/b").inc(3)
+    expected = [
+        "# HELP requests_total Requests.",
+        "# TYPE requests_total counter",
+        'requests_total{route="/a"} 2.0',
+        'requests_total{route="/b"} 3.0',
+    ]
+
+    actual = counter.render().splitlines()
+
+    assert actual == expected, (
+        "Each label combination must be its own series, under HELP and TYPE "
+        "lines named like the _total samples."
+    )
+
+
+def test_should_escape_label_values_when_rendered():
+    gauge = Gauge("depth", "Depth.", labels=("queue",))
+    gauge.labels('we"ird').set(1)
+
+    actual = gauge.render().splitlines()[-1]
+
+    assert actual == r'depth{queue="we\"ird"} 1', (
+        "Quotes in label values must be escaped to keep the format parseable."
+    )
+
+
+def test_should_reject_labels_when_count_mismatches():
+    histogram = Histogram("h", "H.", labels=("method", "route"))
+
+    with pytest.raises(ValueError, match="expects labels"):
+        histogram.labels("GET")
+
+
+def test_should_reject_registration_when_name_taken():
+    registry = MetricsRegistry()
+    registry.register(Gauge("depth", "Depth."))
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register(Gauge("depth", "Depth."))
+
+
+def test_should_observe_elapsed_time_when_timed():
+    histogram = Histogram("t", "T.")
+
+    with histogram.time():
+        pass
+
+    assert histogram.labels().count == 1, (
+        "Timing a block must record exactly one observation."
+    )
+
+
+def test_should_raise_value_error_when_labelled_metric_used_without_labels():
+    counter = Counter("requests", "Requests.", labels=("route",))
+
+    with pytest.raises(ValueError, match=r"use \.labels\(\)"):
+        counter.inc()
+
+
+def test_should_not_create_child_when_looked_up_with_get():
+    gauge = Gauge("depth", "Depth.", labels=("queue",))
+    gauge.labels("builds").set(3)
+
+    actual = (gauge.get("builds").value, gauge.get("other"))
+
+    assert (actual, len(gauge.render().splitlines())) == ((3, None), 3), (
+        "get must read existing children and never add a series."
+    )
+
+
+def test_should_drop_label_sets_when_cleared():
+    gauge = Gauge("depth", "Depth.", labels=("queue",))
+    gauge.labels("builds").set(3)
+
+    gauge.clear()
+
+    assert gauge.render().splitlines()[2:] == [], (
+        "Clearing must remove every series so a fresh snapshot can be set."
+    )
+
+
+def test_should_suffix_counter_samples_once_when_registry_rendered():
+    rendered = REGISTRY.render().splitlines()
+
+    actual = [line for line in rendered if "admission_rejections" in line][:2]
+
+    assert actual == [
+        "# HELP taskflow_admission_rejections_total "
+        "Requests rejected with 429 by admission control.",
+        "# TYPE taskflow_admission_rejections_total counter",
+    ], "Registered counters must be named without _total, which render adds."
@@ -0,0 +1,90 @@
+import time
+
+from taskflow.config import Settings
+from taskflow.profiling import Profiler
+
+
+def _busy(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def test_should_skip_sampling_when_disabled():
+    profiler = Profiler(settings=Settings(profiling_enabled=False))
+
+    with profiler.profile(label="tick") as session:
+        _busy(0.01)
+
+    assert (session, profiler.collapsed()) == (None, ""), (
+        "A disabled profiler must never start a sampler or record stacks."
+    )
+
+
+def test_should_skip_sampling_when_not_selected():
+    profiler = Profiler(
+        settings=Settings(profiling_enabled=True, profiling_sample_rate=0)
+    )
+
+    with profiler.profile(label="tick") as session:
+        pass
+
+    assert session is None, "A zero sample rate must select no work units."
+
+
+def test_should_record_collapsed_stacks_when_sampled():
+    profiler = Profiler(
+        settings=Settings(
+            profiling_enabled=True,
+            profiling_sample_rate=1,
+            profiling_interval_seconds=0.001,
+        )
+    )
+
+    with profiler.profile(label="tick") as session:
+        assert session is not None
+        session.label = "scheduler.tick"
+        _busy(0.05)
+    lines = profiler.collapsed().splitlines()
+
+    assert lines and all(line.startswith("scheduler.tick;") for line in lines), (
+        "Samples must be aggregated under the session's final label."
+    )
+    assert any("_busy" in line for line in lines), (
+        "Collapsed stacks must include the frames that were running."
+    )
+
+
+def test_should_clear_samples_when_reset():
+    profiler = Profiler(
+        settings=Settings(
+            profiling_enabled=True,
+            profiling_sample_rate=1,
+            profiling_interval_seconds=0.001,
+        )
+    )
+    with profiler.profile(label="tick"):
+        _busy(0.02)
+
+    profiler.reset()
+
+    assert profiler.collapsed() == "", "Reset must discard aggregated samples."
+
+
+def test_should_exclude_caller_frames_when_sampled():
+    profiler = Profiler(
+        settings=Settings(
+            profiling_enabled=True,
+            profiling_sample_rate=1,
+            profiling_interval_seconds=0.001,
+        )
+    )
+
+    with profiler.profile(label="tick"):
+        _busy(0.05)
+    stacks = [line.rsplit(" ", 1)[0] for line in profiler.collapsed().splitlines()]
+    roots = {stack.split(";")[1] for stack in stacks}
+
+    assert roots == {"_busy (test_profiling.py)"}, (
+        "Stacks must start at the frames called from the profiled block."
+    )